@@ -1,6 +1,7 @@
 import logging
 import os
 import socket
+import threading
 import uuid
 import ansible_runner
 from datetime import datetime
@@ -9,6 +10,72 @@ from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# isi_mcp/Templates — the playbook templates shipped with the server
+DEFAULT_TEMPLATES_DIR = Path(__file__).resolve().parent.parent.parent / "Templates"
+
+
+# Jinja2 environments keyed by templates directory. An Environment caches the
+# templates it has compiled, so sharing one across AnsibleRunner instances means
+# each playbook template is parsed once per process instead of once per call.
+_jinja_envs = {}
+_jinja_envs_lock = threading.Lock()
+
+
+def _get_jinja_env(templates_dir: Path) -> Environment:
+    """Return the shared Jinja2 environment for templates_dir, creating it once."""
+    key = str(templates_dir)
+    env = _jinja_envs.get(key)
+    if env is None:
+        with _jinja_envs_lock:
+            env = _jinja_envs.get(key)
+            if env is None:
+                env = Environment(
+                    loader=FileSystemLoader(key),
+                    keep_trailing_newline=True,
+                    cache_size=-1,  # never evict a compiled template
+                )
+                _jinja_envs[key] = env
+    return env
+
+
+def precompile_templates(templates_dir: Path = DEFAULT_TEMPLATES_DIR) -> int:
+    """Compile every .j2 template in templates_dir into the shared environment.
+
+    Called once at server startup so the first create/remove call of each kind
+    only renders its template instead of also parsing and compiling it.
+    Templates that fail to compile are logged and skipped; the error will
+    surface again when a tool actually uses them. Returns the number compiled.
+    """
+    env = _get_jinja_env(templates_dir)
+    compiled = 0
+    for name in env.list_templates(extensions=["j2"]):
+        try:
+            env.get_template(name)
+            compiled += 1
+        except Exception as e:
+            logger.warning("Could not precompile template %s: %s", name, e)
+    return compiled
+
+
+# At most ANSIBLE_MAX_CONCURRENT ansible-playbook processes run at once. Each
+# run is a fresh interpreter importing all of Ansible, so a burst of create or
+# remove calls would otherwise fork that many processes in parallel and stall
+# all of them on CPU; extra calls wait for a free slot instead.
+_playbook_slots = threading.BoundedSemaphore(
+    max(1, int(os.environ.get("ANSIBLE_MAX_CONCURRENT", 4))))
+
+# How long a call waits for a slot before failing as busy. Kept well under the
+# server's TOOL_TIMEOUT: once the client has been told a call timed out, a
+# queued create or remove must not run later behind its back (a retry would
+# then apply it twice).
+ANSIBLE_SLOT_TIMEOUT = float(os.environ.get(
+    "ANSIBLE_SLOT_TIMEOUT", int(os.environ.get("TOOL_TIMEOUT", 60)) / 4))
+
+
+def iac_mode_enabled() -> bool:
+    """Return True when IAC_MODE asks for playbooks to be rendered but not run."""
+    return os.environ.get("IAC_MODE", "").strip().lower() in ("1", "true", "yes")
+
 
 class AnsibleRunner:
     """
@@ -30,7 +97,7 @@ class AnsibleRunner:
 
         # Resolve paths relative to the isi_mcp package root
         base_dir = Path(__file__).resolve().parent.parent.parent  # isi_mcp/
-        self.templates_dir = Path(templates_dir) if templates_dir else base_dir / "Templates"
+        self.templates_dir = Path(templates_dir) if templates_dir else DEFAULT_TEMPLATES_DIR
         # Explicit arg > PLAYBOOKS_DIR env var > default relative path
         env_playbooks_dir = os.environ.get("PLAYBOOKS_DIR")
         self.playbooks_dir = (
@@ -42,11 +109,8 @@ class AnsibleRunner:
         # Ensure playbooks output directory exists
         self.playbooks_dir.mkdir(parents=True, exist_ok=True)
 
-        # Build Jinja2 environment pointing at Templates/
-        self.jinja_env = Environment(
-            loader=FileSystemLoader(str(self.templates_dir)),
-            keep_trailing_newline=True,
-        )
+        # Jinja2 environment pointing at Templates/, shared between runners
+        self.jinja_env = _get_jinja_env(self.templates_dir)
 
     def _get_connection_vars(self) -> dict:
         """Extract PowerScale connection parameters from the Cluster instance.
@@ -142,13 +206,38 @@ class AnsibleRunner:
             "ANSIBLE_COLLECTIONS_PATHS": f"{os.path.expanduser('~')}/.ansible/collections:/usr/share/ansible/collections",
         }
 
-        runner = ansible_runner.run(
-            private_data_dir=str(self.playbooks_dir),
-            playbook=str(playbook_path.name),
-            quiet=not self.debug,
-            extravars=extravars,
-            envvars=env_vars,
-        )
+        # Collect structured task results as events are emitted, rather than
+        # re-reading every job event file back from the artifacts directory
+        # through runner.events after the run
+        task_results = {}
+
+        def _collect_task_result(event):
+            if event.get("event") == "runner_on_ok":
+                task_name = event.get("event_data", {}).get("task", "")
+                res = event.get("event_data", {}).get("res", {})
+                if task_name and res:
+                    task_results[task_name] = res
+            return True  # keep the event on disk for the audit trail
+
+        if not _playbook_slots.acquire(timeout=ANSIBLE_SLOT_TIMEOUT):
+            return {
+                "success": False,
+                "status": "busy",
+                "error": (f"All playbook slots stayed busy for {ANSIBLE_SLOT_TIMEOUT:g}s; "
+                          "nothing was changed. Retry shortly."),
+                "playbook_path": str(playbook_path),
+            }
+        try:
+            runner = ansible_runner.run(
+                private_data_dir=str(self.playbooks_dir),
+                playbook=str(playbook_path.name),
+                quiet=not self.debug,
+                extravars=extravars,
+                envvars=env_vars,
+                event_handler=_collect_task_result,
+            )
+        finally:
+            _playbook_slots.release()
 
         result = {
             "success": runner.status == "successful",
@@ -165,14 +254,6 @@ class AnsibleRunner:
         if not result["success"] and runner.stderr:
             result["stderr"] = runner.stderr.read() if hasattr(runner.stderr, "read") else str(runner.stderr)
 
-        # Extract structured task results from runner events
-        task_results = {}
-        for event in runner.events:
-            if event.get("event") == "runner_on_ok":
-                task_name = event.get("event_data", {}).get("task", "")
-                res = event.get("event_data", {}).get("res", {})
-                if task_name and res:
-                    task_results[task_name] = res
         result["task_results"] = task_results
 
         if self.debug:
@@ -201,8 +282,7 @@ class AnsibleRunner:
         """
         playbook_path = self.render_playbook(template_name, variables)
 
-        iac_mode_raw = os.environ.get("IAC_MODE", "").strip().lower()
-        if iac_mode_raw in ("1", "true", "yes"):
+        if iac_mode_enabled():
             return {
                 "success": True,
                 "iac_mode": True,
@@ -1,4 +1,3 @@
-import json
 import logging
 import logging.handlers
 import os
@@ -6,6 +5,8 @@ import time
 import uuid
 from datetime import datetime, timezone
 
+from modules.json_utils import dumps as _dumps
+
 # Custom UUID namespace for audit event UUIDs (fixed, project-specific)
 _AUDIT_NAMESPACE = uuid.UUID("a1b2c3d4-e5f6-7890-abcd-ef1234567890")
 
@@ -72,7 +73,7 @@ class AuditLogger:
     ) -> None:
         ts = time.time()
 
-        output_str = json.dumps(output, default=str)
+        output_str = _dumps(output)
         if len(output_str) > _MAX_OUTPUT_CHARS:
             output_str = output_str[:_MAX_OUTPUT_CHARS] + "...[truncated]"
 
@@ -87,4 +88,4 @@ class AuditLogger:
             "output":    output_str,
             "error":     error,
         }
-        self._logger.info(json.dumps(entry, default=str))
+        self._logger.info(_dumps(entry))
@@ -0,0 +1,24 @@
+"""JSON encoding and decoding, using orjson when it is installed."""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+HAVE_ORJSON = orjson is not None
+
+# Decode a JSON str or bytes document. orjson's decode error subclasses
+# ValueError, like json.JSONDecodeError.
+loads = orjson.loads if HAVE_ORJSON else json.loads
+
+
+def dumps(obj) -> str:
+    """Serialise obj to a JSON string; values JSON cannot represent go through str()."""
+    if HAVE_ORJSON:
+        try:
+            return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            pass  # e.g. integers wider than 64 bits — let json handle them
+    return json.dumps(obj, default=str)
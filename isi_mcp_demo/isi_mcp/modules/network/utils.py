@@ -1,5 +1,6 @@
 import logging
 import socket
+from concurrent.futures import ThreadPoolExecutor
 
 logger = logging.getLogger(__name__)
 
@@ -24,3 +25,29 @@ def pingable(host: str, debug=False, timeout=1, port=8080) -> bool:
     except (OSError, socket.timeout) as err:
         logger.debug("TCP connect %s:%d failed: %s", host, port, err)
         return False
+
+
+def all_pingable(hosts, debug=False, timeout=1, port=8080) -> bool:
+    """
+    Return True if every host in hosts passes pingable().
+
+    The TCP probes (including any DNS lookup) run concurrently, so checking N
+    nodes costs roughly one timeout rather than N of them.
+
+    Args:
+        hosts: Iterable of IP addresses or hostnames to check
+        debug: Print debug messages if True
+        timeout: Timeout in seconds for each connection attempt (default: 1)
+        port: TCP port to connect to (default: 8080, the PowerScale API port)
+    """
+    hosts = list(hosts)
+    if not hosts:
+        return True
+    with ThreadPoolExecutor(max_workers=min(32, len(hosts)),
+                            thread_name_prefix="pingable") as ex:
+        results = ex.map(lambda h: pingable(h, debug=debug, timeout=timeout, port=port), hosts)
+        for host, ok in zip(hosts, results):
+            if not ok:
+                logger.debug("Node %s failed ping", host)
+                return False
+    return True
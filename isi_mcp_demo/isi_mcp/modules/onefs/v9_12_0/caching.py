@@ -0,0 +1,110 @@
+"""Read caching and request coalescing shared by the cluster modules and the tool layer."""
+
+import copy
+import threading
+import time
+from concurrent.futures import Future
+
+
+class _Call:
+    """One running call: its Future and how many callers are waiting on it."""
+
+    __slots__ = ("future", "waiters")
+
+    def __init__(self):
+        self.future = Future()
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Share one call between identical concurrent callers.
+
+    While fn is running for a key, further callers with the same key wait for
+    its result instead of calling fn themselves. The first caller keeps the
+    original result; a snapshot is only taken when someone actually waited,
+    and each waiter gets its own copy of it. An exception reaches every waiter.
+
+    With copy_results=False every caller gets the same object, for results
+    that are shared handles (e.g. a Cluster) rather than data.
+    """
+
+    def __init__(self, copy_results: bool = True):
+        self.copy_results = copy_results
+        self._calls = {}  # key -> _Call
+        self._lock = threading.Lock()
+
+    def do(self, key, fn, *args, **kwargs):
+        """Return fn(*args, **kwargs), or wait for the call already running for key."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                call.waiters += 1
+        if not leader:
+            result = call.future.result()
+            return copy.deepcopy(result) if self.copy_results else result
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as e:
+            self._finish(key)
+            call.future.set_exception(e)
+            raise
+        if self._finish(key):
+            call.future.set_result(copy.deepcopy(result) if self.copy_results else result)
+        return result
+
+    def _finish(self, key):
+        """Stop new callers joining key's call; return how many already joined."""
+        with self._lock:
+            return self._calls.pop(key).waiters
+
+
+class TTLCache:
+    """Thread-safe map of results that expire ttl seconds after they are put.
+
+    Values are deep-copied on the way in and out, so a caller can change what
+    it gets back without touching the cached entry. With max_entries, the
+    oldest entry is evicted to make room for a new key. A ttl of 0 disables
+    the cache.
+    """
+
+    def __init__(self, ttl: float, max_entries: int = None):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries = {}  # key -> (value, expires)
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Return a copy of the live entry for key, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[1] <= time.monotonic():
+                del self._entries[key]
+                return None
+            return copy.deepcopy(entry[0])
+
+    def put(self, key, value, ttl: float = None):
+        """Cache a copy of value under key for ttl seconds (default: the cache's ttl)."""
+        ttl = self.ttl if ttl is None else ttl
+        if ttl <= 0:
+            return
+        with self._lock:
+            if (self.max_entries is not None and key not in self._entries
+                    and len(self._entries) >= self.max_entries):
+                del self._entries[next(iter(self._entries))]
+            self._entries[key] = (copy.deepcopy(value), time.monotonic() + ttl)
+
+    def discard(self, key):
+        """Forget the entry for key, if any."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def drop(self, match):
+        """Forget every entry whose key satisfies match(key)."""
+        with self._lock:
+            for key in [k for k in self._entries if match(k)]:
+                del self._entries[key]
@@ -1,11 +1,198 @@
 import logging
 import os
+import threading
+import time
+from collections import deque
+
 import urllib3
 
 import isilon_sdk.v9_12_0 as isi_sdk
+from isilon_sdk.v9_12_0.rest import ApiException
+from modules.json_utils import HAVE_ORJSON, loads
 
 logger = logging.getLogger(__name__)
 
+# ApiClients shared by every Cluster built from the same connection settings.
+# Each ApiClient owns a urllib3 PoolManager, so reusing it keeps TCP/TLS
+# connections alive across tool calls instead of handshaking on every call.
+_api_clients = {}
+_api_clients_lock = threading.Lock()
+
+
+class _AimdLimiter:
+    """Cap the PAPI calls in flight to one cluster, adapting the cap AIMD-style.
+
+    The cap rises by one after a full cap's worth of calls in a row come back
+    healthy, and halves when the cluster answers 429/503 or when the average
+    latency over the last `window` calls exceeds latency_target seconds. A
+    single slow call (a big listing, a statistics query) does not move it.
+    Agents that fan many tool calls out at once then queue here instead of
+    driving the cluster into rate limiting, for at most queue_timeout seconds.
+    """
+
+    def __init__(self, initial: int, max_limit: int, latency_target: float,
+                 window: int = 20, queue_timeout: float = 10.0):
+        self.limit = float(initial)
+        self.max_limit = max_limit
+        self.latency_target = latency_target
+        self.queue_timeout = queue_timeout
+        self.in_flight = 0
+        self.overloaded = 0  # decreases taken
+        self._healthy = 0
+        self._latencies = deque(maxlen=window)
+        self._cond = threading.Condition()
+
+    def acquire(self):
+        """Take a slot, or raise TimeoutError after queue_timeout seconds."""
+        with self._cond:
+            if not self._cond.wait_for(lambda: self.in_flight < int(self.limit),
+                                       timeout=self.queue_timeout):
+                raise TimeoutError(
+                    f"{self.in_flight} cluster API calls already in flight; "
+                    f"no slot freed up within {self.queue_timeout:g}s")
+            self.in_flight += 1
+
+    def release(self, throttled: bool, latency: float):
+        with self._cond:
+            self.in_flight -= 1
+            self._latencies.append(latency)
+            slow = (len(self._latencies) == self._latencies.maxlen and
+                    sum(self._latencies) / len(self._latencies) > self.latency_target)
+            if throttled or slow:
+                self.limit = max(1.0, self.limit / 2)
+                self.overloaded += 1
+                self._healthy = 0
+                # Judge the new cap on fresh samples only
+                self._latencies.clear()
+            else:
+                self._healthy += 1
+                if self._healthy >= self.limit:
+                    self.limit = min(float(self.max_limit), self.limit + 1)
+                    self._healthy = 0
+            self._cond.notify_all()
+
+    def stats(self) -> dict:
+        with self._cond:
+            return {"limit": int(self.limit), "in_flight": self.in_flight,
+                    "overloaded": self.overloaded}
+
+
+# One limiter per cluster host, shared by every ApiClient that talks to it
+_limiters = {}
+_limiters_lock = threading.Lock()
+
+
+def _get_limiter(host):
+    with _limiters_lock:
+        limiter = _limiters.get(host)
+        if limiter is None:
+            max_limit = int(os.environ.get("API_MAX_CONCURRENCY", 16))
+            limiter = _AimdLimiter(
+                initial=min(8, max_limit),
+                max_limit=max_limit,
+                latency_target=float(os.environ.get("API_LATENCY_TARGET", 5.0)),
+                queue_timeout=float(os.environ.get("API_QUEUE_TIMEOUT", 10.0)),
+            )
+            _limiters[host] = limiter
+        return limiter
+
+
+def api_limiter_stats() -> dict:
+    """Current concurrency cap, calls in flight and overload count per cluster host."""
+    with _limiters_lock:
+        limiters = dict(_limiters)
+    return {host: limiter.stats() for host, limiter in limiters.items()}
+
+
+# Answers from a throttled or overloaded cluster that are worth retrying.
+# They are retried here rather than by urllib3, so the wait between attempts
+# happens with the limiter slot released instead of holding it for the whole
+# Retry-After/backoff sleep.
+_RETRY_STATUSES = frozenset((429, 502, 503, 504))
+# Methods urllib3's Retry treats as safe to repeat
+_IDEMPOTENT_METHODS = frozenset(("GET", "HEAD", "PUT", "DELETE", "OPTIONS", "TRACE"))
+_MAX_RETRY_AFTER = 10.0  # seconds; a longer Retry-After is cut to this
+
+
+def _retry_delay(headers, attempt: int) -> float:
+    """Seconds to wait before retry number attempt+1: Retry-After if given, else backoff."""
+    retry_after = (headers or {}).get("Retry-After", "")
+    if retry_after.strip().isdigit():
+        return min(float(retry_after), _MAX_RETRY_AFTER)
+    return 0.25 * (2 ** attempt)
+
+
+def _build_api_client(cfg):
+    """Create an ApiClient whose calls default to the API_TIMEOUT deadline.
+
+    Every call also passes through the host's _AimdLimiter. Idempotent calls
+    the cluster throttles (see _RETRY_STATUSES) are retried up to API_RETRIES
+    times, each attempt taking its own slot.
+    """
+    api_client = isi_sdk.ApiClient(cfg)
+
+    # Inject a default HTTP timeout on every SDK call so tools never hang
+    # indefinitely waiting for a slow or unresponsive cluster.
+    # Override per-call by passing _request_timeout explicitly (existing calls
+    # that already pass timeout= on statistics endpoints are unaffected because
+    # those use the statistics_api timeout kwarg, not _request_timeout).
+    _api_timeout = int(os.environ.get("API_TIMEOUT", 30))
+    _orig_call_api = api_client.call_api
+    limiter = _get_limiter(cfg.host)
+    retries = int(os.environ.get("API_RETRIES", 3))
+
+    def _call_api_with_timeout(*args, **kwargs):
+        if "_request_timeout" not in kwargs:
+            kwargs["_request_timeout"] = (_api_timeout, _api_timeout)
+        method = str(kwargs.get("method", args[1] if len(args) > 1 else "GET")).upper()
+        for attempt in range(retries + 1):
+            limiter.acquire()
+            start = time.monotonic()
+            throttled = False
+            try:
+                return _orig_call_api(*args, **kwargs)
+            except ApiException as e:
+                throttled = e.status in (429, 503)
+                if (e.status not in _RETRY_STATUSES or attempt == retries
+                        or method not in _IDEMPOTENT_METHODS):
+                    raise
+                delay = _retry_delay(e.headers, attempt)
+            finally:
+                limiter.release(throttled, time.monotonic() - start)
+            time.sleep(delay)
+
+    api_client.call_api = _call_api_with_timeout
+
+    # Parse response bodies with orjson when it is installed. The generated
+    # deserialize() runs json.loads on every body before building the models,
+    # which dominates large listings such as 1000-entry directory pages.
+    _to_models = getattr(api_client, "_ApiClient__deserialize", None)
+    if HAVE_ORJSON and _to_models is not None:
+        _orig_deserialize = api_client.deserialize
+
+        def _deserialize(response, response_type):
+            if response_type == "file":
+                return _orig_deserialize(response, response_type)
+            try:
+                data = loads(response.data)
+            except ValueError:
+                data = response.data
+            return _to_models(data, response_type)
+
+        api_client.deserialize = _deserialize
+
+    # Back off briefly between urllib3's retries of dropped keep-alive
+    # connections. Throttled responses are not retried here but in
+    # _call_api_with_timeout, outside the limiter slot.
+    pool_manager = getattr(api_client.rest_client, "pool_manager", None)
+    if pool_manager is not None:
+        pool_manager.connection_pool_kw["retries"] = urllib3.Retry(
+            total=retries,
+            backoff_factor=0.25,
+        )
+    return api_client
+
+
 class Cluster:
 
     def __init__(
@@ -55,7 +242,17 @@ class Cluster:
         if self.verify_ssl is False:
             urllib3.disable_warnings()
 
-        # Build SDK configuration and API client
+        # Reuse the ApiClient (and its connection pool) for these settings
+        key = (self.url, self.username, self.password, self.verify_ssl)
+        with _api_clients_lock:
+            api_client = _api_clients.get(key)
+            if api_client is None:
+                api_client = _build_api_client(self._build_configuration())
+                _api_clients[key] = api_client
+        self.api_client = api_client
+
+    def _build_configuration(self):
+        """Build the SDK configuration for this cluster's connection settings."""
         cfg = isi_sdk.Configuration()
         if self.url:
             cfg.host = self.url
@@ -72,23 +269,11 @@ class Cluster:
             cfg.assert_hostname = False
         else:
             cfg.verify_ssl = self.verify_ssl
-
-        self.api_client = isi_sdk.ApiClient(cfg)
-
-        # Inject a default HTTP timeout on every SDK call so tools never hang
-        # indefinitely waiting for a slow or unresponsive cluster.
-        # Override per-call by passing _request_timeout explicitly (existing calls
-        # that already pass timeout= on statistics endpoints are unaffected because
-        # those use the statistics_api timeout kwarg, not _request_timeout).
-        _api_timeout = int(os.environ.get("API_TIMEOUT", 30))
-        _orig_call_api = self.api_client.call_api
-
-        def _call_api_with_timeout(*args, **kwargs):
-            if "_request_timeout" not in kwargs:
-                kwargs["_request_timeout"] = (_api_timeout, _api_timeout)
-            return _orig_call_api(*args, **kwargs)
-
-        self.api_client.call_api = _call_api_with_timeout
+        # Pooled keep-alive connections per host. Tool calls run on worker
+        # threads and the fan-out helpers add more, so the SDK default
+        # (5 x CPUs) can overflow and fall back to fresh TLS handshakes.
+        cfg.connection_pool_maxsize = int(os.environ.get("API_POOL_MAXSIZE", 32))
+        return cfg
 
     @classmethod
     def from_vault(cls, debug_env_var: str = "DEBUG"):
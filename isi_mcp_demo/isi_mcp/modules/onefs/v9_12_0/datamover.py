@@ -1,9 +1,28 @@
 import logging
+import os
 import isilon_sdk.v9_12_0 as isi_sdk
 from isilon_sdk.v9_12_0.rest import ApiException
+from modules.onefs.v9_12_0.caching import SingleFlight, TTLCache
 
 logger = logging.getLogger(__name__)
 
+# Policy, account and base policy lookups by id (and base policy list pages),
+# kept for DATAMOVER_CACHE_TTL seconds. Definitions change rarely and LLM
+# clients re-read the same object often, so repeated lookups skip the round
+# trip. Any create or delete of that kind on the cluster drops its entries,
+# since ids may be given by name or by number.
+DATAMOVER_CACHE_TTL = float(os.environ.get("DATAMOVER_CACHE_TTL", 15))
+# "Not found" results are cached too, for a shorter time, so re-reading a
+# mistyped id does not go back to the cluster on every turn. Deletes always
+# go to the cluster.
+DATAMOVER_NEGATIVE_CACHE_TTL = float(os.environ.get("DATAMOVER_NEGATIVE_CACHE_TTL", 5))
+_lookup_cache = TTLCache(DATAMOVER_CACHE_TTL)  # (kind, cluster url, id or page args) -> result dict
+
+
+# Lookups currently running, so concurrent calls for the same key (parallel
+# tool calls, agent retries) share one request instead of each sending their own.
+_lookups = SingleFlight()
+
 
 class DataMover:
     """Manages DataMover policies and operations on a PowerScale cluster."""
@@ -30,7 +49,7 @@ class DataMover:
             result = datamover_api.list_datamover_policies(**kwargs)
         except ApiException as e:
             logger.error("API error: %s", e)
-            return {"items": [], "resume": None}
+            return {"items": [], "resume": None, "error": f"API error: {e}"}
 
         items = [p.to_dict() for p in result.policies] if result.policies else []
 
@@ -48,19 +67,32 @@ class DataMover:
         Returns:
             dict with policy details.
         """
+        key = ("policy", self.cluster.url, policy_id)
+        cached = _lookup_cache.get(key)
+        if cached is not None:
+            return cached
+        return _lookups.do(key, self._fetch_policy, key, policy_id)
+
+    def _fetch_policy(self, key, policy_id):
+        """Look up one policy on the cluster and cache the result under key."""
         datamover_api = isi_sdk.DatamoverApi(self.cluster.api_client)
         try:
             result = datamover_api.get_datamover_policy(policy_id)
             policy_dict = result.policies[0].to_dict() if result.policies else {}
-            return {
+            found = {
                 "success": True,
                 "policy": policy_dict
             }
+            _lookup_cache.put(key, found)
+            return found
         except ApiException as e:
-            return {
+            missing = {
                 "success": False,
                 "error": f"API error: {e}"
             }
+            if e.status == 404:
+                _lookup_cache.put(key, missing, DATAMOVER_NEGATIVE_CACHE_TTL)
+            return missing
 
     def create_policy(self, name: str, base_policy_id: int = None,
                      enabled: bool = None, priority: str = None,
@@ -103,6 +135,7 @@ class DataMover:
             policy = isi_sdk.DatamoverPolicyCreateParams(**policy_params)
 
             result = datamover_api.create_datamover_policy(datamover_policy=policy)
+            _lookup_cache.drop(lambda k: k[:2] == ("policy", self.cluster.url))
 
             return {
                 "success": True,
@@ -124,18 +157,29 @@ class DataMover:
         Returns:
             dict with success status.
         """
+        # Always sent to the cluster; the result only primes the negative
+        # cache so a follow-up get of this id does not go back to the cluster
+        key = ("policy", self.cluster.url, policy_id)
         datamover_api = isi_sdk.DatamoverApi(self.cluster.api_client)
         try:
             datamover_api.delete_datamover_policy(policy_id)
+            _lookup_cache.drop(lambda k: k[:2] == ("policy", self.cluster.url))
+            _lookup_cache.put(key, {
+                "success": False,
+                "error": f"DataMover policy '{policy_id}' not found (already deleted)"
+            }, DATAMOVER_NEGATIVE_CACHE_TTL)
             return {
                 "success": True,
                 "message": f"DataMover policy '{policy_id}' deleted successfully"
             }
         except ApiException as e:
-            return {
+            failed = {
                 "success": False,
                 "error": f"API error: {e}"
             }
+            if e.status == 404:
+                _lookup_cache.put(key, failed, DATAMOVER_NEGATIVE_CACHE_TTL)
+            return failed
 
     def get_policy_last_job(self, policy_id: str) -> dict:
         """Get the last job information for a specific DataMover policy.
@@ -182,7 +226,7 @@ class DataMover:
             result = datamover_api.list_datamover_accounts(**kwargs)
         except ApiException as e:
             logger.error("API error: %s", e)
-            return {"items": [], "resume": None}
+            return {"items": [], "resume": None, "error": f"API error: {e}"}
 
         items = [a.to_dict() for a in result.accounts] if result.accounts else []
 
@@ -200,19 +244,32 @@ class DataMover:
         Returns:
             dict with account details.
         """
+        key = ("account", self.cluster.url, account_id)
+        cached = _lookup_cache.get(key)
+        if cached is not None:
+            return cached
+        return _lookups.do(key, self._fetch_account, key, account_id)
+
+    def _fetch_account(self, key, account_id):
+        """Look up one account on the cluster and cache the result under key."""
         datamover_api = isi_sdk.DatamoverApi(self.cluster.api_client)
         try:
             result = datamover_api.get_datamover_account(account_id)
             account_dict = result.accounts[0].to_dict() if result.accounts else {}
-            return {
+            found = {
                 "success": True,
                 "account": account_dict
             }
+            _lookup_cache.put(key, found)
+            return found
         except ApiException as e:
-            return {
+            missing = {
                 "success": False,
                 "error": f"API error: {e}"
             }
+            if e.status == 404:
+                _lookup_cache.put(key, missing, DATAMOVER_NEGATIVE_CACHE_TTL)
+            return missing
 
     def create_account(self, name: str, account_type: str, uri: str,
                       briefcase: str = None, credentials: dict = None,
@@ -268,6 +325,7 @@ class DataMover:
             account = isi_sdk.DatamoverAccountCreateParams(**account_params)
 
             result = datamover_api.create_datamover_account(datamover_account=account)
+            _lookup_cache.drop(lambda k: k[:2] == ("account", self.cluster.url))
 
             return {
                 "success": True,
@@ -289,18 +347,29 @@ class DataMover:
         Returns:
             dict with success status.
         """
+        # Always sent to the cluster; the result only primes the negative
+        # cache so a follow-up get of this id does not go back to the cluster
+        key = ("account", self.cluster.url, account_id)
         datamover_api = isi_sdk.DatamoverApi(self.cluster.api_client)
         try:
             datamover_api.delete_datamover_account(account_id)
+            _lookup_cache.drop(lambda k: k[:2] == ("account", self.cluster.url))
+            _lookup_cache.put(key, {
+                "success": False,
+                "error": f"DataMover account '{account_id}' not found (already deleted)"
+            }, DATAMOVER_NEGATIVE_CACHE_TTL)
             return {
                 "success": True,
                 "message": f"DataMover account '{account_id}' deleted successfully"
             }
         except ApiException as e:
-            return {
+            failed = {
                 "success": False,
                 "error": f"API error: {e}"
             }
+            if e.status == 404:
+                _lookup_cache.put(key, failed, DATAMOVER_NEGATIVE_CACHE_TTL)
+            return failed
 
     # ========================================================================
     # Base Policy Management Methods
@@ -316,6 +385,11 @@ class DataMover:
         Returns:
             dict with 'items' (list of base policy dicts) and 'resume' token.
         """
+        key = ("base_policy", self.cluster.url, ("page", limit, resume))
+        cached = _lookup_cache.get(key)
+        if cached is not None:
+            return cached
+
         datamover_api = isi_sdk.DatamoverApi(self.cluster.api_client)
         try:
             kwargs = {"limit": limit}
@@ -324,14 +398,16 @@ class DataMover:
             result = datamover_api.list_datamover_base_policies(**kwargs)
         except ApiException as e:
             logger.error("API error: %s", e)
-            return {"items": [], "resume": None}
+            return {"items": [], "resume": None, "error": f"API error: {e}"}
 
         items = [bp.to_dict() for bp in result.policies] if result.policies else []
 
-        return {
+        page = {
             "items": items,
             "resume": result.resume
         }
+        _lookup_cache.put(key, page)
+        return page
 
     def get_base_policy(self, base_policy_id: str) -> dict:
         """Get information about a specific DataMover base policy.
@@ -342,14 +418,21 @@ class DataMover:
         Returns:
             dict with base policy details.
         """
+        key = ("base_policy", self.cluster.url, base_policy_id)
+        cached = _lookup_cache.get(key)
+        if cached is not None:
+            return cached
+
         datamover_api = isi_sdk.DatamoverApi(self.cluster.api_client)
         try:
             result = datamover_api.get_datamover_base_policy(base_policy_id)
             base_policy_dict = result.base_policies[0].to_dict() if result.base_policies else {}
-            return {
+            found = {
                 "success": True,
                 "base_policy": base_policy_dict
             }
+            _lookup_cache.put(key, found)
+            return found
         except ApiException as e:
             return {
                 "success": False,
@@ -400,6 +483,7 @@ class DataMover:
             base_policy = isi_sdk.DatamoverBasePolicyCreateParams(**base_policy_params)
 
             result = datamover_api.create_datamover_base_policy(datamover_base_policy=base_policy)
+            _lookup_cache.drop(lambda k: k[:2] == ("base_policy", self.cluster.url))
 
             return {
                 "success": True,
@@ -424,6 +508,7 @@ class DataMover:
         datamover_api = isi_sdk.DatamoverApi(self.cluster.api_client)
         try:
             datamover_api.delete_datamover_base_policy(base_policy_id)
+            _lookup_cache.drop(lambda k: k[:2] == ("base_policy", self.cluster.url))
             return {
                 "success": True,
                 "message": f"DataMover base policy '{base_policy_id}' deleted successfully"
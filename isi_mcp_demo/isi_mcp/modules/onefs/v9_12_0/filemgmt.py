@@ -1,17 +1,66 @@
+import base64
+import os
+from functools import lru_cache
+
 import isilon_sdk.v9_12_0 as isi_sdk
+from isilon_sdk.v9_12_0.rest import ApiException
 from isilon_sdk.v9_12_0.models.namespace_acl import NamespaceAcl
 from isilon_sdk.v9_12_0.models.acl_object import AclObject
 from isilon_sdk.v9_12_0.models.member_object import MemberObject
 from isilon_sdk.v9_12_0.models.namespace_metadata import NamespaceMetadata
 from isilon_sdk.v9_12_0.models.namespace_metadata_attrs import NamespaceMetadataAttrs
-from isilon_sdk.v9_12_0.models.directory_query import DirectoryQuery
-from isilon_sdk.v9_12_0.models.directory_query_scope import DirectoryQueryScope
-from isilon_sdk.v9_12_0.models.directory_query_scope_conditions import DirectoryQueryScopeConditions
 from isilon_sdk.v9_12_0.models.access_point_create_params import AccessPointCreateParams
 from isilon_sdk.v9_12_0.models.worm_create_params import WormCreateParams
+from modules.onefs.v9_12_0.caching import TTLCache
 
 MAX_FILE_CONTENT_SIZE = 1 * 1024 * 1024  # 1 MiB
 
+# File attribute reads, kept for FILEMGMT_ATTR_CACHE_TTL seconds (0 disables).
+# Agents often re-read the same file's headers within one turn. Mutating
+# FileMgmt calls in this process drop the paths they touch; changes made by
+# other clients show up once the entry expires.
+FILEMGMT_ATTR_CACHE_TTL = float(os.environ.get("FILEMGMT_ATTR_CACHE_TTL", 5))
+# (cluster url, path without slashes) -> headers dict
+_attr_cache = TTLCache(FILEMGMT_ATTR_CACHE_TTL, max_entries=1024)
+
+
+def _attr_cache_drop(url, *paths):
+    """Forget cached attributes at or beneath any of paths on one cluster.
+
+    With no paths (e.g. access-point addressing), forget the whole cluster.
+    """
+    prefixes = [p.strip('/') for p in paths if p is not None]
+    _attr_cache.drop(lambda key: key[0] == url and (
+        not paths or any(not p or key[1] == p or key[1].startswith(p + '/')
+                         for p in prefixes)))
+
+
+# Pre-defined ACLs accepted by the x-isi-ifs-access-control header
+_PREDEFINED_ACLS = frozenset(
+    ("private_read", "private", "public_read", "public_read_write", "public"))
+
+
+@lru_cache(maxsize=64)
+def _access_control_header(access_control: str) -> str:
+    """
+    Validate and normalize an x-isi-ifs-access-control value.
+
+    Octal modes are padded to four digits ("755" -> "0755") and pre-defined
+    ACL names are lowercased. A malformed value raises ValueError here instead
+    of costing a round trip to the cluster.
+    """
+    value = access_control.strip()
+    if value.isdigit():
+        if len(value) > 4 or any(c in "89" for c in value):
+            raise ValueError(
+                f"access_control must be an octal mode like '0755', got '{access_control}'")
+        return value.zfill(4)
+    if value.lower() in _PREDEFINED_ACLS:
+        return value.lower()
+    raise ValueError(
+        f"access_control must be an octal mode or one of "
+        f"{sorted(_PREDEFINED_ACLS)}, got '{access_control}'")
+
 
 class FileMgmt:
     """Namespace and file management operations on a PowerScale cluster."""
@@ -19,14 +68,15 @@ class FileMgmt:
     def __init__(self, cluster):
         self.cluster = cluster
         self.debug = cluster.debug
+        self.namespace_api = isi_sdk.NamespaceApi(self.cluster.api_client)
 
     # -------------------------------------------------------------------
     # Internal helpers
     # -------------------------------------------------------------------
 
     def _ns_api(self):
-        """Create and return a NamespaceApi instance."""
-        return isi_sdk.NamespaceApi(self.cluster.api_client)
+        """Return the NamespaceApi bound to this cluster's shared ApiClient."""
+        return self.namespace_api
 
     def _normalize_path(self, path: str) -> str:
         """
@@ -97,7 +147,7 @@ class FileMgmt:
         api = self._ns_api()
         kwargs = {}
         if access_control:
-            kwargs['x_isi_ifs_access_control'] = access_control
+            kwargs['x_isi_ifs_access_control'] = _access_control_header(access_control)
         if recursive is not None:
             kwargs['recursive'] = recursive
         if overwrite:
@@ -106,8 +156,10 @@ class FileMgmt:
         if access_point:
             api.create_directory_with_access_point_container_path(
                 access_point, path, 'container', **kwargs)
+            _attr_cache_drop(self.cluster.url)
         else:
             api.create_directory(path, 'container', **kwargs)
+            _attr_cache_drop(self.cluster.url, path)
 
         return {"success": True, "message": f"Directory created: {path}"}
 
@@ -121,8 +173,10 @@ class FileMgmt:
         if access_point:
             api.delete_directory_with_access_point_container_path(
                 access_point, path, **kwargs)
+            _attr_cache_drop(self.cluster.url)
         else:
             api.delete_directory(path, **kwargs)
+            _attr_cache_drop(self.cluster.url, path)
 
         return {"success": True, "message": f"Directory deleted: {path}"}
 
@@ -132,8 +186,10 @@ class FileMgmt:
         if access_point:
             api.move_directory_with_access_point_container_path(
                 access_point, path, destination)
+            _attr_cache_drop(self.cluster.url)
         else:
             api.move_directory(path, destination)
+            _attr_cache_drop(self.cluster.url, path, destination)
 
         return {"success": True, "message": f"Directory moved from {path} to {destination}"}
 
@@ -149,25 +205,56 @@ class FileMgmt:
     def get_file_contents(self, path: str, byte_range: str = None) -> dict:
         api = self._ns_api()
         kwargs = {'_preload_content': False}
-        if byte_range:
-            kwargs['range'] = byte_range
-
-        data, status, headers = api.get_file_contents_with_http_info(path, **kwargs)
+        # Without an explicit range, ask for one byte past the cap so the
+        # cluster never sends more than is returned, and still detect truncation
+        capped = not byte_range
+        kwargs['range'] = f'bytes=0-{MAX_FILE_CONTENT_SIZE}' if capped else byte_range
 
-        raw_bytes = data.data
+        try:
+            data, status, headers = api.get_file_contents_with_http_info(path, **kwargs)
+        except ApiException as e:
+            # An empty file cannot satisfy any range
+            if not capped or e.status != 416:
+                raise
+            capped = False
+            del kwargs['range']
+            data, status, headers = api.get_file_contents_with_http_info(path, **kwargs)
+
+        # The body is not preloaded, so hand the connection back to the shared
+        # pool explicitly once it has been read.
+        try:
+            raw_bytes = data.data
+        finally:
+            data.release_conn()
         size = len(raw_bytes)
+        # Content-Range ends with the full file size: "bytes 0-1048576/104857600"
+        content_range = headers.get('Content-Range') if capped and headers else None
+        if content_range and content_range.rpartition('/')[2].isdigit():
+            size = int(content_range.rpartition('/')[2])
         truncated = size > MAX_FILE_CONTENT_SIZE
 
         if truncated:
             raw_bytes = raw_bytes[:MAX_FILE_CONTENT_SIZE]
 
+        # Text comes back as-is; anything that is not UTF-8 comes back as
+        # base64 so binary contents survive the JSON response intact
+        encoding = 'utf-8'
         try:
             text = raw_bytes.decode('utf-8')
-        except UnicodeDecodeError:
-            text = raw_bytes.decode('latin-1')
+        except UnicodeDecodeError as e:
+            # Only an incomplete sequence in the last 3 bytes can come from
+            # the 1 MiB cut splitting a character; drop its head. Invalid
+            # bytes anywhere else mean the contents are not UTF-8.
+            if (truncated and e.reason == 'unexpected end of data'
+                    and e.start >= len(raw_bytes) - 3):
+                text = raw_bytes[:e.start].decode('utf-8')
+            else:
+                text = base64.b64encode(raw_bytes).decode('ascii')
+                encoding = 'base64'
 
         return {
             "contents": text,
+            "encoding": encoding,
             "size": size,
             "truncated": truncated,
             "headers": self._parse_headers(headers)
@@ -180,29 +267,39 @@ class FileMgmt:
         api = self._ns_api()
         kwargs = {}
         if access_control:
-            kwargs['x_isi_ifs_access_control'] = access_control
+            kwargs['x_isi_ifs_access_control'] = _access_control_header(access_control)
         if content_type:
             kwargs['content_type'] = content_type
         if overwrite:
             kwargs['overwrite'] = overwrite
 
         api.create_file(path, 'object', contents, **kwargs)
+        _attr_cache_drop(self.cluster.url, path)
         return {"success": True, "message": f"File created: {path}"}
 
     def delete_file(self, path: str) -> dict:
         api = self._ns_api()
         api.delete_file(path)
+        _attr_cache_drop(self.cluster.url, path)
         return {"success": True, "message": f"File deleted: {path}"}
 
     def move_file(self, path: str, destination: str) -> dict:
         api = self._ns_api()
         api.move_file(path, destination)
+        _attr_cache_drop(self.cluster.url, path, destination)
         return {"success": True, "message": f"File moved from {path} to {destination}"}
 
     def get_file_attributes(self, path: str) -> dict:
+        key = (self.cluster.url, path.strip('/'))
+        cached = _attr_cache.get(key)
+        if cached is not None:
+            return cached
+
         api = self._ns_api()
         data, status, headers = api.get_file_attributes_with_http_info(path)
-        return self._parse_headers(headers)
+        result = self._parse_headers(headers)
+        _attr_cache.put(key, result)
+        return result
 
     # -------------------------------------------------------------------
     # Copy operations
@@ -221,6 +318,7 @@ class FileMgmt:
             kwargs['_continue'] = continue_on_error
 
         result = api.copy_directory(destination, source, **kwargs)
+        _attr_cache_drop(self.cluster.url, destination)
 
         errors = []
         if result and hasattr(result, 'copy_errors') and result.copy_errors:
@@ -245,6 +343,7 @@ class FileMgmt:
             kwargs['snapshot'] = snapshot
 
         result = api.copy_file(destination, source, **kwargs)
+        _attr_cache_drop(self.cluster.url, destination)
 
         errors = []
         if result and hasattr(result, 'copy_errors') and result.copy_errors:
@@ -320,6 +419,7 @@ class FileMgmt:
             kwargs['zone'] = zone
 
         api.set_acl(path, True, namespace_acl, **kwargs)
+        _attr_cache_drop(self.cluster.url, path)
         return {"success": True, "message": f"ACL set on {path}"}
 
     # -------------------------------------------------------------------
@@ -366,6 +466,7 @@ class FileMgmt:
             api.set_directory_metadata(path, True, metadata, **kwargs)
         else:
             api.set_file_metadata(path, True, metadata, **kwargs)
+        _attr_cache_drop(self.cluster.url, path)
 
         return {"success": True, "message": f"Metadata set on {path}"}
 
@@ -411,6 +512,7 @@ class FileMgmt:
             worm_retention_date=worm_retention_date
         )
         api.set_worm_properties(path, True, params)
+        _attr_cache_drop(self.cluster.url, path)
         return {"success": True, "message": f"WORM properties set on {path}"}
 
     # -------------------------------------------------------------------
@@ -426,16 +528,22 @@ class FileMgmt:
                         max_depth: int = None) -> dict:
         api = self._ns_api()
 
-        cond_objects = []
-        for c in conditions:
-            cond_objects.append(DirectoryQueryScopeConditions(
-                attr=c.get('attr'),
-                operator=c.get('operator'),
-                value=c.get('value')
-            ))
-
-        scope = DirectoryQueryScope(conditions=cond_objects, logic=logic)
-        query_model = DirectoryQuery(result=result_attrs, scope=scope)
+        # The body goes to the SDK as plain JSON-ready dicts: the SDK serializes
+        # them as-is, where DirectoryQuery models would be built per condition
+        # only to be turned straight back into the same dicts. Unset fields
+        # are left out, as the models would.
+        if logic not in ('and', 'or'):
+            raise ValueError(f"logic must be 'and' or 'or', got '{logic}'")
+        if not isinstance(conditions, list) or not all(isinstance(c, dict) for c in conditions):
+            raise ValueError("conditions must be a JSON list of condition objects")
+        scope = {
+            'conditions': [{k: c[k] for k in ('attr', 'operator', 'value')
+                            if c.get(k) is not None} for c in conditions],
+            'logic': logic,
+        }
+        query_model = {'scope': scope}
+        if result_attrs is not None:
+            query_model['result'] = result_attrs
 
         kwargs = {'limit': limit}
         if resume:
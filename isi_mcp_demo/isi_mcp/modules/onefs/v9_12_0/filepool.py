@@ -1,11 +1,50 @@
+import functools
 import json
 import logging
+import os
 import isilon_sdk.v9_12_0 as isi_sdk
 from isilon_sdk.v9_12_0.rest import ApiException
-from modules.ansible.runner import AnsibleRunner
+from modules.ansible.runner import AnsibleRunner, iac_mode_enabled
+from modules.json_utils import loads as _json_loads
+from modules.onefs.v9_12_0.caching import TTLCache
 
 logger = logging.getLogger(__name__)
 
+# Policy reads, kept for FILEPOOL_CACHE_TTL seconds. FilePool policies change
+# rarely compared with how often clients re-read them; a create, update or
+# delete drops every cached read for that cluster.
+FILEPOOL_CACHE_TTL = float(os.environ.get("FILEPOOL_CACHE_TTL", 30))
+_read_cache = TTLCache(FILEPOOL_CACHE_TTL)  # (cluster url, read name, arg) -> result dict
+
+
+def _parse_matching_pattern(raw: str) -> dict:
+    """Decode a file_matching_pattern JSON string and check its shape.
+
+    Catches malformed rules before they cost a playbook run or PAPI round trip.
+    Raises ValueError unless raw is {"or_criteria": [{"and_criteria": [{"type": ...}, ...]}, ...]}
+    with at least one entry at each level. How many groups and criteria are
+    allowed is left to the cluster.
+    """
+    pattern = _json_loads(raw)
+    or_criteria = pattern.get("or_criteria") if isinstance(pattern, dict) else None
+    if not isinstance(or_criteria, list) or not or_criteria:
+        raise ValueError("file_matching_pattern must be an object with a non-empty or_criteria list")
+    for group in or_criteria:
+        and_criteria = group.get("and_criteria") if isinstance(group, dict) else None
+        if not isinstance(and_criteria, list) or not and_criteria:
+            raise ValueError("each or_criteria group must have a non-empty and_criteria list")
+        for criterion in and_criteria:
+            if not isinstance(criterion, dict) or not isinstance(criterion.get("type"), str):
+                raise ValueError("each and_criteria entry must be an object with a string type")
+    return pattern
+
+
+@functools.lru_cache(maxsize=512)
+def _storage_policy_param(raw: str) -> str:
+    """Normalise a storage policy JSON string to the compact action_param form."""
+    parsed = _json_loads(raw)
+    return json.dumps(parsed) if isinstance(parsed, dict) else str(parsed)
+
 
 class FilePool:
     """Manages FilePool policies on a PowerScale cluster."""
@@ -27,6 +66,11 @@ class FilePool:
         Returns:
             dict with 'items' (list of policy dicts) and 'total' count.
         """
+        key = (self.cluster.url, "get", None)
+        cached = _read_cache.get(key)
+        if cached is not None:
+            return cached
+
         filepool_api = isi_sdk.FilepoolApi(self.cluster.api_client)
         try:
             result = filepool_api.list_filepool_policies()
@@ -36,10 +80,12 @@ class FilePool:
 
         items = [p.to_dict() for p in result.policies] if result.policies else []
 
-        return {
+        policies = {
             "items": items,
             "total": result.total if hasattr(result, 'total') else len(items)
         }
+        _read_cache.put(key, policies)
+        return policies
 
     def get_policy(self, policy_id: str) -> dict:
         """Get a single filepool policy by name or ID.
@@ -50,14 +96,21 @@ class FilePool:
         Returns:
             dict with success status and policy details.
         """
+        key = (self.cluster.url, "get_policy", policy_id)
+        cached = _read_cache.get(key)
+        if cached is not None:
+            return cached
+
         filepool_api = isi_sdk.FilepoolApi(self.cluster.api_client)
         try:
             result = filepool_api.get_filepool_policy(policy_id)
             policy_dict = result.policies[0].to_dict() if result.policies else {}
-            return {
+            found = {
                 "success": True,
                 "policy": policy_dict
             }
+            _read_cache.put(key, found)
+            return found
         except ApiException as e:
             return {
                 "success": False,
@@ -70,14 +123,21 @@ class FilePool:
         Returns:
             dict with default policy details.
         """
+        key = (self.cluster.url, "get_default_policy", None)
+        cached = _read_cache.get(key)
+        if cached is not None:
+            return cached
+
         filepool_api = isi_sdk.FilepoolApi(self.cluster.api_client)
         try:
             result = filepool_api.get_filepool_default_policy()
             policy_dict = result.default_policy.to_dict() if hasattr(result, 'default_policy') and result.default_policy else {}
-            return {
+            found = {
                 "success": True,
                 "default_policy": policy_dict
             }
+            _read_cache.put(key, found)
+            return found
         except ApiException as e:
             return {
                 "success": False,
@@ -116,16 +176,16 @@ class FilePool:
         runner = AnsibleRunner(self.cluster)
         variables = {
             "policy_name": policy_name,
-            "file_matching_pattern": json.loads(file_matching_pattern),
+            "file_matching_pattern": _parse_matching_pattern(file_matching_pattern),
         }
         if description:
             variables["description"] = description
         if apply_order is not None:
             variables["apply_order"] = apply_order
         if apply_data_storage_policy:
-            variables["apply_data_storage_policy"] = json.loads(apply_data_storage_policy)
+            variables["apply_data_storage_policy"] = _json_loads(apply_data_storage_policy)
         if apply_snapshot_storage_policy:
-            variables["apply_snapshot_storage_policy"] = json.loads(apply_snapshot_storage_policy)
+            variables["apply_snapshot_storage_policy"] = _json_loads(apply_snapshot_storage_policy)
         if set_requested_protection:
             variables["set_requested_protection"] = set_requested_protection
         if set_data_access_pattern:
@@ -133,7 +193,10 @@ class FilePool:
         if set_write_performance_optimization:
             variables["set_write_performance_optimization"] = set_write_performance_optimization
 
-        return runner.execute("filepool_create.yml.j2", variables)
+        try:
+            return runner.execute("filepool_create.yml.j2", variables)
+        finally:
+            _read_cache.drop(lambda k: k[0] == self.cluster.url)
 
     # ------------------------------------------------------------------
     # Update (SDK — Ansible does not support modify)
@@ -177,7 +240,7 @@ class FilePool:
                 update_params["apply_order"] = apply_order
 
             if file_matching_pattern is not None:
-                update_params["file_matching_pattern"] = json.loads(file_matching_pattern)
+                update_params["file_matching_pattern"] = _parse_matching_pattern(file_matching_pattern)
 
             actions = self._build_actions(
                 apply_data_storage_policy=apply_data_storage_policy,
@@ -200,6 +263,7 @@ class FilePool:
                 filepool_policy=policy,
                 filepool_policy_id=policy_id
             )
+            _read_cache.drop(lambda k: k[0] == self.cluster.url)
 
             return {
                 "success": True,
@@ -212,23 +276,42 @@ class FilePool:
             }
 
     # ------------------------------------------------------------------
-    # Delete (Ansible)
+    # Delete (SDK; Ansible in IAC_MODE)
     # ------------------------------------------------------------------
 
     def delete(self, policy_name: str) -> dict:
-        """Remove a filepool policy via Ansible.
+        """Remove a filepool policy.
+
+        Deleted with one PAPI call through the SDK instead of paying for an
+        Ansible run. In IAC_MODE the playbook is rendered for the external
+        workflow but not run.
 
         Args:
             policy_name: Name of the policy to remove.
 
         Returns:
-            dict with success status and Ansible execution details.
+            dict with success status (and the rendered playbook path in IAC_MODE).
         """
-        runner = AnsibleRunner(self.cluster)
-        variables = {
-            "policy_name": policy_name,
-        }
-        return runner.execute("filepool_remove.yml.j2", variables)
+        try:
+            if iac_mode_enabled():
+                variables = {
+                    "policy_name": policy_name,
+                }
+                return AnsibleRunner(self.cluster).execute("filepool_remove.yml.j2", variables)
+
+            filepool_api = isi_sdk.FilepoolApi(self.cluster.api_client)
+            try:
+                filepool_api.delete_filepool_policy(policy_name)
+            except ApiException as e:
+                if e.status != 404:
+                    return {"success": False, "status": "failed", "error": str(e)}
+                # Same outcome as the playbook's state: absent on a missing policy
+                return {"success": True, "status": "successful", "changed": False,
+                        "message": f"FilePool policy '{policy_name}' does not exist"}
+            return {"success": True, "status": "successful", "changed": True,
+                    "message": f"FilePool policy '{policy_name}' removed"}
+        finally:
+            _read_cache.drop(lambda k: k[0] == self.cluster.url)
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -246,17 +329,27 @@ class FilePool:
         actions = []
 
         if apply_data_storage_policy:
-            parsed = json.loads(apply_data_storage_policy) if isinstance(apply_data_storage_policy, str) else apply_data_storage_policy
+            if isinstance(apply_data_storage_policy, str):
+                param = _storage_policy_param(apply_data_storage_policy)
+            elif isinstance(apply_data_storage_policy, dict):
+                param = json.dumps(apply_data_storage_policy)
+            else:
+                param = str(apply_data_storage_policy)
             actions.append({
                 "action_type": "apply_data_storage_policy",
-                "action_param": json.dumps(parsed) if isinstance(parsed, dict) else str(parsed)
+                "action_param": param
             })
 
         if apply_snapshot_storage_policy:
-            parsed = json.loads(apply_snapshot_storage_policy) if isinstance(apply_snapshot_storage_policy, str) else apply_snapshot_storage_policy
+            if isinstance(apply_snapshot_storage_policy, str):
+                param = _storage_policy_param(apply_snapshot_storage_policy)
+            elif isinstance(apply_snapshot_storage_policy, dict):
+                param = json.dumps(apply_snapshot_storage_policy)
+            else:
+                param = str(apply_snapshot_storage_policy)
             actions.append({
                 "action_type": "apply_snapshot_storage_policy",
-                "action_param": json.dumps(parsed) if isinstance(parsed, dict) else str(parsed)
+                "action_param": param
             })
 
         if set_requested_protection:
@@ -3,6 +3,9 @@ import isilon_sdk.v9_12_0 as isi_sdk
 from isilon_sdk.v9_12_0.rest import ApiException
 from modules.ansible.runner import AnsibleRunner
 
+# Hostname client entries, optionally with a leading "*." wildcard
+_HOSTNAME_RE = re.compile(r'^(\*\.)?([a-zA-Z0-9]([a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])?\.)*[a-zA-Z0-9]([a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])?$')
+
 class Nfs:
     """holds all functions related to NFS exports on a powerscale cluster."""
 
@@ -60,9 +63,8 @@ class Nfs:
 
             return True
 
-        # Pattern for hostname (including wildcard)
-        hostname_pattern = r'^(\*\.)?([a-zA-Z0-9]([a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])?\.)*[a-zA-Z0-9]([a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])?$'
-        if re.match(hostname_pattern, client):
+        # Hostname (including wildcard)
+        if _HOSTNAME_RE.match(client):
             return True
 
         return False
@@ -2,7 +2,7 @@ import re
 import isilon_sdk.v9_12_0 as isi_sdk
 from isilon_sdk.v9_12_0.rest import ApiException
 from isilon_sdk.v9_12_0.models.quota_quota import QuotaQuota
-from modules.ansible.runner import AnsibleRunner
+from modules.ansible.runner import AnsibleRunner, iac_mode_enabled
 from isilon_sdk.v9_12_0.models.quota_quotas_extended import QuotaQuotasExtended
 from isilon_sdk.v9_12_0.models.quota_quota_thresholds import QuotaQuotaThresholds
 
@@ -16,13 +16,15 @@ _UNIT_TO_GB = {
     'TB': 1024,               'TIB': 1024,
 }
 
+_SIZE_RE = re.compile(r'^([\d.]+)\s*([A-Za-z]+)$')
+
 def _parse_size(size_str: str) -> tuple:
     """Parse a human-readable size string into (number, cap_unit) for Ansible.
 
     The module only accepts 'GB' or 'TB' as cap_unit.  Smaller units are
     converted to a GB value.  Example: '10GiB' -> (10.0, 'GB')
     """
-    m = re.match(r'^([\d.]+)\s*([A-Za-z]+)$', size_str.strip())
+    m = _SIZE_RE.match(size_str.strip())
     if not m:
         raise ValueError(f"Cannot parse size: {size_str}")
     number, unit = float(m.group(1)), m.group(2).upper()
@@ -181,17 +183,43 @@ class Quotas:
         return runner.execute("quota_create.yml.j2", variables)
 
     def remove_quota(self, path: str, quota_type: str, persona: str = None) -> dict:
-        """Remove a quota via Ansible.
+        """Remove a quota.
+
+        The quota is looked up and deleted with two PAPI calls through the SDK
+        instead of paying for an Ansible run. Like the playbook, only the quota
+        with include_snapshots unset is targeted; if more than one quota still
+        matches, nothing is deleted. In IAC_MODE the playbook is rendered for
+        the external workflow but not run.
 
         Args:
             quota_type: Threshold type — 'hard', 'soft', or 'advisory'
             persona: If set, removes a user quota; otherwise a directory quota
         """
-        runner = AnsibleRunner(self.cluster)
         ansible_quota_type = "user" if persona else "directory"
-        variables = {
-            "path": path,
-            "quota_type": ansible_quota_type,
-            "threshold_type": quota_type,
-        }
-        return runner.execute("quota_remove.yml.j2", variables)
\ No newline at end of file
+        if iac_mode_enabled():
+            variables = {
+                "path": path,
+                "quota_type": ansible_quota_type,
+                "threshold_type": quota_type,
+            }
+            return AnsibleRunner(self.cluster).execute("quota_remove.yml.j2", variables)
+
+        quota_api = isi_sdk.QuotaApi(self.cluster.api_client)
+        try:
+            # The smartquota module matches on path, type and include_snapshots
+            # (default false)
+            quotas = quota_api.list_quota_quotas(
+                path=path, type=ansible_quota_type, include_snapshots=False).quotas or []
+            if not quotas:
+                # Same outcome as the playbook's state: absent on a missing quota
+                return {"success": True, "status": "successful", "changed": False,
+                        "message": f"No {ansible_quota_type} quota on {path}"}
+            if len(quotas) > 1:
+                return {"success": False, "status": "failed",
+                        "error": f"{len(quotas)} {ansible_quota_type} quotas match {path}; "
+                                 "none were removed"}
+            quota_api.delete_quota_quota(quotas[0].id)
+            return {"success": True, "status": "successful", "changed": True,
+                    "message": f"Removed {ansible_quota_type} quota on {path}"}
+        except ApiException as e:
+            return {"success": False, "status": "failed", "error": str(e)}
\ No newline at end of file
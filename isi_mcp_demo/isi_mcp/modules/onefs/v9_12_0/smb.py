@@ -1,11 +1,31 @@
-import json
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 import isilon_sdk.v9_12_0 as isi_sdk
 from isilon_sdk.v9_12_0.rest import ApiException
-from modules.ansible.runner import AnsibleRunner
+from modules.ansible.runner import AnsibleRunner, iac_mode_enabled
+from modules.json_utils import loads as _json_loads
+from modules.onefs.v9_12_0.caching import TTLCache
 
 logger = logging.getLogger(__name__)
 
+# SMB global settings are a per-cluster singleton that rarely changes, so reads
+# are served from memory for SMB_SETTINGS_CACHE_TTL seconds and dropped on set.
+SMB_SETTINGS_CACHE_TTL = float(os.environ.get("SMB_SETTINGS_CACHE_TTL", 30))
+_global_settings_cache = TTLCache(SMB_SETTINGS_CACHE_TTL)  # cluster url -> settings dict
+
+
+def _parse_lnn_list(value: str):
+    """Parse a node list such as "2" or "1,3-5" into a set of LNNs; None if malformed."""
+    lnns = set()
+    for part in value.split(","):
+        first, dash, last = part.strip().partition("-")
+        if not first.isdigit() or (dash and not last.isdigit()):
+            return None
+        lnns.update(range(int(first), int(last or first) + 1))
+    return lnns
+
+
 class Smb:
     """holds all functions related to SMB shares on a powerscale cluster."""
 
@@ -58,13 +78,9 @@ class Smb:
             "share_name": share_name,
             "path": path,
         }
-        if description:
-            variables["description"] = description
-        if access_zone:
-            variables["access_zone"] = access_zone
 
         # Boolean parameters — pass through when explicitly set
-        bool_params = {
+        flags = {
             "create_path": create_path,
             "browsable": browsable,
             "access_based_enumeration": access_based_enumeration,
@@ -81,50 +97,49 @@ class Smb:
             "allow_execute_always": allow_execute_always,
             "file_filtering_enabled": file_filtering_enabled,
         }
-        for key, val in bool_params.items():
-            if val is not None:
-                variables[key] = val
+        variables.update((k, v) for k, v in flags.items() if v is not None)
 
-        # Octal string parameters
-        for key, val in [("directory_create_mask", directory_create_mask),
-                         ("directory_create_mode", directory_create_mode),
-                         ("file_create_mask", file_create_mask),
-                         ("file_create_mode", file_create_mode)]:
-            if val:
-                variables[key] = val
-
-        # String parameters
-        for key, val in [("ca_write_integrity", ca_write_integrity),
-                         ("change_notify", change_notify),
-                         ("impersonate_guest", impersonate_guest),
-                         ("impersonate_user", impersonate_user)]:
-            if val:
-                variables[key] = val
-
-        # Dict parameter — ca_timeout
-        if ca_timeout:
-            variables["ca_timeout"] = ca_timeout
+        # Strings (descriptions, octal masks, CA options) and the ca_timeout
+        # dict — only when non-empty
+        options = {
+            "description": description,
+            "access_zone": access_zone,
+            "directory_create_mask": directory_create_mask,
+            "directory_create_mode": directory_create_mode,
+            "file_create_mask": file_create_mask,
+            "file_create_mode": file_create_mode,
+            "ca_write_integrity": ca_write_integrity,
+            "change_notify": change_notify,
+            "impersonate_guest": impersonate_guest,
+            "impersonate_user": impersonate_user,
+            "ca_timeout": ca_timeout,
+        }
+        variables.update((k, v) for k, v in options.items() if v)
 
         # Complex parameters — JSON strings parsed to Python objects
-        if file_filter_extension:
-            variables["file_filter_extension"] = json.loads(file_filter_extension)
-        if permissions:
-            variables["permissions"] = json.loads(permissions)
-        if host_acls:
-            variables["host_acls"] = json.loads(host_acls)
-        if run_as_root:
-            variables["run_as_root"] = json.loads(run_as_root)
+        json_options = {
+            "file_filter_extension": file_filter_extension,
+            "permissions": permissions,
+            "host_acls": host_acls,
+            "run_as_root": run_as_root,
+        }
+        variables.update((k, _json_loads(v)) for k, v in json_options.items() if v)
 
         return runner.execute("smb_create.yml.j2", variables)
 
     def get_global_settings(self) -> dict:
         """Retrieve SMB global settings via SDK."""
+        cached = _global_settings_cache.get(self.cluster.url)
+        if cached is not None:
+            return cached
+
         protocols_api = isi_sdk.ProtocolsApi(self.cluster.api_client)
         try:
-            result = protocols_api.get_smb_settings_global()
-            return result.to_dict()
+            result = protocols_api.get_smb_settings_global().to_dict()
         except ApiException as e:
             return {"error": str(e)}
+        _global_settings_cache.put(self.cluster.url, result)
+        return result
 
     def set_global_settings(self, service: bool = None,
                             support_smb2: bool = None,
@@ -145,8 +160,13 @@ class Smb:
                             onefs_cpu_multiplier: int = None,
                             onefs_num_workers: int = None,
                             ignore_eas: bool = None) -> dict:
-        """Update SMB global settings via Ansible."""
-        runner = AnsibleRunner(self.cluster)
+        """Update SMB global settings.
+
+        The settings are a flat singleton, so they are written with one
+        PAPI PUT through the SDK instead of paying for an Ansible run. In
+        IAC_MODE the playbook is rendered for the external workflow but not
+        run.
+        """
         variables = {}
 
         bool_params = {
@@ -170,16 +190,31 @@ class Smb:
             if val is not None:
                 variables[key] = val
 
-        if guest_user is not None:
+        # Empty strings are skipped, as the playbook template does
+        if guest_user:
             variables["guest_user"] = guest_user
-        if server_string is not None:
+        if server_string:
             variables["server_string"] = server_string
         if onefs_cpu_multiplier is not None:
             variables["onefs_cpu_multiplier"] = onefs_cpu_multiplier
         if onefs_num_workers is not None:
             variables["onefs_num_workers"] = onefs_num_workers
 
-        return runner.execute("smb_global_settings.yml.j2", variables)
+        _global_settings_cache.discard(self.cluster.url)
+        if iac_mode_enabled():
+            return AnsibleRunner(self.cluster).execute("smb_global_settings.yml.j2", variables)
+
+        protocols_api = isi_sdk.ProtocolsApi(self.cluster.api_client)
+        try:
+            protocols_api.update_smb_settings_global(
+                isi_sdk.SmbSettingsGlobalExtended(**variables))
+            return {
+                "success": True,
+                "status": "successful",
+                "updated": variables,
+            }
+        except ApiException as e:
+            return {"success": False, "status": "failed", "error": str(e)}
 
     def remove(self, share_name: str) -> dict:
         """Remove an SMB share via Ansible."""
@@ -191,7 +226,16 @@ class Smb:
 
     def get_sessions(self, limit: int = 1000, lnn: str = None,
                      lnn_skip: str = None, resume: str = None) -> dict:
-        """List all open SMB sessions across cluster nodes."""
+        """List all open SMB sessions across cluster nodes.
+
+        For a first page with lnn="all", each node is queried concurrently
+        rather than letting the cluster walk the nodes one after another.
+        """
+        if lnn == "all" and not resume:
+            page = self._get_sessions_per_node(limit, lnn_skip)
+            if page is not None:
+                return page
+
         protocols_api = isi_sdk.ProtocolsApi(self.cluster.api_client)
         try:
             kwargs = {}
@@ -215,6 +259,56 @@ class Smb:
             "total": result.total,
         }
 
+    def _get_sessions_per_node(self, limit: int, lnn_skip: str = None):
+        """Fetch every node's sessions in parallel and merge them.
+
+        Only used when the merged result fits in one page of limit sessions,
+        since per-node resume tokens cannot be folded into a single token.
+        Returns None, and the caller falls back to the cluster-wide query,
+        when the node list or lnn_skip cannot be read or the sessions do not
+        fit; outstanding node requests are cancelled as soon as that is known.
+        """
+        skip = _parse_lnn_list(lnn_skip) if lnn_skip else set()
+        if skip is None:
+            return None
+        cluster_api = isi_sdk.ClusterApi(self.cluster.api_client)
+        protocols_api = isi_sdk.ProtocolsApi(self.cluster.api_client)
+        try:
+            nodes = cluster_api.get_cluster_nodes().nodes or []
+        except ApiException as e:
+            logger.debug("Node listing failed, using cluster-wide query: %s", e)
+            return None
+        lnns = [n.lnn for n in nodes if n.lnn not in skip]
+        if not lnns:
+            return None
+
+        def _one(node_lnn):
+            return protocols_api.get_smb_sessions(lnn=str(node_lnn), limit=limit)
+
+        results = []
+        sessions = 0
+        with ThreadPoolExecutor(max_workers=min(8, len(lnns)),
+                                thread_name_prefix="smb-sessions") as ex:
+            futures = [ex.submit(_one, node_lnn) for node_lnn in lnns]
+            try:
+                for future in futures:
+                    result = future.result()
+                    sessions += result.total or 0
+                    if result.resume or sessions > limit:
+                        return None
+                    results.append(result)
+            except ApiException as e:
+                logger.error("API error: %s", e)
+                return {"error": str(e)}
+            finally:
+                for future in futures:
+                    future.cancel()
+        return {
+            "nodes": [n.to_dict() for r in results for n in (r.nodes or [])],
+            "resume": None,
+            "total": sessions,
+        }
+
     def delete_session(self, session_id: str) -> dict:
         """Close an SMB session by ID."""
         protocols_api = isi_sdk.ProtocolsApi(self.cluster.api_client)
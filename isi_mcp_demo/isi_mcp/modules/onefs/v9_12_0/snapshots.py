@@ -31,7 +31,7 @@ class Snapshots:
             result = snapshot_api.list_snapshot_snapshots(**kwargs)
         except ApiException as e:
             logger.error("API error: %s", e)
-            return {"items": [], "resume": None}
+            return {"items": [], "resume": None, "error": f"API error: {e}"}
 
         items = [s.to_dict() for s in result.snapshots] if result.snapshots else []
 
@@ -113,7 +113,8 @@ class Snapshots:
             result = snapshot_api.get_snapshot_pending(**kwargs)
         except ApiException as e:
             logger.error("API error: %s", e)
-            return {"items": [], "resume": None, "has_more": False}
+            return {"items": [], "resume": None, "has_more": False,
+                    "error": f"API error: {e}"}
 
         items = [p.to_dict() for p in result.pending] if result.pending else []
 
@@ -31,7 +31,7 @@ class SnapshotSchedules:
             result = snapshot_api.list_snapshot_schedules(**kwargs)
         except ApiException as e:
             logger.error("API error: %s", e)
-            return {"items": [], "resume": None}
+            return {"items": [], "resume": None, "error": f"API error: {e}"}
 
         items = [s.to_dict() for s in result.schedules] if result.schedules else []
 
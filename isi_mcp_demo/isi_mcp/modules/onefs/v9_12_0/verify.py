@@ -1,7 +1,7 @@
 import logging
 import isilon_sdk.v9_12_0 as isi_sdk
 from isilon_sdk.v9_12_0.rest import ApiException
-from modules.network.utils import pingable
+from modules.network.utils import all_pingable
 
 logger = logging.getLogger(__name__)
 
@@ -61,12 +61,8 @@ class Verify:
 
     def all_nodes_pingable(self):
         nodes = self.cluster_api.get_cluster_external_ips()
-        for node in nodes:
-            logger.debug("Checking node %s", node)
-            if not pingable(node, debug=self.debug):
-                logger.debug("Node %s failed ping", node)
-                return False
-        return True
+        logger.debug("Checking nodes %s", nodes)
+        return all_pingable(nodes, debug=self.debug)
 
     def get_ifs_percent_free(self):
         stats_api = isi_sdk.StatisticsApi(self.cluster.api_client)
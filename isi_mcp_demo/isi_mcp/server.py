@@ -1,14 +1,21 @@
 import asyncio
+import contextvars
 import fcntl
+import functools
 import json
 import logging
 import os
 import re
 import subprocess
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from typing import Annotated, Dict, Any, Literal, Optional, List
+import urllib3
 from fastmcp import FastMCP
+from pydantic import Field
+from isilon_sdk.v9_12_0.rest import ApiException
 try:
     from fastmcp.server.auth import RemoteAuthProvider
     from fastmcp.server.auth.providers.jwt import JWTVerifier
@@ -18,8 +25,10 @@ try:
     _FASTMCP_AUTH_AVAILABLE = True
 except ImportError:
     _FASTMCP_AUTH_AVAILABLE = False
+from modules.json_utils import loads as _json_loads
 from modules.logging_config import configure_logging
-from modules.onefs.v9_12_0.cluster import Cluster
+from modules.onefs.v9_12_0.cluster import Cluster, api_limiter_stats
+from modules.onefs.v9_12_0.caching import SingleFlight
 from modules.onefs.v9_12_0.verify import Verify
 from modules.onefs.v9_12_0.capacity import Capacity
 from modules.onefs.v9_12_0.quotas import Quotas
@@ -61,6 +70,7 @@ from modules.onefs.v9_12_0.local_info import LocalInfo
 from modules.onefs.v9_12_0.api_sessions import ApiSessions
 from modules.onefs.v9_12_0.groupnets_summary import GroupnetsSummary
 from modules.ansible.vault_manager import VaultManager
+from modules.ansible.runner import precompile_templates
 
 configure_logging()
 logger = logging.getLogger(__name__)
@@ -155,16 +165,19 @@ _tools_raw = _load_tools_config()
 
 TOOL_GROUPS: Dict[str, List[str]] = {}
 _TOOL_TO_MODE: Dict[str, str] = {}
+# mode -> tool names, so "read"/"write" toggles don't rescan _TOOL_TO_MODE
+_TOOLS_BY_MODE: Dict[str, List[str]] = {"read": [], "write": []}
 for _name, _meta in _tools_raw.items():
     _grp = _meta["tool_group"]
     TOOL_GROUPS.setdefault(_grp, []).append(_name)
     _TOOL_TO_MODE[_name] = _meta["tool_mode"]
+    _TOOLS_BY_MODE.setdefault(_meta["tool_mode"], []).append(_name)
 
 # ---------------------------------------------------------------------------
 # (legacy reference kept for shape — actual data is now in tools.json)
 # ---------------------------------------------------------------------------
 # Management tools — these cannot be disabled
-MANAGEMENT_TOOLS = {
+MANAGEMENT_TOOLS = frozenset({
     "powerscale_tools_list",
     "powerscale_tools_list_by_group",
     "powerscale_tools_list_by_mode",
@@ -174,13 +187,15 @@ MANAGEMENT_TOOLS = {
     "powerscale_cluster_add",
     "powerscale_cluster_remove",
     "powerscale_cluster_modify",
-}
+})
 
 # Build reverse lookup: tool_name -> group_name
-_TOOL_TO_GROUP: Dict[str, str] = {}
-for _grp, _tools in TOOL_GROUPS.items():
-    for _t in _tools:
-        _TOOL_TO_GROUP[_t] = _grp
+_TOOL_TO_GROUP: Dict[str, str] = {
+    _t: _grp for _grp, _tools in TOOL_GROUPS.items() for _t in _tools
+}
+
+# Every name _resolve_names_to_tools can expand: groups, mode targets, tools
+_RESOLVABLE_NAMES = frozenset(TOOL_GROUPS) | frozenset(_TOOLS_BY_MODE) | frozenset(_TOOL_TO_GROUP)
 
 # Stash for disabled tools so they can be re-enabled at runtime
 _disabled_tools: Dict[str, Any] = {}  # tool_name -> Tool object
@@ -303,6 +318,9 @@ if _FASTMCP_AUTH_AVAILABLE:
         def __init__(self):
             from modules.audit.logger import AuditLogger
             self._audit = AuditLogger()
+            # Entries are encoded and written off the event loop; a single
+            # worker keeps them in call order.
+            self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="audit")
 
         def _caller_info(self) -> tuple:
             """Return (username, domain). Falls back to anonymous/local when no token."""
@@ -343,10 +361,17 @@ if _FASTMCP_AUTH_AVAILABLE:
                 return None
             combined = "\n".join(texts)
             try:
-                return json.loads(combined)
+                return _json_loads(combined)
             except (json.JSONDecodeError, ValueError):
                 return combined
 
+        def _record(self, username, domain, tool_name, mode, inputs, result, error):
+            try:
+                self._audit.log(username, domain, tool_name, mode, inputs,
+                                self._extract_output(result), error)
+            except Exception:
+                logger.warning("Failed to write audit entry for %s", tool_name, exc_info=True)
+
         async def on_call_tool(self, context, call_next):
             tool_name = context.message.name
             mode = _TOOL_TO_MODE.get(tool_name, "read")
@@ -362,8 +387,8 @@ if _FASTMCP_AUTH_AVAILABLE:
                 error = str(exc)
                 raise
             finally:
-                self._audit.log(username, domain, tool_name, mode, inputs,
-                                self._extract_output(result), error)
+                self._writer.submit(self._record, username, domain, tool_name,
+                                    mode, inputs, result, error)
 
     mcp.add_middleware(AuditMiddleware())
     logger.info("Audit middleware enabled (rotating NDJSON log at /app/audit/audit.log)")
@@ -372,14 +397,16 @@ if _FASTMCP_AUTH_AVAILABLE:
 def _resolve_names_to_tools(names: List[str]) -> List[str]:
     """Resolve group names, mode targets ("read"/"write"), or individual tool
     names to a flat list of individual tool names. Unknown names are silently
-    skipped."""
+    skipped with a single set lookup."""
     result = []
     for name in names:
+        if name not in _RESOLVABLE_NAMES:
+            continue
         if name in TOOL_GROUPS:
             result.extend(TOOL_GROUPS[name])
-        elif name in ("read", "write"):
-            result.extend(t for t, m in _TOOL_TO_MODE.items() if m == name)
-        elif name in _TOOL_TO_GROUP or name in _disabled_tools:
+        elif name in _TOOLS_BY_MODE:
+            result.extend(_TOOLS_BY_MODE[name])
+        else:
             result.append(name)
     return result
 
@@ -389,16 +416,19 @@ def _resolve_names_to_tools(names: List[str]) -> List[str]:
 # ---------------------------------------------------------------------------
 _TOOL_STATE_TTL = 5  # seconds between re-reads of tools.json
 _tool_state_last_refresh: float = 0.0
+_tool_state_file_sig: Optional[tuple] = None  # (mtime_ns, size) of the last tools.json synced
 
 
 def _refresh_tool_state() -> None:
     """Re-read tools.json and sync mcp tool registration if it changed on disk.
 
-    Uses a TTL cache to avoid reading the file on every request. When running
-    multiple instances behind a load balancer, a toggle on one instance writes
-    to the shared tools.json; other instances pick up the change within the TTL.
+    Uses a TTL cache to avoid reading the file on every request, and only
+    re-parses it when its mtime or size has changed. When running multiple
+    instances behind a load balancer, a toggle on one instance writes to the
+    shared tools.json; other instances pick up the change within
+    _TOOL_STATE_TTL seconds.
     """
-    global _tool_state_last_refresh
+    global _tool_state_last_refresh, _tool_state_file_sig
     now = time.monotonic()
     if now - _tool_state_last_refresh < _TOOL_STATE_TTL:
         return
@@ -407,6 +437,12 @@ def _refresh_tool_state() -> None:
     if os.environ.get("ENABLE_ALL_TOOLS", "").lower() == "true":
         return
 
+    st = os.stat(TOOLS_CONFIG_PATH)
+    file_sig = (st.st_mtime_ns, st.st_size)
+    if file_sig == _tool_state_file_sig:
+        return
+    _tool_state_file_sig = file_sig
+
     config = _load_tools_config()
     for name, meta in config.items():
         if name in MANAGEMENT_TOOLS:
@@ -426,8 +462,93 @@ def _refresh_tool_state() -> None:
             logger.debug("Refresh: disabled tool %s", name)
 
 
+# ---------------------------------------------------------------------------
+# Cluster cache — reuse Cluster handles across tool calls
+# ---------------------------------------------------------------------------
+# Handles are cached per cluster_name (None = the selected cluster) for
+# CLUSTER_CACHE_TTL seconds so back-to-back tool calls (e.g. walking pages)
+# skip the vault lookup and Cluster construction. The cluster management tools
+# invalidate the cache on this instance.
+#
+# For a named cluster called from a read tool, an entry up to one TTL past
+# expiry is still served while a background thread rebuilds it, so the vault
+# decrypt stays off the request path; other instances behind a load balancer
+# therefore pick up a vault change within 2 x CLUSTER_CACHE_TTL. The selected
+# cluster (None) and write tools never get a stale entry, so a
+# powerscale_cluster_select on another instance reaches them within one TTL.
+# Expired entries otherwise, and entries dropped by _invalidate_cluster_cache
+# or _invalidate_cluster (e.g. by _safe_tool after a connection or auth
+# failure), are rebuilt synchronously.
+CLUSTER_CACHE_TTL = float(os.environ.get("CLUSTER_CACHE_TTL", 30))
+_cluster_cache: Dict[Optional[str], tuple] = {}  # cluster_name -> (Cluster, expires)
+_cluster_cache_lock = threading.Lock()
+_cluster_refreshing: set = set()  # cluster_names with a background rebuild running
+# cluster_name -> count of invalidations, so a background rebuild that started
+# before one is discarded
+_cluster_generations: Dict[Optional[str], int] = {}
+# Set by _safe_tool while a write tool (tool_mode "write" in tools.json) runs
+_in_write_tool: contextvars.ContextVar = contextvars.ContextVar("_in_write_tool", default=False)
+
+
+def _drop_cluster_locked(key: Optional[str]) -> None:
+    _cluster_cache.pop(key, None)
+    _cluster_generations[key] = _cluster_generations.get(key, 0) + 1
+
+
+def _invalidate_cluster_cache() -> None:
+    """Drop all cached Cluster handles so the next tool call rebuilds them."""
+    with _cluster_cache_lock:
+        for key in set(_cluster_cache) | _cluster_refreshing:
+            _drop_cluster_locked(key)
+
+
+def _invalidate_cluster(cluster_name: Optional[str]) -> None:
+    """Drop the cached handle for one cluster_name (None = the selected cluster)."""
+    with _cluster_cache_lock:
+        _drop_cluster_locked(cluster_name or None)
+
+
+def _build_cluster(cluster_name: Optional[str]) -> Cluster:
+    if cluster_name:
+        c = Cluster.from_vault_by_name(cluster_name)
+    else:
+        c = Cluster.from_vault()
+    if not c.host:
+        raise RuntimeError("No cluster host configured.")
+    return c
+
+
+# Synchronous builds in flight, so concurrent misses for one cluster_name
+# share a single vault read; every caller gets the same Cluster
+_cluster_builds = SingleFlight(copy_results=False)
+
+
+def _build_and_store_cluster(key: Optional[str], generation: int) -> Cluster:
+    """Build the handle for key without holding the cache lock, then cache it.
+
+    The entry is only stored if no invalidation happened since generation
+    was read, so a handle built from stale vault data is not cached.
+    """
+    c = _build_cluster(key)
+    with _cluster_cache_lock:
+        if generation == _cluster_generations.get(key, 0):
+            _cluster_cache[key] = (c, time.monotonic() + CLUSTER_CACHE_TTL)
+    return c
+
+
+def _rebuild_cluster_in_background(key: Optional[str], generation: int) -> None:
+    """Rebuild one cache entry; keep serving the old handle if this fails."""
+    try:
+        _build_and_store_cluster(key, generation)
+    except Exception as e:
+        logger.debug("Background cluster refresh for %s failed: %s", key, e)
+    finally:
+        with _cluster_cache_lock:
+            _cluster_refreshing.discard(key)
+
+
 def _get_cluster(cluster_name: str = None) -> Cluster:
-    """Create a cluster from vault credentials.
+    """Return a cluster built from vault credentials, cached for CLUSTER_CACHE_TTL.
 
     If cluster_name is provided, connects to that specific named cluster.
     Otherwise uses the currently selected cluster.
@@ -435,13 +556,285 @@ def _get_cluster(cluster_name: str = None) -> Cluster:
     Raises ValueError if the specified cluster_name is not found.
     """
     _refresh_tool_state()
-    if cluster_name:
-        c = Cluster.from_vault_by_name(cluster_name)
-    else:
-        c = Cluster.from_vault()
-    if not c.host:
-        raise RuntimeError("No cluster host configured.")
-    return c
+    key = cluster_name or None
+    now = time.monotonic()
+    with _cluster_cache_lock:
+        cached = _cluster_cache.get(key)
+        if cached is not None:
+            if now < cached[1]:
+                return cached[0]
+            if (key is not None and not _in_write_tool.get()
+                    and now < cached[1] + CLUSTER_CACHE_TTL):
+                if key not in _cluster_refreshing:
+                    _cluster_refreshing.add(key)
+                    threading.Thread(
+                        target=_rebuild_cluster_in_background,
+                        args=(key, _cluster_generations.get(key, 0)),
+                        name="cluster-refresh", daemon=True).start()
+                return cached[0]
+        generation = _cluster_generations.get(key, 0)
+
+    # The vault read and Cluster construction run outside the lock, so a slow
+    # or failing build for one cluster does not hold up calls to the others
+    return _cluster_builds.do((key, generation), _build_and_store_cluster, key, generation)
+
+
+# (module class, cluster_name) -> module instance bound to the cached Cluster
+_client_cache: Dict[tuple, Any] = {}
+
+
+def _get_client(module_cls, cluster_name: str = None):
+    """Return a module_cls(cluster) instance for the cached cluster.
+
+    The module classes (Nfs, Smb, S3, ...) are stateless wrappers around the
+    cluster's ApiClient, so one instance per cluster is reused until the
+    cluster cache hands out a new Cluster.
+    """
+    cluster = _get_cluster(cluster_name)
+    key = (module_cls, cluster_name or None)
+    client = _client_cache.get(key)
+    if client is None or client.cluster is not cluster:
+        client = module_cls(cluster)
+        _client_cache[key] = client
+    return client
+
+
+def _is_connection_failure(e: Exception) -> bool:
+    """True for errors that mean the cluster's host or credentials may be stale.
+
+    urllib3 errors (MaxRetryError and friends) mean the host could not be
+    reached; the SDK reports TLS failures as status 0 and rejected credentials
+    as 401. Other API errors (404, 400, ...) are answers from a working cluster.
+    """
+    if isinstance(e, urllib3.exceptions.HTTPError):
+        return True
+    return isinstance(e, ApiException) and e.status in (0, 401)
+
+
+def _safe_tool(fn):
+    """Return {"error": str(e)} from a tool instead of raising.
+
+    Stack directly beneath @mcp.tool() so the registered tool keeps the wrapped
+    function's name, docstring and signature.
+
+    Many module methods let ApiException escape, so most exceptions here are
+    ordinary API answers (a missing path, a bad argument) and leave the cache
+    alone. On a connection or auth failure the cached handle for that call's
+    cluster_name is dropped, so the next call re-reads the vault and picks up
+    a changed host or rotated credentials. Unchanged settings get the same
+    pooled ApiClient back from cluster.py.
+    """
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        start = time.monotonic()
+        failed = True
+        write_token = _in_write_tool.set(_TOOL_TO_MODE.get(fn.__name__) == "write")
+        try:
+            result = fn(*args, **kwargs)
+            failed = False
+            return result
+        except Exception as e:
+            logger.debug("Tool %s failed", fn.__name__, exc_info=True)
+            if _is_connection_failure(e):
+                _invalidate_cluster(kwargs.get("cluster_name"))
+            return {"error": str(e)}
+        finally:
+            _in_write_tool.reset(write_token)
+            _record_tool_call(fn.__name__, time.monotonic() - start, failed)
+    return wrapper
+
+
+# Per-tool [calls, errors, seconds] for tools wrapped by _safe_tool, reported
+# on /health. Errors count exceptions caught by the wrapper only; error dicts
+# returned by the modules themselves are normal results here.
+_tool_stats: Dict[str, List[float]] = {}
+_tool_stats_lock = threading.Lock()
+
+
+def _record_tool_call(name: str, seconds: float, failed: bool) -> None:
+    with _tool_stats_lock:
+        stats = _tool_stats.setdefault(name, [0, 0, 0.0])
+        stats[0] += 1
+        stats[1] += failed
+        stats[2] += seconds
+
+
+def tool_call_stats() -> Dict[str, Dict[str, Any]]:
+    """Snapshot of _tool_stats as {tool: {calls, errors, seconds}}."""
+    with _tool_stats_lock:
+        return {name: {"calls": calls, "errors": errors,
+                       "seconds": round(seconds, 3)}
+                for name, (calls, errors, seconds) in _tool_stats.items()}
+
+
+# Identical read-only tool calls currently running, keyed on tool name and
+# arguments.
+_tool_flight = SingleFlight()
+
+
+def _coalesce(fn):
+    """Share one cluster round trip between identical concurrent calls.
+
+    For read-only tools only; stack beneath @_safe_tool. While a call is
+    running, an identical call (same tool, same arguments) waits for its
+    result instead of issuing its own request (see SingleFlight).
+    """
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        key = fn.__name__ + json.dumps([args, kwargs], sort_keys=True, default=str)
+        return _tool_flight.do(key, fn, *args, **kwargs)
+    return wrapper
+
+
+# Resume values an LLM may send to mean "no resume token", compared lowercased
+_NULL_RESUMES = frozenset({"", "null", "none", "nil"})
+
+
+def _normalize_resume(resume: Optional[str]) -> Optional[str]:
+    """Map None and the "no resume token" spellings in _NULL_RESUMES (any case) to None."""
+    return None if resume is None or resume.lower() in _NULL_RESUMES else resume
+
+
+# Page size argument; a zero or negative limit is rejected by the tool's
+# argument schema instead of costing a PAPI round trip to fail
+_PageLimit = Annotated[int, Field(ge=1)]
+
+
+# Background threads used to fetch the next page while the current one is
+# being consumed (see _iter_pages).
+_prefetch_pool = ThreadPoolExecutor(
+    max_workers=int(os.environ.get("PREFETCH_THREADS", 8)),
+    thread_name_prefix="page-prefetch",
+)
+
+
+def _iter_pages(fetch, limit: int, resume: Optional[str]):
+    """Yield successive pages from fetch(limit=..., resume=...) until resume runs out.
+
+    Resume tokens are chained — the next token is only known once the previous
+    page has returned — so pages cannot be requested all at once. Instead the
+    next page is requested in the background as soon as its token is known,
+    while the caller is still handling the current page.
+    """
+    page = fetch(limit=limit, resume=resume)
+    while True:
+        resume = page.get("resume")
+        pending = _prefetch_pool.submit(fetch, limit=limit, resume=resume) if resume else None
+        yield page
+        if pending is None:
+            return
+        page = pending.result()
+
+
+def _drain_pages(fetch, limit: int, resume: Optional[str], key: str = "items",
+                 keep=None, max_items: Optional[int] = None) -> Dict[str, Any]:
+    """Follow resume tokens via _iter_pages and collect page[key] from every page.
+
+    keep, if given, is applied to each entry as its page arrives (e.g. a
+    fields projection). Other keys of the last page (such as "total") are
+    carried over to the result. With max_items, the drain stops after the
+    page that reaches it and returns that page's resume token, so the caller
+    can carry on from there.
+
+    A page that fails part-way through — the fetch raises, or the module
+    returns an "error" dict — ends the drain without hiding the gap: the
+    result holds the entries collected so far, the error, and the resume
+    token of the failed page with has_more True, so the caller can retry
+    from there. A failure on the very first page is passed on as it would be
+    without fetch_all: a raised exception propagates and a module's error
+    dict is returned unchanged.
+    """
+    collected = []
+    last = {}
+    pages = _iter_pages(fetch, limit, resume)
+    while True:
+        try:
+            page = next(pages)
+        except StopIteration:
+            return {**last, key: collected, "resume": None, "has_more": False}
+        except Exception as e:
+            if not last:
+                raise
+            page = {"error": str(e)}
+        if "error" in page:
+            if not last:
+                return page
+            return {**last, key: collected, "resume": resume, "has_more": True,
+                    "error": page["error"]}
+        entries = page.get(key) or []
+        collected.extend(map(keep, entries) if keep else entries)
+        last = page
+        resume = page.get("resume")
+        if max_items is not None and len(collected) >= max_items and resume:
+            return {**last, key: collected, "resume": resume, "has_more": True}
+
+
+def _finalize_page(page: Dict[str, Any], limit: int) -> Dict[str, Any]:
+    """Stamp limit and has_more onto a module's page dict in place and return it."""
+    page["limit"] = limit
+    page["has_more"] = bool(page.get("resume"))
+    return page
+
+
+def _fetch_pages(fetch, limit: int, resume: Optional[str],
+                 fetch_all: bool = False) -> Dict[str, Any]:
+    """Fetch one page via fetch(limit=..., resume=...) or, with fetch_all, every page.
+
+    Draining every page inside one tool call removes the per-page tool round
+    trip and cluster setup, and every page goes over the same cluster
+    connection pool. See _drain_pages for how a failure part-way through is
+    reported.
+    """
+    if not fetch_all:
+        # Patch the module's page dict in place rather than copying it
+        page = fetch(limit=limit, resume=resume)
+        page.setdefault("items", [])
+        return _finalize_page(page, limit)
+
+    page = _drain_pages(fetch, limit, resume)
+    page["limit"] = limit
+    return page
+
+
+def _to_columns(items: List[Dict[str, Any]]) -> Dict[str, list]:
+    """Turn a list of item dicts into one list per key (missing values are None).
+
+    Repeating every key name once per item dominates the JSON size of long
+    pages of small records; the columnar form names each key once.
+    """
+    keys = dict.fromkeys(k for item in items for k in item)
+    return {k: [item.get(k) for item in items] for k in keys}
+
+
+def _project(page: Dict[str, Any], fields: Optional[List[str]]) -> Dict[str, Any]:
+    """Cut each of page's items down to just the given keys, in place; no-op without fields."""
+    if fields:
+        page["items"] = [{k: item.get(k) for k in fields} for item in page["items"]]
+    return page
+
+
+# Minimal per-item fields returned by the getters' summary=True shortcut
+_SUMMARY_FIELDS = {
+    Nfs: ("id", "paths", "zone", "description", "read_only"),
+    S3: ("name", "path", "owner", "zone", "description"),
+    Smb: ("name", "path", "zone", "description"),
+}
+
+
+def _paginated_get(module_cls, cluster_name: Optional[str], limit: int,
+                   resume: Optional[str], fetch_all: bool = False,
+                   fields: Optional[List[str]] = None,
+                   summary: bool = False) -> Dict[str, Any]:
+    """Shared body of the plain paginated getters — module_cls(cluster).get(limit, resume).
+
+    fields (or summary, which selects _SUMMARY_FIELDS for module_cls) projects
+    each item down to just those keys before it is returned.
+    """
+    page = _fetch_pages(_get_client(module_cls, cluster_name).get, limit,
+                        _normalize_resume(resume), fetch_all)
+    if summary and not fields:
+        fields = _SUMMARY_FIELDS.get(module_cls)
+    return _project(page, fields)
 
 
 @mcp.tool()
@@ -469,14 +862,16 @@ def current_time() -> dict:
     replication jobs, or event logs with the actual server clock.
     """
     now = datetime.now().astimezone()
+    date, clock, tz, offset = now.strftime("%Y-%m-%d\t%H:%M:%S\t%Z\t%z").split("\t")
     return {
-        "date": now.strftime("%Y-%m-%d"),
-        "time": now.strftime("%H:%M:%S"),
-        "timezone": now.strftime("%Z"),
-        "gmt_offset": now.strftime("%z"),
+        "date": date,
+        "time": clock,
+        "timezone": tz,
+        "gmt_offset": offset,
     }
 
 @mcp.tool()
+@_safe_tool
 def powerscale_cluster_verify(cluster_name: str = None) -> dict:
     """
     Perform a comprehensive cluster state verification on the PowerScale (formerly Isilon) cluster.
@@ -512,15 +907,12 @@ def powerscale_cluster_verify(cluster_name: str = None) -> dict:
     - Is the cluster running low on disk space?
     """
 
-    try:
-        cluster = _get_cluster(cluster_name)
-        verifier = Verify(cluster)
-        return verifier.verify()
-
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    verifier = Verify(cluster)
+    return verifier.verify()
 
 @mcp.tool()
+@_safe_tool
 def powerscale_capacity(cluster_name: str = None) -> dict:
     """
     Return real-time storage capacity statistics for the PowerScale cluster.
@@ -553,15 +945,12 @@ def powerscale_capacity(cluster_name: str = None) -> dict:
     and multiply by 100. To calculate effective savings, use the dedupe and
     compression ratios together.
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        capacity = Capacity(cluster)
-        return capacity.get()
-
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    capacity = Capacity(cluster)
+    return capacity.get()
 
 @mcp.tool()
+@_safe_tool
 def powerscale_config(cluster_name: str = None) -> dict:
     """
     Return cluster configuration and hardware details for the PowerScale cluster.
@@ -605,19 +994,17 @@ def powerscale_config(cluster_name: str = None) -> dict:
     - What are the node pools and storage tiers?
     - What drives or partitions does each node have?
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        config = Config(cluster)
-        return config.get()
-
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    config = Config(cluster)
+    return config.get()
 
 @mcp.tool()
+@_safe_tool
 def powerscale_quota_get(
-    limit: int = 1000,
+    limit: _PageLimit = 1000,
     resume: Optional[str] = None,
     cluster_name: str = None,
+    fetch_all: bool = False,
     ) -> Dict[str, Any]:
     """
     Return quotas defined on the PowerScale cluster using pagination.
@@ -636,6 +1023,9 @@ def powerscale_quota_get(
     Arguments:
     - limit: Maximum number of quotas to return per page (default 1000)
     - resume: Resume token from a previous call (or None for first call)
+    - fetch_all: If True, follow resume tokens and return every remaining page
+      in one response (resume will be None;
+      on a failed page, error is set and resume points at it)
 
     Each quota object includes details such as:
     - path: The filesystem path the quota applies to
@@ -661,29 +1051,10 @@ def powerscale_quota_get(
     - limit: The page size used
     - has_more: True if more pages exist
     """
-    try:
-        # Normalize resume in case LLM sends "null"
-        resume = None if resume in (None, "null", "None") else resume
-
-        cluster = _get_cluster(cluster_name)
-        quotas = Quotas(cluster)
-
-        page = quotas.get(limit=limit, resume=resume)
-
-        items = page.get("items") or []
-        resume = page.get("resume")
-
-        return {
-            "items": items,
-            "resume": resume,
-            "limit": limit,
-            "has_more": bool(resume)
-        }
-
-    except Exception as e:
-        return {"error": str(e)} 
+    return _paginated_get(Quotas, cluster_name, limit, resume, fetch_all)
 
 @mcp.tool()
+@_safe_tool
 def powerscale_quota_set(path:str, size:int, cluster_name: str = None) -> str:
     """
     Set the hard quota on a PowerScale cluster path to an absolute size in bytes.
@@ -709,15 +1080,11 @@ def powerscale_quota_set(path:str, size:int, cluster_name: str = None) -> str:
 
     Returns a confirmation message describing the change made.
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        quotas = Quotas(cluster)
-        return quotas.set_hard_quota(path, size)
-
-    except Exception as e:
-        return {"error": str(e)}
+    quotas = _get_client(Quotas, cluster_name)
+    return quotas.set_hard_quota(path, size)
 
 @mcp.tool()
+@_safe_tool
 def powerscale_quota_increment(path:str, size:int, cluster_name: str = None) -> str:
     """
     Increase the hard quota on a PowerScale cluster path by a given number of bytes.
@@ -746,15 +1113,11 @@ def powerscale_quota_increment(path:str, size:int, cluster_name: str = None) ->
 
     Returns a confirmation message describing the change made.
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        quotas = Quotas(cluster)
-        return quotas.increment_hard_quota(path, size)
-
-    except Exception as e:
-        return {"error": str(e)}
+    quotas = _get_client(Quotas, cluster_name)
+    return quotas.increment_hard_quota(path, size)
 
 @mcp.tool()
+@_safe_tool
 def powerscale_quota_decrement(path:str, size:int, cluster_name: str = None) -> str:
     """
     Decrease the hard quota on a PowerScale cluster path by a given number of bytes.
@@ -787,19 +1150,16 @@ def powerscale_quota_decrement(path:str, size:int, cluster_name: str = None) ->
 
     Returns a confirmation message describing the change made.
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        quotas = Quotas(cluster)
-        return quotas.decrement_hard_quota(path, size)
-
-    except Exception as e:
-        return {"error": str(e)}
+    quotas = _get_client(Quotas, cluster_name)
+    return quotas.decrement_hard_quota(path, size)
 
 @mcp.tool()
+@_safe_tool
 def powerscale_snapshot_get(
-    limit: int = 1000,
+    limit: _PageLimit = 1000,
     resume: Optional[str] = None,
     cluster_name: str = None,
+    fetch_all: bool = False,
     ) -> Dict[str, Any]:
     """
     Returns snapshots on the PowerScale cluster using pagination.
@@ -813,6 +1173,9 @@ def powerscale_snapshot_get(
     Arguments:
     - limit: Maximum number of snapshots per page
     - resume: Resume token from a previous call (or None for first call)
+    - fetch_all: If True, follow resume tokens and return every remaining page
+      in one response (resume will be None;
+      on a failed page, error is set and resume points at it)
 
     Each snapshot object includes details such as:
     - name: The snapshot name
@@ -842,32 +1205,15 @@ def powerscale_snapshot_get(
     - resume: Resume token for the next page, or None if finished
     - has_more: True if more pages exist
     """
-    try:
-        resume = None if resume in (None, "null", "None") else resume
-
-        cluster = _get_cluster(cluster_name)
-        snapshots = Snapshots(cluster)
-
-        page = snapshots.get(limit=limit, resume=resume)
-
-        items = page.get("items") or []
-        resume = page.get("resume")
-
-        return {
-            "items": items,
-            "resume": resume,
-            "limit": limit,
-            "has_more": bool(resume)
-        }
-
-    except Exception as e:
-        return {"error": str(e)}
+    return _paginated_get(Snapshots, cluster_name, limit, resume, fetch_all)
 
 @mcp.tool()
+@_safe_tool
 def powerscale_snapshot_schedule_get(
-    limit: int = 1000,
+    limit: _PageLimit = 1000,
     resume: Optional[str] = None,
     cluster_name: str = None,
+    fetch_all: bool = False,
     ) -> Dict[str, Any]:
     """
     Returns snapshot schedules on the PowerScale cluster using pagination.
@@ -884,6 +1230,9 @@ def powerscale_snapshot_schedule_get(
     Arguments:
     - limit: Maximum number of schedules per page
     - resume: Resume token from a previous call (or None for first call)
+    - fetch_all: If True, follow resume tokens and return every remaining page
+      in one response (resume will be None;
+      on a failed page, error is set and resume points at it)
 
     Each schedule object includes details such as:
     - id: Unique schedule identifier
@@ -908,28 +1257,10 @@ def powerscale_snapshot_schedule_get(
     - resume: Resume token for the next page, or None if finished
     - has_more: True if more pages exist
     """
-    try:
-        resume = None if resume in (None, "null", "None") else resume
-
-        cluster = _get_cluster(cluster_name)
-        schedules = SnapshotSchedules(cluster)
-
-        page = schedules.get(limit=limit, resume=resume)
-
-        items = page.get("items") or []
-        resume = page.get("resume")
-
-        return {
-            "items": items,
-            "resume": resume,
-            "limit": limit,
-            "has_more": bool(resume)
-        }
-
-    except Exception as e:
-        return {"error": str(e)}
+    return _paginated_get(SnapshotSchedules, cluster_name, limit, resume, fetch_all)
 
 @mcp.tool()
+@_safe_tool
 def powerscale_synciq_get(cluster_name: str = None) -> Dict[str, Any]:
     """
     Returns all SyncIQ replication policies on the PowerScale cluster.
@@ -962,19 +1293,18 @@ def powerscale_synciq_get(cluster_name: str = None) -> Dict[str, Any]:
     Returns:
     - items: List of SyncIQ policy objects
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        synciq = SyncIQ(cluster)
-        return synciq.get()
-
-    except Exception as e:
-        return {"error": str(e)}
+    synciq = _get_client(SyncIQ, cluster_name)
+    return synciq.get()
 
 @mcp.tool()
+@_safe_tool
 def powerscale_nfs_get(
-    limit: int = 1000,
+    limit: _PageLimit = 1000,
     resume: Optional[str] = None,
+    fetch_all: bool = False,
     cluster_name: str = None,
+    fields: Optional[List[str]] = None,
+    summary: bool = False,
     ) -> Dict[str, Any]:
     """
     Returns NFS exports on the PowerScale cluster using pagination.
@@ -991,6 +1321,12 @@ def powerscale_nfs_get(
     Arguments:
     - limit: Maximum number of exports per page
     - resume: Resume token from a previous call (or None for first call)
+    - fetch_all: If True, follow resume tokens and return every remaining page
+      in one response (resume will be None;
+      on a failed page, error is set and resume points at it)
+    - fields: Only return these keys for each export (e.g. ["id", "paths"])
+    - summary: If True (and fields is not given), return only id, paths, zone,
+      description and read_only for each export
 
     Each export object includes details such as:
     - id: Unique export identifier
@@ -1019,32 +1355,18 @@ def powerscale_nfs_get(
     - resume: Resume token for the next page, or None if finished
     - has_more: True if more pages exist
     """
-    try:
-        resume = None if resume in (None, "null", "None") else resume
-
-        cluster = _get_cluster(cluster_name)
-        nfs = Nfs(cluster)
-
-        page = nfs.get(limit=limit, resume=resume)
-
-        items = page.get("items") or []
-        resume = page.get("resume")
-
-        return {
-            "items": items,
-            "resume": resume,
-            "limit": limit,
-            "has_more": bool(resume)
-        }
-
-    except Exception as e:
-        return {"error": str(e)}
+    return _paginated_get(Nfs, cluster_name, limit, resume, fetch_all,
+                          fields=fields, summary=summary)
 
 @mcp.tool()
+@_safe_tool
 def powerscale_s3_get(
-    limit: int = 1000,
+    limit: _PageLimit = 1000,
     resume: Optional[str] = None,
+    fetch_all: bool = False,
     cluster_name: str = None,
+    fields: Optional[List[str]] = None,
+    summary: bool = False,
     ) -> Dict[str, Any]:
     """
     Returns S3 buckets on the PowerScale cluster using pagination.
@@ -1061,6 +1383,12 @@ def powerscale_s3_get(
     Arguments:
     - limit: Maximum number of buckets per page
     - resume: Resume token from a previous call (or None for first call)
+    - fetch_all: If True, follow resume tokens and return every remaining page
+      in one response (resume will be None;
+      on a failed page, error is set and resume points at it)
+    - fields: Only return these keys for each bucket (e.g. ["name", "path"])
+    - summary: If True (and fields is not given), return only name, path,
+      owner, zone and description for each bucket
 
     Each bucket object includes details such as:
     - name: The bucket name (used in S3 API requests)
@@ -1085,32 +1413,18 @@ def powerscale_s3_get(
     - resume: Resume token for the next page, or None if finished
     - has_more: True if more pages exist
     """
-    try:
-        resume = None if resume in (None, "null", "None") else resume
-
-        cluster = _get_cluster(cluster_name)
-        s3 = S3(cluster)
-
-        page = s3.get(limit=limit, resume=resume)
-
-        items = page.get("items") or []
-        resume = page.get("resume")
-
-        return {
-            "items": items,
-            "resume": resume,
-            "limit": limit,
-            "has_more": bool(resume)
-        }
-
-    except Exception as e:
-        return {"error": str(e)}
+    return _paginated_get(S3, cluster_name, limit, resume, fetch_all,
+                          fields=fields, summary=summary)
 
 @mcp.tool()
+@_safe_tool
 def powerscale_smb_get(
-    limit: int = 1000,
+    limit: _PageLimit = 1000,
     resume: Optional[str] = None,
+    fetch_all: bool = False,
     cluster_name: str = None,
+    fields: Optional[List[str]] = None,
+    summary: bool = False,
     ) -> Dict[str, Any]:
     """
     Returns SMB shares on the PowerScale cluster using pagination.
@@ -1127,6 +1441,12 @@ def powerscale_smb_get(
     Arguments:
     - limit: Maximum number of shares per page
     - resume: Resume token from a previous call (or None for first call)
+    - fetch_all: If True, follow resume tokens and return every remaining page
+      in one response (resume will be None;
+      on a failed page, error is set and resume points at it)
+    - fields: Only return these keys for each share (e.g. ["name", "path"])
+    - summary: If True (and fields is not given), return only name, path, zone
+      and description for each share
 
     Each share object includes details such as:
     - name: The share name
@@ -1152,32 +1472,73 @@ def powerscale_smb_get(
     - resume: Resume token for the next page, or None if finished
     - has_more: True if more pages exist
     """
-    try:
-        resume = None if resume in (None, "null", "None") else resume
+    return _paginated_get(Smb, cluster_name, limit, resume, fetch_all,
+                          fields=fields, summary=summary)
+
+@mcp.tool()
+@_safe_tool
+def powerscale_inventory_get(cluster_name: str = None) -> Dict[str, Any]:
+    """
+    Return the cluster's protocol inventory in a single call: every NFS export,
+    SMB share and S3 bucket, plus the SMB global settings.
 
-        cluster = _get_cluster(cluster_name)
-        smb = Smb(cluster)
+    The four lookups are independent, so they are issued concurrently and the
+    call takes roughly as long as the slowest one. Each list is fetched in full
+    (all pages are followed), so no resume token is returned.
 
-        page = smb.get(limit=limit, resume=resume)
+    Response fields:
+    - nfs_exports: List of NFS export objects (same fields as powerscale_nfs_get)
+    - smb_shares: List of SMB share objects (same fields as powerscale_smb_get)
+    - s3_buckets: List of S3 bucket objects (same fields as powerscale_s3_get)
+    - smb_global_settings: SMB global settings (same as
+      powerscale_smb_global_settings_get)
 
-        items = page.get("items") or []
-        resume = page.get("resume")
+    If one lookup fails, its field holds {"error": "..."} and the others are
+    still returned.
 
-        return {
-            "items": items,
-            "resume": resume,
-            "limit": limit,
-            "has_more": bool(resume)
+    Use this tool to answer questions such as:
+    - What is shared from this cluster, over any protocol?
+    - Give me an overview of all NFS exports, SMB shares and S3 buckets
+    - Is a given path exported over NFS, SMB or S3?
+    """
+    nfs = _get_client(Nfs, cluster_name)
+    smb = _get_client(Smb, cluster_name)
+    s3 = _get_client(S3, cluster_name)
+
+    def _all_items(fetch):
+        # A drain that stopped on a failed page keeps its error next to the
+        # partial list rather than passing the list off as complete
+        page = _fetch_pages(fetch, 1000, None, fetch_all=True)
+        return page if "error" in page else page["items"]
+
+    with ThreadPoolExecutor(max_workers=4, thread_name_prefix="inventory") as pool:
+        futures = {
+            "nfs_exports": pool.submit(_all_items, nfs.get),
+            "smb_shares": pool.submit(_all_items, smb.get),
+            "s3_buckets": pool.submit(_all_items, s3.get),
+            "smb_global_settings": pool.submit(smb.get_global_settings),
         }
 
-    except Exception as e:
-        return {"error": str(e)}
+    inventory = {}
+    for key, future in futures.items():
+        try:
+            inventory[key] = future.result()
+        except Exception as e:
+            inventory[key] = {"error": str(e)}
+    return inventory
 
 # ---------------------------------------------------------------------------
 # Ansible-based create / remove tools
 # ---------------------------------------------------------------------------
 
+# Octal permission strings such as "0755"; checked by the argument schema
+# FastMCP builds when the tool is registered, before the tool body runs
+_OctalMode = Optional[Annotated[str, Field(pattern=r"^0?[0-7]{3,4}$")]]
+_DEFAULT_CA_UNIT = "seconds"
+
+
 @mcp.tool()
+@_safe_tool
 def powerscale_smb_create(
     share_name: str,
     path: str,
@@ -1191,21 +1552,21 @@ def powerscale_smb_create(
     oplocks: bool = None,
     continuously_available: bool = None,
     smb3_encryption_enabled: bool = None,
-    directory_create_mask: str = None,
-    directory_create_mode: str = None,
-    file_create_mask: str = None,
-    file_create_mode: str = None,
+    directory_create_mask: _OctalMode = None,
+    directory_create_mode: _OctalMode = None,
+    file_create_mask: _OctalMode = None,
+    file_create_mode: _OctalMode = None,
     allow_variable_expansion: bool = None,
     auto_create_directory: bool = None,
     inheritable_path_acl: bool = None,
     allow_delete_readonly: bool = None,
     allow_execute_always: bool = None,
-    ca_timeout_value: int = None,
-    ca_timeout_unit: str = None,
+    ca_timeout_value: Optional[Annotated[int, Field(ge=0)]] = None,
+    ca_timeout_unit: Optional[Literal["seconds", "minutes"]] = None,
     strict_ca_lockout: bool = None,
     ca_write_integrity: str = None,
-    change_notify: str = None,
-    impersonate_guest: str = None,
+    change_notify: Optional[Literal["all", "norecurse", "none"]] = None,
+    impersonate_guest: Optional[Literal["always", "bad user", "never"]] = None,
     impersonate_user: str = None,
     file_filtering_enabled: bool = None,
     file_filter_extension: str = None,
@@ -1295,47 +1656,47 @@ def powerscale_smb_create(
     - status: Ansible execution status ("successful" or "failed")
     - playbook_path: Path to the executed playbook (for audit)
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        smb = Smb(cluster)
-        return smb.add(
-            share_name=share_name,
-            path=path,
-            description=description,
-            access_zone=access_zone,
-            create_path=create_path,
-            browsable=browsable,
-            access_based_enumeration=access_based_enumeration,
-            access_based_enumeration_root_only=access_based_enumeration_root_only,
-            ntfs_acl_support=ntfs_acl_support,
-            oplocks=oplocks,
-            continuously_available=continuously_available,
-            smb3_encryption_enabled=smb3_encryption_enabled,
-            directory_create_mask=directory_create_mask,
-            directory_create_mode=directory_create_mode,
-            file_create_mask=file_create_mask,
-            file_create_mode=file_create_mode,
-            allow_variable_expansion=allow_variable_expansion,
-            auto_create_directory=auto_create_directory,
-            inheritable_path_acl=inheritable_path_acl,
-            allow_delete_readonly=allow_delete_readonly,
-            allow_execute_always=allow_execute_always,
-            ca_timeout={"value": ca_timeout_value, "unit": ca_timeout_unit or "seconds"} if ca_timeout_value is not None else None,
-            strict_ca_lockout=strict_ca_lockout,
-            ca_write_integrity=ca_write_integrity,
-            change_notify=change_notify,
-            impersonate_guest=impersonate_guest,
-            impersonate_user=impersonate_user,
-            file_filtering_enabled=file_filtering_enabled,
-            file_filter_extension=file_filter_extension,
-            permissions=permissions,
-            host_acls=host_acls,
-            run_as_root=run_as_root,
-        )
-    except Exception as e:
-        return {"error": str(e)}
+    smb = _get_client(Smb, cluster_name)
+    ca_timeout = None
+    if ca_timeout_value is not None:
+        ca_timeout = {"value": ca_timeout_value, "unit": ca_timeout_unit or _DEFAULT_CA_UNIT}
+    return smb.add(
+        share_name=share_name,
+        path=path,
+        description=description,
+        access_zone=access_zone,
+        create_path=create_path,
+        browsable=browsable,
+        access_based_enumeration=access_based_enumeration,
+        access_based_enumeration_root_only=access_based_enumeration_root_only,
+        ntfs_acl_support=ntfs_acl_support,
+        oplocks=oplocks,
+        continuously_available=continuously_available,
+        smb3_encryption_enabled=smb3_encryption_enabled,
+        directory_create_mask=directory_create_mask,
+        directory_create_mode=directory_create_mode,
+        file_create_mask=file_create_mask,
+        file_create_mode=file_create_mode,
+        allow_variable_expansion=allow_variable_expansion,
+        auto_create_directory=auto_create_directory,
+        inheritable_path_acl=inheritable_path_acl,
+        allow_delete_readonly=allow_delete_readonly,
+        allow_execute_always=allow_execute_always,
+        ca_timeout=ca_timeout,
+        strict_ca_lockout=strict_ca_lockout,
+        ca_write_integrity=ca_write_integrity,
+        change_notify=change_notify,
+        impersonate_guest=impersonate_guest,
+        impersonate_user=impersonate_user,
+        file_filtering_enabled=file_filtering_enabled,
+        file_filter_extension=file_filter_extension,
+        permissions=permissions,
+        host_acls=host_acls,
+        run_as_root=run_as_root,
+    )
 
 @mcp.tool()
+@_safe_tool
 def powerscale_smb_remove(share_name: str, cluster_name: str = None) -> dict:
     """
     Remove an SMB (CIFS) share from the PowerScale cluster.
@@ -1358,14 +1719,11 @@ def powerscale_smb_remove(share_name: str, cluster_name: str = None) -> dict:
     - status: Ansible execution status ("successful" or "failed")
     - playbook_path: Path to the executed playbook (for audit)
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        smb = Smb(cluster)
-        return smb.remove(share_name=share_name)
-    except Exception as e:
-        return {"error": str(e)}
+    smb = _get_client(Smb, cluster_name)
+    return smb.remove(share_name=share_name)
 
 @mcp.tool()
+@_safe_tool
 def powerscale_smb_global_settings_get(cluster_name: str = None) -> dict:
     """
     Retrieve the current SMB global settings from the PowerScale cluster.
@@ -1392,14 +1750,11 @@ def powerscale_smb_global_settings_get(cluster_name: str = None) -> dict:
     - Review SMB security settings (encryption, signing)
     - View SMB performance configuration (workers, multichannel)
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        smb = Smb(cluster)
-        return smb.get_global_settings()
-    except Exception as e:
-        return {"error": str(e)}
+    smb = _get_client(Smb, cluster_name)
+    return smb.get_global_settings()
 
 @mcp.tool()
+@_safe_tool
 def powerscale_smb_global_settings_set(
     service: bool = None,
     support_smb2: bool = None,
@@ -1456,40 +1811,46 @@ def powerscale_smb_global_settings_set(
     - Control which SMB protocol versions are supported
     - Configure SMB security (encryption, signing)
     - Tune SMB performance settings
-    """
-    try:
-        cluster = _get_cluster(cluster_name)
-        smb = Smb(cluster)
-        return smb.set_global_settings(
-            service=service,
-            support_smb2=support_smb2,
-            support_smb3_encryption=support_smb3_encryption,
-            access_based_share_enum=access_based_share_enum,
-            dot_snap_accessible_child=dot_snap_accessible_child,
-            dot_snap_accessible_root=dot_snap_accessible_root,
-            dot_snap_visible_child=dot_snap_visible_child,
-            dot_snap_visible_root=dot_snap_visible_root,
-            enable_security_signatures=enable_security_signatures,
-            require_security_signatures=require_security_signatures,
-            reject_unencrypted_access=reject_unencrypted_access,
-            server_side_copy=server_side_copy,
-            support_multichannel=support_multichannel,
-            support_netbios=support_netbios,
-            guest_user=guest_user,
-            server_string=server_string,
-            onefs_cpu_multiplier=onefs_cpu_multiplier,
-            onefs_num_workers=onefs_num_workers,
-            ignore_eas=ignore_eas,
-        )
-    except Exception as e:
-        return {"error": str(e)}
+
+    Returns:
+    - success: Boolean indicating if the settings were updated
+    - status: "successful" or "failed"
+    - updated: The settings that were sent to the cluster
+    - error: Error message (on failure only)
+    - playbook_path: Path to the rendered playbook (IAC_MODE only; nothing is
+      changed on the cluster until it is run)
+    """
+    smb = _get_client(Smb, cluster_name)
+    return smb.set_global_settings(
+        service=service,
+        support_smb2=support_smb2,
+        support_smb3_encryption=support_smb3_encryption,
+        access_based_share_enum=access_based_share_enum,
+        dot_snap_accessible_child=dot_snap_accessible_child,
+        dot_snap_accessible_root=dot_snap_accessible_root,
+        dot_snap_visible_child=dot_snap_visible_child,
+        dot_snap_visible_root=dot_snap_visible_root,
+        enable_security_signatures=enable_security_signatures,
+        require_security_signatures=require_security_signatures,
+        reject_unencrypted_access=reject_unencrypted_access,
+        server_side_copy=server_side_copy,
+        support_multichannel=support_multichannel,
+        support_netbios=support_netbios,
+        guest_user=guest_user,
+        server_string=server_string,
+        onefs_cpu_multiplier=onefs_cpu_multiplier,
+        onefs_num_workers=onefs_num_workers,
+        ignore_eas=ignore_eas,
+    )
 
 @mcp.tool()
+@_safe_tool
 def powerscale_smb_sessions_get(
-    limit: int = 1000,
+    limit: _PageLimit = 1000,
     lnn: Optional[str] = None,
     lnn_skip: Optional[str] = None,
     resume: Optional[str] = None,
+    fetch_all: bool = False,
     cluster_name: str = None,
     ) -> Dict[str, Any]:
     """
@@ -1507,8 +1868,10 @@ def powerscale_smb_sessions_get(
     Arguments:
     - limit: Maximum number of sessions per page
     - lnn: Logical node number to query (use "all" for all nodes)
-    - lnn_skip: When lnn="all", skip this specific node LNN
+    - lnn_skip: When lnn="all", skip these node LNNs (e.g. "2" or "1,3-5")
     - resume: Resume token from a previous call (or None for first call)
+    - fetch_all: Return every page in one response (resume will be None;
+      on a failed page, error is set and resume points at it)
 
     Results are organized by node. Each node entry includes:
     - lnn: Logical node number
@@ -1536,26 +1899,23 @@ def powerscale_smb_sessions_get(
     - resume: Resume token for the next page, or None if finished
     - total: Total number of sessions across all nodes
     """
-    try:
-        resume = None if resume in (None, "null", "None") else resume
+    resume = _normalize_resume(resume)
 
-        cluster = _get_cluster(cluster_name)
-        smb = Smb(cluster)
+    smb = _get_client(Smb, cluster_name)
 
-        page = smb.get_sessions(limit=limit, lnn=lnn, lnn_skip=lnn_skip, resume=resume)
+    fetch = functools.partial(smb.get_sessions, lnn=lnn, lnn_skip=lnn_skip)
+    if not fetch_all:
+        page = fetch(limit=limit, resume=resume)
         if "error" in page:
             return page
+        return _finalize_page(page, limit)
 
-        return {
-            "nodes": page.get("nodes", []),
-            "resume": page.get("resume"),
-            "total": page.get("total"),
-            "has_more": bool(page.get("resume")),
-        }
-    except Exception as e:
-        return {"error": str(e)}
+    # Node entries are collected as each page lands while the next page is
+    # already being fetched in the background
+    return _drain_pages(fetch, limit, resume, key="nodes")
 
 @mcp.tool()
+@_safe_tool
 def powerscale_smb_session_close(session_id: str, cluster_name: str = None) -> Dict[str, Any]:
     """
     Closes (forcibly terminates) an active SMB session by session ID.
@@ -1573,14 +1933,11 @@ def powerscale_smb_session_close(session_id: str, cluster_name: str = None) -> D
     - success: True if the session was closed
     - message: Confirmation message
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        smb = Smb(cluster)
-        return smb.delete_session(session_id)
-    except Exception as e:
-        return {"error": str(e)}
+    smb = _get_client(Smb, cluster_name)
+    return smb.delete_session(session_id)
 
 @mcp.tool()
+@_safe_tool
 def powerscale_smb_sessions_close_by_user(
     computer: str,
     user: str,
@@ -1603,16 +1960,13 @@ def powerscale_smb_sessions_close_by_user(
     - success: True if sessions were closed
     - message: Confirmation message
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        smb = Smb(cluster)
-        return smb.delete_sessions_by_user(computer=computer, user=user)
-    except Exception as e:
-        return {"error": str(e)}
+    smb = _get_client(Smb, cluster_name)
+    return smb.delete_sessions_by_user(computer=computer, user=user)
 
 @mcp.tool()
+@_safe_tool
 def powerscale_smb_openfiles_get(
-    limit: int = 1000,
+    limit: _PageLimit = 1000,
     resume: Optional[str] = None,
     sort: Optional[str] = None,
     dir: Optional[str] = None,
@@ -1655,26 +2009,17 @@ def powerscale_smb_openfiles_get(
     - total: Total number of open files
     - has_more: True if more pages exist
     """
-    try:
-        resume = None if resume in (None, "null", "None") else resume
-
-        cluster = _get_cluster(cluster_name)
-        smb = Smb(cluster)
+    resume = _normalize_resume(resume)
 
-        page = smb.get_openfiles(limit=limit, resume=resume, sort=sort, dir=dir)
-        if "error" in page:
-            return page
+    smb = _get_client(Smb, cluster_name)
 
-        return {
-            "items": page.get("items", []),
-            "resume": page.get("resume"),
-            "total": page.get("total"),
-            "has_more": bool(page.get("resume")),
-        }
-    except Exception as e:
-        return {"error": str(e)}
+    page = smb.get_openfiles(limit=limit, resume=resume, sort=sort, dir=dir)
+    if "error" in page:
+        return page
+    return _finalize_page(page, limit)
 
 @mcp.tool()
+@_safe_tool
 def powerscale_smb_openfile_close(openfile_id: str, cluster_name: str = None) -> Dict[str, Any]:
     """
     Closes (forcibly terminates) an open SMB file handle by ID.
@@ -1692,14 +2037,46 @@ def powerscale_smb_openfile_close(openfile_id: str, cluster_name: str = None) ->
     - success: True if the file handle was closed
     - message: Confirmation message
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        smb = Smb(cluster)
-        return smb.delete_openfile(openfile_id)
-    except Exception as e:
-        return {"error": str(e)}
+    smb = _get_client(Smb, cluster_name)
+    return smb.delete_openfile(openfile_id)
+
+# Splits "a, b ,c" into ["a", "b", "c"] in one C-level pass; callers strip
+# the ends first
+_CSV_SPLIT = re.compile(r"\s*,\s*").split
+
+# Accepted keys and value types of the map_root / map_non_root JSON objects
+_USER_MAPPING_FIELDS = {
+    "enabled": bool,
+    "user": str,
+    "primary_group": str,
+    "secondary_groups": list,
+}
+
+
+def _parse_user_mapping(raw: str, arg_name: str) -> dict:
+    """Decode a map_root/map_non_root JSON string and check its shape.
+
+    The result is rendered straight into the playbook, so a wrong type or an
+    unknown key is rejected here with a ValueError naming the argument rather
+    than producing a malformed playbook.
+    """
+    mapping = _json_loads(raw)
+    if not isinstance(mapping, dict):
+        raise ValueError(f"{arg_name} must be a JSON object")
+    for key, value in mapping.items():
+        expected = _USER_MAPPING_FIELDS.get(key)
+        if expected is None:
+            raise ValueError(f"{arg_name}: unknown field '{key}'")
+        if not isinstance(value, expected):
+            raise ValueError(f"{arg_name}.{key} must be of type {expected.__name__}")
+    for group in mapping.get("secondary_groups", ()):
+        if not isinstance(group, dict) or not isinstance(group.get("name"), str):
+            raise ValueError(f"{arg_name}.secondary_groups entries need a string 'name'")
+    return mapping
+
 
 @mcp.tool()
+@_safe_tool
 def powerscale_nfs_create(
     path: str,
     access_zone: str = "System",
@@ -1798,49 +2175,46 @@ def powerscale_nfs_create(
     - status: Ansible execution status ("successful" or "failed")
     - playbook_path: Path to the executed playbook (for audit)
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        nfs = Nfs(cluster)
-
-        # Parse basic client list
-        clients_list = [c.strip() for c in clients.split(",")] if clients else None
-
-        # Parse Phase 1 - Client Management lists
-        read_only_clients_list = [c.strip() for c in read_only_clients.split(",")] if read_only_clients else None
-        read_write_clients_list = [c.strip() for c in read_write_clients.split(",")] if read_write_clients else None
-        root_clients_list = [c.strip() for c in root_clients.split(",")] if root_clients else None
-
-        # Parse Phase 2 - Security flavors list
-        security_flavors_list = [f.strip() for f in security_flavors.split(",")] if security_flavors else None
-
-        # Parse Phase 3 & 4 - User mapping JSON
-        map_root_dict = json.loads(map_root) if map_root else None
-        map_non_root_dict = json.loads(map_non_root) if map_non_root else None
-
-        return nfs.add(
-            path=path,
-            access_zone=access_zone,
-            description=description,
-            clients=clients_list,
-            read_only=read_only,
-            # Phase 1
-            client_state=client_state,
-            read_only_clients=read_only_clients_list,
-            read_write_clients=read_write_clients_list,
-            root_clients=root_clients_list,
-            # Phase 2
-            security_flavors=security_flavors_list,
-            sub_directories_mountable=sub_directories_mountable,
-            # Phase 3
-            map_root=map_root_dict,
-            # Phase 4
-            map_non_root=map_non_root_dict,
-            ignore_unresolvable_hosts=ignore_unresolvable_hosts
-        )
-    except Exception as e:
-        return {"error": str(e)}
+    nfs = _get_client(Nfs, cluster_name)
+
+    # Parse basic client list
+    clients_list = _CSV_SPLIT(clients.strip()) if clients else None
+
+    # Parse Phase 1 - Client Management lists
+    read_only_clients_list = _CSV_SPLIT(read_only_clients.strip()) if read_only_clients else None
+    read_write_clients_list = _CSV_SPLIT(read_write_clients.strip()) if read_write_clients else None
+    root_clients_list = _CSV_SPLIT(root_clients.strip()) if root_clients else None
+
+    # Parse Phase 2 - Security flavors list
+    security_flavors_list = _CSV_SPLIT(security_flavors.strip()) if security_flavors else None
+
+    # Parse Phase 3 & 4 - User mapping JSON
+    map_root_dict = _parse_user_mapping(map_root, "map_root") if map_root else None
+    map_non_root_dict = _parse_user_mapping(map_non_root, "map_non_root") if map_non_root else None
+
+    return nfs.add(
+        path=path,
+        access_zone=access_zone,
+        description=description,
+        clients=clients_list,
+        read_only=read_only,
+        # Phase 1
+        client_state=client_state,
+        read_only_clients=read_only_clients_list,
+        read_write_clients=read_write_clients_list,
+        root_clients=root_clients_list,
+        # Phase 2
+        security_flavors=security_flavors_list,
+        sub_directories_mountable=sub_directories_mountable,
+        # Phase 3
+        map_root=map_root_dict,
+        # Phase 4
+        map_non_root=map_non_root_dict,
+        ignore_unresolvable_hosts=ignore_unresolvable_hosts
+    )
 
 @mcp.tool()
+@_safe_tool
 def powerscale_nfs_remove(path: str, access_zone: str = "System", cluster_name: str = None) -> dict:
     """
     Remove an NFS export from the PowerScale cluster.
@@ -1864,14 +2238,11 @@ def powerscale_nfs_remove(path: str, access_zone: str = "System", cluster_name:
     - status: Ansible execution status ("successful" or "failed")
     - playbook_path: Path to the executed playbook (for audit)
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        nfs = Nfs(cluster)
-        return nfs.remove(path=path, access_zone=access_zone)
-    except Exception as e:
-        return {"error": str(e)}
+    nfs = _get_client(Nfs, cluster_name)
+    return nfs.remove(path=path, access_zone=access_zone)
 
 @mcp.tool()
+@_safe_tool
 def powerscale_nfs_global_settings_get(cluster_name: str = None) -> dict:
     """
     Retrieve the current NFS global settings from the PowerScale cluster.
@@ -1896,14 +2267,11 @@ def powerscale_nfs_global_settings_get(cluster_name: str = None) -> dict:
     - Review NFS performance configuration (thread pools)
     - Check RDMA and rquota status
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        nfs = Nfs(cluster)
-        return nfs.get_global_settings()
-    except Exception as e:
-        return {"error": str(e)}
+    nfs = _get_client(Nfs, cluster_name)
+    return nfs.get_global_settings()
 
 @mcp.tool()
+@_safe_tool
 def powerscale_nfs_global_settings_set(
     service: bool = None,
     nfsv3_enabled: bool = None,
@@ -1945,45 +2313,43 @@ def powerscale_nfs_global_settings_set(
     - Tune NFS thread pool sizes
     - Enable or disable RDMA and rquota
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        nfs = Nfs(cluster)
-
-        # Build nfsv3 dict if any v3 params are set
-        nfsv3 = None
-        if nfsv3_enabled is not None or nfsv3_rdma_enabled is not None:
-            nfsv3 = {}
-            if nfsv3_enabled is not None:
-                nfsv3["nfsv3_enabled"] = nfsv3_enabled
-            if nfsv3_rdma_enabled is not None:
-                nfsv3["nfsv3_rdma_enabled"] = nfsv3_rdma_enabled
-
-        # Build nfsv4 dict if any v4 params are set
-        nfsv4 = None
-        if any(v is not None for v in [nfsv4_enabled, nfsv40_enabled, nfsv41_enabled, nfsv42_enabled]):
-            nfsv4 = {}
-            if nfsv4_enabled is not None:
-                nfsv4["nfsv4_enabled"] = nfsv4_enabled
-            if nfsv40_enabled is not None:
-                nfsv4["nfsv40_enabled"] = nfsv40_enabled
-            if nfsv41_enabled is not None:
-                nfsv4["nfsv41_enabled"] = nfsv41_enabled
-            if nfsv42_enabled is not None:
-                nfsv4["nfsv42_enabled"] = nfsv42_enabled
-
-        return nfs.set_global_settings(
-            service=service,
-            nfsv3=nfsv3,
-            nfsv4=nfsv4,
-            rpc_maxthreads=rpc_maxthreads,
-            rpc_minthreads=rpc_minthreads,
-            rquota_enabled=rquota_enabled,
-            nfs_rdma_enabled=nfs_rdma_enabled,
-        )
-    except Exception as e:
-        return {"error": str(e)}
+    nfs = _get_client(Nfs, cluster_name)
+
+    # Build nfsv3 dict if any v3 params are set
+    nfsv3 = None
+    if nfsv3_enabled is not None or nfsv3_rdma_enabled is not None:
+        nfsv3 = {}
+        if nfsv3_enabled is not None:
+            nfsv3["nfsv3_enabled"] = nfsv3_enabled
+        if nfsv3_rdma_enabled is not None:
+            nfsv3["nfsv3_rdma_enabled"] = nfsv3_rdma_enabled
+
+    # Build nfsv4 dict if any v4 params are set
+    nfsv4 = None
+    if (nfsv4_enabled is not None or nfsv40_enabled is not None
+            or nfsv41_enabled is not None or nfsv42_enabled is not None):
+        nfsv4 = {}
+        if nfsv4_enabled is not None:
+            nfsv4["nfsv4_enabled"] = nfsv4_enabled
+        if nfsv40_enabled is not None:
+            nfsv4["nfsv40_enabled"] = nfsv40_enabled
+        if nfsv41_enabled is not None:
+            nfsv4["nfsv41_enabled"] = nfsv41_enabled
+        if nfsv42_enabled is not None:
+            nfsv4["nfsv42_enabled"] = nfsv42_enabled
+
+    return nfs.set_global_settings(
+        service=service,
+        nfsv3=nfsv3,
+        nfsv4=nfsv4,
+        rpc_maxthreads=rpc_maxthreads,
+        rpc_minthreads=rpc_minthreads,
+        rquota_enabled=rquota_enabled,
+        nfs_rdma_enabled=nfs_rdma_enabled,
+    )
 
 @mcp.tool()
+@_safe_tool
 def powerscale_s3_create(s3_bucket_name: str, path: str, owner: str = "root",
                          description: str = None, create_path: bool = None,
                          cluster_name: str = None) -> dict:
@@ -2015,15 +2381,12 @@ def powerscale_s3_create(s3_bucket_name: str, path: str, owner: str = "root",
     - status: Ansible execution status ("successful" or "failed")
     - playbook_path: Path to the executed playbook (for audit)
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        s3 = S3(cluster)
-        return s3.add(s3_bucket_name=s3_bucket_name, path=path, owner=owner,
-                      description=description, create_path=create_path)
-    except Exception as e:
-        return {"error": str(e)}
+    s3 = _get_client(S3, cluster_name)
+    return s3.add(s3_bucket_name=s3_bucket_name, path=path, owner=owner,
+                  description=description, create_path=create_path)
 
 @mcp.tool()
+@_safe_tool
 def powerscale_s3_remove(s3_bucket_name: str, cluster_name: str = None) -> dict:
     """
     Remove an S3 bucket from the PowerScale cluster.
@@ -2046,14 +2409,11 @@ def powerscale_s3_remove(s3_bucket_name: str, cluster_name: str = None) -> dict:
     - status: Ansible execution status ("successful" or "failed")
     - playbook_path: Path to the executed playbook (for audit)
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        s3 = S3(cluster)
-        return s3.remove(s3_bucket_name=s3_bucket_name)
-    except Exception as e:
-        return {"error": str(e)}
+    s3 = _get_client(S3, cluster_name)
+    return s3.remove(s3_bucket_name=s3_bucket_name)
 
 @mcp.tool()
+@_safe_tool
 def powerscale_snapshot_schedule_create(name: str, path: str, schedule: str,
                                         pattern: str = None, duration: str = None,
                                         alias: str = None,
@@ -2121,17 +2481,14 @@ def powerscale_snapshot_schedule_create(name: str, path: str, schedule: str,
     - status: Ansible execution status ("successful" or "failed")
     - playbook_path: Path to the executed playbook (for audit)
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        schedules = SnapshotSchedules(cluster)
-        desired_retention = int(duration) if duration else None
-        return schedules.add(name=name, path=path, schedule=schedule,
-                             pattern=pattern, desired_retention=desired_retention,
-                             alias=alias)
-    except Exception as e:
-        return {"error": str(e)}
+    schedules = _get_client(SnapshotSchedules, cluster_name)
+    desired_retention = int(duration) if duration else None
+    return schedules.add(name=name, path=path, schedule=schedule,
+                         pattern=pattern, desired_retention=desired_retention,
+                         alias=alias)
 
 @mcp.tool()
+@_safe_tool
 def powerscale_snapshot_schedule_remove(name: str, cluster_name: str = None) -> dict:
     """
     Remove a snapshot schedule from the PowerScale cluster.
@@ -2155,14 +2512,11 @@ def powerscale_snapshot_schedule_remove(name: str, cluster_name: str = None) ->
     - status: Ansible execution status ("successful" or "failed")
     - playbook_path: Path to the executed playbook (for audit)
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        schedules = SnapshotSchedules(cluster)
-        return schedules.remove(name=name)
-    except Exception as e:
-        return {"error": str(e)}
+    schedules = _get_client(SnapshotSchedules, cluster_name)
+    return schedules.remove(name=name)
 
 @mcp.tool()
+@_safe_tool
 def powerscale_snapshot_create(path: str, snapshot_name: str = None, alias: str = None,
                                 desired_retention: int = None, retention_unit: str = "hours",
                                 expiration_timestamp: str = None,
@@ -2203,17 +2557,14 @@ def powerscale_snapshot_create(path: str, snapshot_name: str = None, alias: str
     - status: Ansible execution status ("successful" or "failed")
     - playbook_path: Path to the executed playbook (for audit)
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        snapshots = Snapshots(cluster)
-        return snapshots.create(path=path, snapshot_name=snapshot_name, alias=alias,
-                               desired_retention=desired_retention,
-                               retention_unit=retention_unit,
-                               expiration_timestamp=expiration_timestamp)
-    except Exception as e:
-        return {"error": str(e)}
+    snapshots = _get_client(Snapshots, cluster_name)
+    return snapshots.create(path=path, snapshot_name=snapshot_name, alias=alias,
+                           desired_retention=desired_retention,
+                           retention_unit=retention_unit,
+                           expiration_timestamp=expiration_timestamp)
 
 @mcp.tool()
+@_safe_tool
 def powerscale_snapshot_delete(snapshot_name: str, cluster_name: str = None) -> dict:
     """
     Delete a snapshot from the PowerScale cluster.
@@ -2241,17 +2592,16 @@ def powerscale_snapshot_delete(snapshot_name: str, cluster_name: str = None) ->
     - status: Ansible execution status ("successful" or "failed")
     - playbook_path: Path to the executed playbook (for audit)
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        snapshots = Snapshots(cluster)
-        return snapshots.delete(snapshot_name=snapshot_name)
-    except Exception as e:
-        return {"error": str(e)}
+    snapshots = _get_client(Snapshots, cluster_name)
+    return snapshots.delete(snapshot_name=snapshot_name)
 
 @mcp.tool()
+@_safe_tool
 def powerscale_snapshot_pending_get(begin: int = None, end: int = None,
-                                    schedule: str = None, limit: int = 1000,
+                                    schedule: str = None, limit: _PageLimit = 1000,
                                     resume: str = None,
+                                    fetch_all: bool = False,
+                                    columnar: bool = False,
                                     cluster_name: str = None) -> Dict[str, Any]:
     """
     Return a list of snapshots scheduled to be created in the future.
@@ -2275,6 +2625,12 @@ def powerscale_snapshot_pending_get(begin: int = None, end: int = None,
       snapshots for that specific schedule will be returned.
     - limit: Maximum number of pending snapshots to return per page (default: 1000)
     - resume: Resume token from a previous call (or None for first call)
+    - fetch_all: If True, follow resume tokens and return every remaining page
+      in one response (resume will be None;
+      on a failed page, error is set and resume points at it)
+    - columnar: If True, return items as one list per field (e.g.
+      {"snapshot": [...], "path": [...], "time": [...], "schedule": [...]})
+      instead of one object per pending snapshot; smaller for long pages
 
     Each pending snapshot object includes:
     - snapshot: The name that will be assigned to the snapshot
@@ -2294,30 +2650,21 @@ def powerscale_snapshot_pending_get(begin: int = None, end: int = None,
     - resume: Resume token for the next page, or None if finished
     - has_more: True if more pages exist
     """
-    try:
-        # Normalize resume in case LLM sends "null"
-        resume = None if resume in (None, "null", "None") else resume
-
-        cluster = _get_cluster(cluster_name)
-        snapshots = Snapshots(cluster)
-
-        page = snapshots.get_pending(begin=begin, end=end, schedule=schedule,
-                                     limit=limit, resume=resume)
+    # Normalize resume in case LLM sends "null"
+    resume = _normalize_resume(resume)
 
-        items = page.get("items") or []
-        resume_token = page.get("resume")
-
-        return {
-            "items": items,
-            "resume": resume_token,
-            "limit": limit,
-            "has_more": bool(resume_token)
-        }
+    snapshots = _get_client(Snapshots, cluster_name)
 
-    except Exception as e:
-        return {"error": str(e)}
+    # begin/end/schedule are applied by the cluster on every page
+    fetch = functools.partial(snapshots.get_pending, begin=begin, end=end,
+                              schedule=schedule)
+    page = _fetch_pages(fetch, limit, resume, fetch_all)
+    if columnar:
+        page["items"] = _to_columns(page["items"])
+    return page
 
 @mcp.tool()
+@_safe_tool
 def powerscale_snapshot_alias_create(name: str, target: str, cluster_name: str = None) -> dict:
     """
     Create an alias pointing to an existing snapshot.
@@ -2347,14 +2694,11 @@ def powerscale_snapshot_alias_create(name: str, target: str, cluster_name: str =
     - message: Confirmation message
     - id: The alias ID if available
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        snapshots = Snapshots(cluster)
-        return snapshots.create_alias(name=name, target=target)
-    except Exception as e:
-        return {"error": str(e)}
+    snapshots = _get_client(Snapshots, cluster_name)
+    return snapshots.create_alias(name=name, target=target)
 
 @mcp.tool()
+@_safe_tool
 def powerscale_snapshot_alias_get(alias_id: str, cluster_name: str = None) -> dict:
     """
     Get information about a snapshot alias.
@@ -2382,14 +2726,11 @@ def powerscale_snapshot_alias_get(alias_id: str, cluster_name: str = None) -> di
     - alias: Dictionary with alias details (name, target, etc.)
     - error: Error message if the alias was not found
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        snapshots = Snapshots(cluster)
-        return snapshots.get_alias(alias_id=alias_id)
-    except Exception as e:
-        return {"error": str(e)}
+    snapshots = _get_client(Snapshots, cluster_name)
+    return snapshots.get_alias(alias_id=alias_id)
 
 @mcp.tool()
+@_safe_tool
 def powerscale_synciq_create(policy_name: str, source_path: str,
                               target_host: str, target_path: str,
                               action: str = "sync", schedule: str = None,
@@ -2429,17 +2770,14 @@ def powerscale_synciq_create(policy_name: str, source_path: str,
     - status: Ansible execution status ("successful" or "failed")
     - playbook_path: Path to the executed playbook (for audit)
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        synciq = SyncIQ(cluster)
-        return synciq.add(policy_name=policy_name, source_path=source_path,
-                          target_host=target_host, target_path=target_path,
-                          action=action, schedule=schedule, description=description,
-                          enabled=enabled)
-    except Exception as e:
-        return {"error": str(e)}
+    synciq = _get_client(SyncIQ, cluster_name)
+    return synciq.add(policy_name=policy_name, source_path=source_path,
+                      target_host=target_host, target_path=target_path,
+                      action=action, schedule=schedule, description=description,
+                      enabled=enabled)
 
 @mcp.tool()
+@_safe_tool
 def powerscale_synciq_remove(policy_name: str, cluster_name: str = None) -> dict:
     """
     Remove a SyncIQ replication policy from the PowerScale cluster.
@@ -2462,19 +2800,18 @@ def powerscale_synciq_remove(policy_name: str, cluster_name: str = None) -> dict
     - status: Ansible execution status ("successful" or "failed")
     - playbook_path: Path to the executed playbook (for audit)
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        synciq = SyncIQ(cluster)
-        return synciq.remove(policy_name=policy_name)
-    except Exception as e:
-        return {"error": str(e)}
+    synciq = _get_client(SyncIQ, cluster_name)
+    return synciq.remove(policy_name=policy_name)
 
 # ============================================================================
 # DataMover Policy Management Tools
 # ============================================================================
 
 @mcp.tool()
-def powerscale_datamover_policy_get(limit: int = 1000, resume: str = None, cluster_name: str = None) -> Dict[str, Any]:
+@_safe_tool
+def powerscale_datamover_policy_get(limit: _PageLimit = 1000, resume: str = None, fetch_all: bool = False,
+                                    cluster_name: str = None,
+                                    fields: Optional[List[str]] = None) -> Dict[str, Any]:
     """
     Returns a paginated list of DataMover policies on the PowerScale cluster.
 
@@ -2485,6 +2822,11 @@ def powerscale_datamover_policy_get(limit: int = 1000, resume: str = None, clust
     Arguments:
     - limit: Maximum number of policies to return (default 1000)
     - resume: Resume token from previous call for pagination (optional)
+    - fetch_all: If True, follow resume tokens and return every remaining page
+      in one response (resume will be None;
+      on a failed page, error is set and resume points at it)
+    - fields: Only return these keys for each policy (e.g. ["id", "name", "enabled"]
+      to list policy names)
 
     Use this tool when the user wants to:
     - List all DataMover policies
@@ -2500,16 +2842,12 @@ def powerscale_datamover_policy_get(limit: int = 1000, resume: str = None, clust
     For example, after the first call returns a resume token, call again with that
     token to get the next batch of results.
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        datamover = DataMover(cluster)
-        # Normalize resume token (handle "null", "None", None)
-        resume = None if resume in (None, "null", "None") else resume
-        return datamover.get_policies(limit=limit, resume=resume)
-    except Exception as e:
-        return {"error": str(e)}
+    datamover = _get_client(DataMover, cluster_name)
+    resume = _normalize_resume(resume)
+    return _project(_fetch_pages(datamover.get_policies, limit, resume, fetch_all), fields)
 
 @mcp.tool()
+@_safe_tool
 def powerscale_datamover_policy_get_by_id(policy_id: str, cluster_name: str = None) -> Dict[str, Any]:
     """
     Retrieves detailed information about a specific DataMover policy by ID or name.
@@ -2532,14 +2870,63 @@ def powerscale_datamover_policy_get_by_id(policy_id: str, cluster_name: str = No
     - policy: Complete policy object with all configuration details
     - error: Error message if the operation failed
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        datamover = DataMover(cluster)
-        return datamover.get_policy(policy_id=policy_id)
-    except Exception as e:
-        return {"error": str(e)}
+    datamover = _get_client(DataMover, cluster_name)
+    return datamover.get_policy(policy_id=policy_id)
+
+
+def _get_many(get_one, ids: List[str], key: str) -> Dict[str, Any]:
+    """Look up several ids concurrently with get_one(id) and merge the results.
+
+    get_one returns {"success": True, key: obj} or an error dict. Found objects
+    are returned under "items" keyed by id; failures are listed in "errors".
+    """
+    ids = list(dict.fromkeys(ids))
+    items: Dict[str, Any] = {}
+    errors: List[Dict[str, Any]] = []
+    if not ids:
+        return {"items": items, "errors": errors}
+    with ThreadPoolExecutor(max_workers=min(16, len(ids)),
+                            thread_name_prefix="get-many") as ex:
+        futures = {i: ex.submit(get_one, i) for i in ids}
+    for i, future in futures.items():
+        try:
+            result = future.result()
+        except Exception as e:
+            errors.append({"id": i, "error": str(e)})
+            continue
+        if result.get("success"):
+            items[i] = result.get(key)
+        else:
+            errors.append({"id": i, "error": result.get("error")})
+    return {"items": items, "errors": errors}
+
 
 @mcp.tool()
+@_safe_tool
+def powerscale_datamover_policy_get_many(policy_ids: List[str], cluster_name: str = None) -> Dict[str, Any]:
+    """
+    Retrieves several DataMover policies by ID or name in one call.
+
+    The policies are looked up concurrently, so checking the schedule,
+    priority or base policy of N data movement policies costs about one round
+    trip instead of N calls to powerscale_datamover_policy_get.
+
+    Arguments:
+    - policy_ids: List of policy names or IDs to retrieve
+
+    Use this tool when the user wants to:
+    - See which of several policies are enabled, and when each one runs
+    - Check the policies named in a request before running or deleting them
+
+    Returns:
+    - items: Object mapping each found policy ID/name to its full policy object
+    - errors: List of {"id", "error"} entries for policies that could not be retrieved
+    """
+    datamover = _get_client(DataMover, cluster_name)
+    return _get_many(datamover.get_policy, policy_ids, "policy")
+
+@mcp.tool()
+@_safe_tool
 def powerscale_datamover_policy_create(name: str, base_policy_id: int = None,
                                        enabled: bool = None, priority: str = None,
                                        run_now: bool = None, schedule: str = None,
@@ -2574,16 +2961,88 @@ def powerscale_datamover_policy_create(name: str, base_policy_id: int = None,
     Note: DataMover policies require a base policy to define the data movement operation.
     Use base_policy_id to reference an existing base policy, or the policy may use defaults.
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        datamover = DataMover(cluster)
-        return datamover.create_policy(name=name, base_policy_id=base_policy_id,
-                                       enabled=enabled, priority=priority,
-                                       run_now=run_now, schedule=schedule)
-    except Exception as e:
-        return {"error": str(e)}
+    datamover = _get_client(DataMover, cluster_name)
+    return datamover.create_policy(name=name, base_policy_id=base_policy_id,
+                                   enabled=enabled, priority=priority,
+                                   run_now=run_now, schedule=schedule)
+
+# Keys a bulk create spec may carry: the single-create tool's arguments
+# without cluster_name
+_POLICY_SPEC_KEYS = frozenset(
+    ("name", "base_policy_id", "enabled", "priority", "run_now", "schedule"))
+_ACCOUNT_SPEC_KEYS = frozenset(
+    ("name", "account_type", "uri", "briefcase", "enforce_sse",
+     "local_network_pool", "max_sparks", "remote_network_pool", "storage_class"))
+
+
+def _create_many(create_one, specs: List[Dict[str, Any]], key: str,
+                 allowed: frozenset) -> Dict[str, Any]:
+    """Run create_one(**spec) for each spec concurrently and split the outcomes.
+
+    Results are reported in input order: successful create results under
+    "created", and {key: spec, "error": ...} entries under "failed". A spec
+    with keys outside allowed fails without being sent, since create_one
+    would otherwise pass them on to the cluster.
+    """
+    created: List[Dict[str, Any]] = []
+    failed: List[Dict[str, Any]] = []
+    if not specs:
+        return {"created": created, "failed": failed}
+    rejected = {}
+    for i, spec in enumerate(specs):
+        if not isinstance(spec, dict):
+            rejected[i] = f"{key} must be an object"
+        elif not allowed.issuperset(spec):
+            rejected[i] = "unknown keys: " + ", ".join(sorted(set(spec) - allowed))
+    with ThreadPoolExecutor(max_workers=min(8, len(specs)),
+                            thread_name_prefix="create-many") as ex:
+        futures = [None if i in rejected else ex.submit(create_one, **spec)
+                   for i, spec in enumerate(specs)]
+    for i, (spec, future) in enumerate(zip(specs, futures)):
+        if future is None:
+            failed.append({key: spec, "error": rejected[i]})
+            continue
+        try:
+            result = future.result()
+        except Exception as e:
+            failed.append({key: spec, "error": str(e)})
+            continue
+        if result.get("success"):
+            created.append(result)
+        else:
+            failed.append({key: spec, "error": result.get("error")})
+    return {"created": created, "failed": failed}
+
 
 @mcp.tool()
+@_safe_tool
+def powerscale_datamover_policy_create_bulk(policies: List[Dict[str, Any]],
+                                            cluster_name: str = None) -> Dict[str, Any]:
+    """
+    Create several DataMover policies on the PowerScale cluster in one call.
+
+    IMPORTANT: This is a MUTATING operation that creates new data movement policies
+    on the live cluster. Always confirm the full list of policies with the user
+    before calling this tool.
+
+    Arguments:
+    - policies: List of policy objects, each taking the same keys as
+      powerscale_datamover_policy_create (name is required; base_policy_id,
+      enabled, priority, run_now, schedule are optional)
+
+    The creates run concurrently, so setting up N related policies costs about
+    one round trip instead of N separate tool calls. Each policy succeeds or
+    fails on its own; one failure does not roll back the others.
+
+    Returns:
+    - created: Result of each successful create (message and id)
+    - failed: List of {"policy", "error"} entries for policies that were not created
+    """
+    datamover = _get_client(DataMover, cluster_name)
+    return _create_many(datamover.create_policy, policies, "policy", _POLICY_SPEC_KEYS)
+
+@mcp.tool()
+@_safe_tool
 def powerscale_datamover_policy_delete(policy_id: str, cluster_name: str = None) -> dict:
     """
     Delete a DataMover policy from the PowerScale cluster.
@@ -2606,14 +3065,11 @@ def powerscale_datamover_policy_delete(policy_id: str, cluster_name: str = None)
     - success: Boolean indicating if the policy was deleted
     - message: Success or error message
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        datamover = DataMover(cluster)
-        return datamover.delete_policy(policy_id=policy_id)
-    except Exception as e:
-        return {"error": str(e)}
+    datamover = _get_client(DataMover, cluster_name)
+    return datamover.delete_policy(policy_id=policy_id)
 
 @mcp.tool()
+@_safe_tool
 def powerscale_datamover_policy_last_job(policy_id: str, cluster_name: str = None) -> dict:
     """
     Retrieve the last job information for a specific DataMover policy.
@@ -2637,19 +3093,18 @@ def powerscale_datamover_policy_last_job(policy_id: str, cluster_name: str = Non
     - last_job: Object containing job ID and execution timestamp
     - error: Error message if the operation failed
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        datamover = DataMover(cluster)
-        return datamover.get_policy_last_job(policy_id=policy_id)
-    except Exception as e:
-        return {"error": str(e)}
+    datamover = _get_client(DataMover, cluster_name)
+    return datamover.get_policy_last_job(policy_id=policy_id)
 
 # ============================================================================
 # DataMover Account Management Tools
 # ============================================================================
 
 @mcp.tool()
-def powerscale_datamover_account_get(limit: int = 1000, resume: str = None, cluster_name: str = None) -> Dict[str, Any]:
+@_safe_tool
+def powerscale_datamover_account_get(limit: _PageLimit = 1000, resume: str = None, fetch_all: bool = False,
+                                     cluster_name: str = None,
+                                     fields: Optional[List[str]] = None) -> Dict[str, Any]:
     """
     Returns a paginated list of DataMover accounts on the PowerScale cluster.
 
@@ -2661,6 +3116,11 @@ def powerscale_datamover_account_get(limit: int = 1000, resume: str = None, clus
     Arguments:
     - limit: Maximum number of accounts to return (default 1000)
     - resume: Resume token from previous call for pagination (optional)
+    - fetch_all: If True, follow resume tokens and return every remaining page
+      in one response (resume will be None;
+      on a failed page, error is set and resume points at it)
+    - fields: Only return these keys for each account (e.g. ["id", "name", "account_type"]
+      to list account names)
 
     Use this tool when the user wants to:
     - List all DataMover accounts
@@ -2672,16 +3132,12 @@ def powerscale_datamover_account_get(limit: int = 1000, resume: str = None, clus
     - items: List of DataMover account objects with full details
     - resume: Token for fetching the next page (None if last page)
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        datamover = DataMover(cluster)
-        # Normalize resume token (handle "null", "None", None)
-        resume = None if resume in (None, "null", "None") else resume
-        return datamover.get_accounts(limit=limit, resume=resume)
-    except Exception as e:
-        return {"error": str(e)}
+    datamover = _get_client(DataMover, cluster_name)
+    resume = _normalize_resume(resume)
+    return _project(_fetch_pages(datamover.get_accounts, limit, resume, fetch_all), fields)
 
 @mcp.tool()
+@_safe_tool
 def powerscale_datamover_account_get_by_id(account_id: str, cluster_name: str = None) -> Dict[str, Any]:
     """
     Retrieves detailed information about a specific DataMover account by ID or name.
@@ -2704,14 +3160,34 @@ def powerscale_datamover_account_get_by_id(account_id: str, cluster_name: str =
     - account: Complete account object with all configuration details
     - error: Error message if the operation failed
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        datamover = DataMover(cluster)
-        return datamover.get_account(account_id=account_id)
-    except Exception as e:
-        return {"error": str(e)}
+    datamover = _get_client(DataMover, cluster_name)
+    return datamover.get_account(account_id=account_id)
 
 @mcp.tool()
+@_safe_tool
+def powerscale_datamover_account_get_many(account_ids: List[str], cluster_name: str = None) -> Dict[str, Any]:
+    """
+    Retrieves several DataMover accounts by ID or name in one call.
+
+    The lookups run concurrently against the cluster, so fetching N accounts
+    costs about one round trip instead of N separate tool calls.
+
+    Arguments:
+    - account_ids: List of account names or IDs to retrieve
+
+    Use this tool when the user wants to:
+    - Compare the configuration of several known accounts
+    - Inspect every account mentioned in a request at once
+
+    Returns:
+    - items: Object mapping each found account ID/name to its full account object
+    - errors: List of {"id", "error"} entries for accounts that could not be retrieved
+    """
+    datamover = _get_client(DataMover, cluster_name)
+    return _get_many(datamover.get_account, account_ids, "account")
+
+@mcp.tool()
+@_safe_tool
 def powerscale_datamover_account_create(name: str, account_type: str, uri: str,
                                         briefcase: str = None, enforce_sse: bool = None,
                                         local_network_pool: str = None, max_sparks: int = None,
@@ -2750,19 +3226,44 @@ def powerscale_datamover_account_create(name: str, account_type: str, uri: str,
     Note: Credentials should be configured separately or passed via the briefcase parameter.
     Different account types (S3, NFS, local) have different URI formats and requirements.
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        datamover = DataMover(cluster)
-        return datamover.create_account(name=name, account_type=account_type, uri=uri,
-                                        briefcase=briefcase, enforce_sse=enforce_sse,
-                                        local_network_pool=local_network_pool,
-                                        max_sparks=max_sparks,
-                                        remote_network_pool=remote_network_pool,
-                                        storage_class=storage_class)
-    except Exception as e:
-        return {"error": str(e)}
+    datamover = _get_client(DataMover, cluster_name)
+    return datamover.create_account(name=name, account_type=account_type, uri=uri,
+                                    briefcase=briefcase, enforce_sse=enforce_sse,
+                                    local_network_pool=local_network_pool,
+                                    max_sparks=max_sparks,
+                                    remote_network_pool=remote_network_pool,
+                                    storage_class=storage_class)
+
+@mcp.tool()
+@_safe_tool
+def powerscale_datamover_account_create_bulk(accounts: List[Dict[str, Any]],
+                                             cluster_name: str = None) -> Dict[str, Any]:
+    """
+    Create several DataMover accounts on the PowerScale cluster in one call.
+
+    IMPORTANT: This is a MUTATING operation that creates new data storage accounts
+    on the live cluster. Always confirm the full list of accounts with the user
+    before calling this tool.
+
+    Arguments:
+    - accounts: List of account objects, each taking the same keys as
+      powerscale_datamover_account_create (name, account_type and uri are
+      required; briefcase, enforce_sse, local_network_pool, max_sparks,
+      remote_network_pool, storage_class are optional)
+
+    The creates run concurrently, so setting up N accounts costs about one
+    round trip instead of N separate tool calls. Each account succeeds or
+    fails on its own; one failure does not roll back the others.
+
+    Returns:
+    - created: Result of each successful create (message and id)
+    - failed: List of {"account", "error"} entries for accounts that were not created
+    """
+    datamover = _get_client(DataMover, cluster_name)
+    return _create_many(datamover.create_account, accounts, "account", _ACCOUNT_SPEC_KEYS)
 
 @mcp.tool()
+@_safe_tool
 def powerscale_datamover_account_delete(account_id: str, cluster_name: str = None) -> dict:
     """
     Delete a DataMover account from the PowerScale cluster.
@@ -2788,19 +3289,17 @@ def powerscale_datamover_account_delete(account_id: str, cluster_name: str = Non
     Warning: Deleting an account that is referenced by existing policies will cause those
     policies to fail. Always check policy dependencies before deleting accounts.
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        datamover = DataMover(cluster)
-        return datamover.delete_account(account_id=account_id)
-    except Exception as e:
-        return {"error": str(e)}
+    datamover = _get_client(DataMover, cluster_name)
+    return datamover.delete_account(account_id=account_id)
 
 # ============================================================================
 # DataMover Base Policy Management Tools
 # ============================================================================
 
 @mcp.tool()
-def powerscale_datamover_base_policy_get(limit: int = 1000, resume: str = None, cluster_name: str = None) -> Dict[str, Any]:
+@_safe_tool
+def powerscale_datamover_base_policy_get(limit: _PageLimit = 1000, resume: str = None, fetch_all: bool = False,
+                                         cluster_name: str = None) -> Dict[str, Any]:
     """
     Returns a paginated list of DataMover base policies on the PowerScale cluster.
 
@@ -2812,6 +3311,9 @@ def powerscale_datamover_base_policy_get(limit: int = 1000, resume: str = None,
     Arguments:
     - limit: Maximum number of base policies to return (default 1000)
     - resume: Resume token from previous call for pagination (optional)
+    - fetch_all: If True, follow resume tokens and return every remaining page
+      in one response (resume will be None;
+      on a failed page, error is set and resume points at it)
 
     Use this tool when the user wants to:
     - List all DataMover base policies
@@ -2823,16 +3325,12 @@ def powerscale_datamover_base_policy_get(limit: int = 1000, resume: str = None,
     - items: List of DataMover base policy objects with full details
     - resume: Token for fetching the next page (None if last page)
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        datamover = DataMover(cluster)
-        # Normalize resume token (handle "null", "None", None)
-        resume = None if resume in (None, "null", "None") else resume
-        return datamover.get_base_policies(limit=limit, resume=resume)
-    except Exception as e:
-        return {"error": str(e)}
+    datamover = _get_client(DataMover, cluster_name)
+    resume = _normalize_resume(resume)
+    return _fetch_pages(datamover.get_base_policies, limit, resume, fetch_all)
 
 @mcp.tool()
+@_safe_tool
 def powerscale_datamover_base_policy_get_by_id(base_policy_id: str, cluster_name: str = None) -> Dict[str, Any]:
     """
     Retrieves detailed information about a specific DataMover base policy by ID or name.
@@ -2855,14 +3353,11 @@ def powerscale_datamover_base_policy_get_by_id(base_policy_id: str, cluster_name
     - base_policy: Complete base policy object with all configuration details
     - error: Error message if the operation failed
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        datamover = DataMover(cluster)
-        return datamover.get_base_policy(base_policy_id=base_policy_id)
-    except Exception as e:
-        return {"error": str(e)}
+    datamover = _get_client(DataMover, cluster_name)
+    return datamover.get_base_policy(base_policy_id=base_policy_id)
 
 @mcp.tool()
+@_safe_tool
 def powerscale_datamover_base_policy_create(name: str, enabled: bool = None, priority: str = None,
                                             source_account_id: str = None, source_base_path: str = None,
                                             target_account_id: str = None, target_base_path: str = None,
@@ -2898,18 +3393,15 @@ def powerscale_datamover_base_policy_create(name: str, enabled: bool = None, pri
     Note: Base policies serve as templates. Create concrete policies that reference
     the base policy ID to inherit its configuration.
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        datamover = DataMover(cluster)
-        return datamover.create_base_policy(name=name, enabled=enabled, priority=priority,
-                                           source_account_id=source_account_id,
-                                           source_base_path=source_base_path,
-                                           target_account_id=target_account_id,
-                                           target_base_path=target_base_path)
-    except Exception as e:
-        return {"error": str(e)}
+    datamover = _get_client(DataMover, cluster_name)
+    return datamover.create_base_policy(name=name, enabled=enabled, priority=priority,
+                                       source_account_id=source_account_id,
+                                       source_base_path=source_base_path,
+                                       target_account_id=target_account_id,
+                                       target_base_path=target_base_path)
 
 @mcp.tool()
+@_safe_tool
 def powerscale_datamover_base_policy_delete(base_policy_id: str, cluster_name: str = None) -> dict:
     """
     Delete a DataMover base policy from the PowerScale cluster.
@@ -2936,18 +3428,18 @@ def powerscale_datamover_base_policy_delete(base_policy_id: str, cluster_name: s
     Warning: Ensure no active policies are depending on this base policy before deletion.
     Deleting a base policy that is referenced by existing policies may cause issues.
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        datamover = DataMover(cluster)
-        return datamover.delete_base_policy(base_policy_id=base_policy_id)
-    except Exception as e:
-        return {"error": str(e)}
+    datamover = _get_client(DataMover, cluster_name)
+    return datamover.delete_base_policy(base_policy_id=base_policy_id)
 
 # ---------------------------------------------------------------------------
 # FilePool policy tools
 # ---------------------------------------------------------------------------
 
+_DataAccessPattern = Optional[Literal["random", "concurrency", "streaming"]]
+_WritePerfOptimization = Optional[Literal["enable_smartcache", "disable_smartcache"]]
+
 @mcp.tool()
+@_safe_tool
 def powerscale_filepool_policy_get(cluster_name: str = None) -> Dict[str, Any]:
     """
     Returns all FilePool policies on the PowerScale cluster.
@@ -2983,14 +3475,11 @@ def powerscale_filepool_policy_get(cluster_name: str = None) -> Dict[str, Any]:
     - items: List of all FilePool policy objects
     - total: Total number of policies
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        filepool = FilePool(cluster)
-        return filepool.get()
-    except Exception as e:
-        return {"error": str(e)}
+    filepool = _get_client(FilePool, cluster_name)
+    return filepool.get()
 
 @mcp.tool()
+@_safe_tool
 def powerscale_filepool_policy_get_by_name(policy_id: str, cluster_name: str = None) -> Dict[str, Any]:
     """
     Retrieve detailed information about a specific FilePool policy by name or ID.
@@ -3011,14 +3500,11 @@ def powerscale_filepool_policy_get_by_name(policy_id: str, cluster_name: str = N
     - policy: Complete policy object with all configuration details
     - error: Error message if the policy was not found
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        filepool = FilePool(cluster)
-        return filepool.get_policy(policy_id=policy_id)
-    except Exception as e:
-        return {"error": str(e)}
+    filepool = _get_client(FilePool, cluster_name)
+    return filepool.get_policy(policy_id=policy_id)
 
 @mcp.tool()
+@_safe_tool
 def powerscale_filepool_default_policy_get(cluster_name: str = None) -> Dict[str, Any]:
     """
     Return the system default FilePool policy on the PowerScale cluster.
@@ -3036,14 +3522,11 @@ def powerscale_filepool_default_policy_get(cluster_name: str = None) -> Dict[str
     - success: Boolean indicating if the operation succeeded
     - default_policy: The default policy object with actions and settings
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        filepool = FilePool(cluster)
-        return filepool.get_default_policy()
-    except Exception as e:
-        return {"error": str(e)}
+    filepool = _get_client(FilePool, cluster_name)
+    return filepool.get_default_policy()
 
 @mcp.tool()
+@_safe_tool
 def powerscale_filepool_policy_create(
     policy_name: str,
     file_matching_pattern: str,
@@ -3052,8 +3535,8 @@ def powerscale_filepool_policy_create(
     apply_data_storage_policy: str = None,
     apply_snapshot_storage_policy: str = None,
     set_requested_protection: str = None,
-    set_data_access_pattern: str = None,
-    set_write_performance_optimization: str = None,
+    set_data_access_pattern: _DataAccessPattern = None,
+    set_write_performance_optimization: _WritePerfOptimization = None,
     cluster_name: str = None,
 ) -> dict:
     """
@@ -3130,24 +3613,21 @@ def powerscale_filepool_policy_create(
     - status: Ansible execution status ("successful" or "failed")
     - playbook_path: Path to the executed playbook (for audit)
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        filepool = FilePool(cluster)
-        return filepool.create(
-            policy_name=policy_name,
-            file_matching_pattern=file_matching_pattern,
-            description=description,
-            apply_order=apply_order,
-            apply_data_storage_policy=apply_data_storage_policy,
-            apply_snapshot_storage_policy=apply_snapshot_storage_policy,
-            set_requested_protection=set_requested_protection,
-            set_data_access_pattern=set_data_access_pattern,
-            set_write_performance_optimization=set_write_performance_optimization,
-        )
-    except Exception as e:
-        return {"error": str(e)}
+    filepool = _get_client(FilePool, cluster_name)
+    return filepool.create(
+        policy_name=policy_name,
+        file_matching_pattern=file_matching_pattern,
+        description=description,
+        apply_order=apply_order,
+        apply_data_storage_policy=apply_data_storage_policy,
+        apply_snapshot_storage_policy=apply_snapshot_storage_policy,
+        set_requested_protection=set_requested_protection,
+        set_data_access_pattern=set_data_access_pattern,
+        set_write_performance_optimization=set_write_performance_optimization,
+    )
 
 @mcp.tool()
+@_safe_tool
 def powerscale_filepool_policy_update(
     policy_id: str,
     description: str = None,
@@ -3156,8 +3636,8 @@ def powerscale_filepool_policy_update(
     apply_data_storage_policy: str = None,
     apply_snapshot_storage_policy: str = None,
     set_requested_protection: str = None,
-    set_data_access_pattern: str = None,
-    set_write_performance_optimization: str = None,
+    set_data_access_pattern: _DataAccessPattern = None,
+    set_write_performance_optimization: _WritePerfOptimization = None,
     cluster_name: str = None,
 ) -> dict:
     """
@@ -3197,24 +3677,21 @@ def powerscale_filepool_policy_update(
     - success: Boolean indicating if the update succeeded
     - message: Success or error message
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        filepool = FilePool(cluster)
-        return filepool.update(
-            policy_id=policy_id,
-            description=description,
-            apply_order=apply_order,
-            file_matching_pattern=file_matching_pattern,
-            apply_data_storage_policy=apply_data_storage_policy,
-            apply_snapshot_storage_policy=apply_snapshot_storage_policy,
-            set_requested_protection=set_requested_protection,
-            set_data_access_pattern=set_data_access_pattern,
-            set_write_performance_optimization=set_write_performance_optimization,
-        )
-    except Exception as e:
-        return {"error": str(e)}
+    filepool = _get_client(FilePool, cluster_name)
+    return filepool.update(
+        policy_id=policy_id,
+        description=description,
+        apply_order=apply_order,
+        file_matching_pattern=file_matching_pattern,
+        apply_data_storage_policy=apply_data_storage_policy,
+        apply_snapshot_storage_policy=apply_snapshot_storage_policy,
+        set_requested_protection=set_requested_protection,
+        set_data_access_pattern=set_data_access_pattern,
+        set_write_performance_optimization=set_write_performance_optimization,
+    )
 
 @mcp.tool()
+@_safe_tool
 def powerscale_filepool_policy_remove(policy_name: str, cluster_name: str = None) -> dict:
     """
     Remove a FilePool policy from the PowerScale cluster.
@@ -3235,20 +3712,20 @@ def powerscale_filepool_policy_remove(policy_name: str, cluster_name: str = None
 
     Returns:
     - success: Boolean indicating if the policy was removed
-    - status: Ansible execution status ("successful" or "failed")
-    - playbook_path: Path to the executed playbook (for audit)
+    - status: Execution status ("successful" or "failed")
+    - playbook_path: Path to the executed playbook (IAC_MODE only, for audit)
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        filepool = FilePool(cluster)
-        return filepool.delete(policy_name=policy_name)
-    except Exception as e:
-        return {"error": str(e)}
+    filepool = _get_client(FilePool, cluster_name)
+    return filepool.delete(policy_name=policy_name)
+
+_QuotaType = Literal["hard", "soft", "advisory"]
+
 
 @mcp.tool()
-def powerscale_quota_create(path: str, quota_type: str, limit_size: str,
+@_safe_tool
+def powerscale_quota_create(path: str, quota_type: _QuotaType, limit_size: str,
                              soft_grace_period: str = None,
-                             soft_grace_period_unit: str = "days",
+                             soft_grace_period_unit: Literal["hours", "days", "weeks", "months"] = "days",
                              include_overheads: bool = False,
                              persona: str = None,
                              cluster_name: str = None) -> dict:
@@ -3290,22 +3767,19 @@ def powerscale_quota_create(path: str, quota_type: str, limit_size: str,
     - status: Ansible execution status ("successful" or "failed")
     - playbook_path: Path to the executed playbook (for audit)
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        quotas = Quotas(cluster)
-        return quotas.add_quota(path=path, quota_type=quota_type,
-                                limit_size=limit_size,
-                                soft_grace_period=soft_grace_period,
-                                soft_grace_period_unit=soft_grace_period_unit,
-                                include_overheads=include_overheads,
-                                persona=persona)
-    except Exception as e:
-        return {"error": str(e)}
+    quotas = _get_client(Quotas, cluster_name)
+    return quotas.add_quota(path=path, quota_type=quota_type,
+                            limit_size=limit_size,
+                            soft_grace_period=soft_grace_period,
+                            soft_grace_period_unit=soft_grace_period_unit,
+                            include_overheads=include_overheads,
+                            persona=persona)
 
 @mcp.tool()
-def powerscale_quota_remove(path: str, quota_type: str, cluster_name: str = None) -> dict:
+@_safe_tool
+def powerscale_quota_remove(path: str, quota_type: _QuotaType, cluster_name: str = None) -> dict:
     """
-    Remove a quota from the PowerScale cluster using Ansible automation.
+    Remove a quota from the PowerScale cluster.
 
     IMPORTANT: This is a MUTATING operation that removes a quota from the live
     cluster. Always confirm the path and quota type with the user before calling
@@ -3323,31 +3797,32 @@ def powerscale_quota_remove(path: str, quota_type: str, cluster_name: str = None
 
     Returns:
     - success: Boolean indicating if the quota was removed
-    - status: Ansible execution status ("successful" or "failed")
-    - playbook_path: Path to the executed playbook (for audit)
+    - status: Execution status ("successful" or "failed")
+    - playbook_path: Path to the executed playbook (IAC_MODE only, for audit)
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        quotas = Quotas(cluster)
-        return quotas.remove_quota(path=path, quota_type=quota_type)
-    except Exception as e:
-        return {"error": str(e)}
+    quotas = _get_client(Quotas, cluster_name)
+    return quotas.remove_quota(path=path, quota_type=quota_type)
 
 # ---------------------------------------------------------------------------
 # Namespace / file management tools
 # ---------------------------------------------------------------------------
 
 @mcp.tool()
+@_safe_tool
+@_coalesce
 def powerscale_directory_list(
     path: str,
     detail: str = 'default',
-    limit: int = 1000,
+    limit: _PageLimit = 1000,
     resume: Optional[str] = None,
     sort: Optional[str] = None,
-    dir: Optional[str] = None,
+    dir: Optional[Literal["ASC", "DESC"]] = None,
     type: Optional[str] = None,
     hidden: bool = False,
     access_point: Optional[str] = None,
+    fetch_all: bool = False,
+    max_items: _PageLimit = 100000,
+    fields: Optional[List[str]] = None,
     cluster_name: str = None,
 ) -> Dict[str, Any]:
     """
@@ -3377,6 +3852,14 @@ def powerscale_directory_list(
     - hidden: If True, include hidden files/directories (names starting with .)
     - access_point: If set, use access-point addressing. The path becomes
       relative to the access point instead of the root namespace.
+    - fetch_all: If True, follow resume tokens and return every remaining
+      entry in one response (resume will be None; on a failed page, error
+      is set and resume points at it).
+    - max_items: With fetch_all, stop once this many entries have been
+      collected (default 100000) and return the resume token to continue
+      from.
+    - fields: Only return these keys for each entry (e.g. ["name", "type"] to
+      scan file names). Combine with fetch_all to keep large scans small.
 
     Use this tool to answer questions such as:
     - What files are in this directory?
@@ -3394,19 +3877,26 @@ def powerscale_directory_list(
     - resume: Resume token for the next page, or None if finished
     - has_more: True if more pages exist
     """
-    try:
-        resume = None if resume in (None, "null", "None") else resume
-
-        cluster = _get_cluster(cluster_name)
-        fm = FileMgmt(cluster)
-        return fm.list_directory(
-            path=path, detail=detail, limit=limit, resume=resume,
-            sort=sort, dir=dir, type=type, hidden=hidden,
-            access_point=access_point)
-    except Exception as e:
-        return {"error": str(e)}
+    resume = _normalize_resume(resume)
+
+    fm = _get_client(FileMgmt, cluster_name)
+    fetch = functools.partial(
+        fm.list_directory, path=path, detail=detail, sort=sort, dir=dir,
+        type=type, hidden=hidden, access_point=access_point)
+    if not fetch_all:
+        page = fetch(limit=limit, resume=resume)
+        if fields:
+            page["children"] = [{k: c.get(k) for k in fields} for c in page["children"]]
+        return page
+
+    # Project each page as it arrives so only one page of full entries
+    # is held at a time
+    keep = (lambda c: {k: c.get(k) for k in fields}) if fields else None
+    return _drain_pages(fetch, limit, resume, key="children", keep=keep,
+                        max_items=max_items)
 
 @mcp.tool()
+@_safe_tool
 def powerscale_directory_attributes(path: str, cluster_name: str = None) -> Dict[str, Any]:
     """
     Get attribute information for a directory on the PowerScale cluster.
@@ -3428,14 +3918,11 @@ def powerscale_directory_attributes(path: str, cluster_name: str = None) -> Dict
     - A dict of HTTP header key-value pairs containing directory attributes
       such as Last-Modified, Content-Type, and x-isi-ifs-target-type.
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        fm = FileMgmt(cluster)
-        return fm.get_directory_attributes(path=path)
-    except Exception as e:
-        return {"error": str(e)}
+    fm = _get_client(FileMgmt, cluster_name)
+    return fm.get_directory_attributes(path=path)
 
 @mcp.tool()
+@_safe_tool
 def powerscale_directory_create(
     path: str,
     recursive: bool = True,
@@ -3470,16 +3957,13 @@ def powerscale_directory_create(
     - success: Boolean indicating if the directory was created
     - message: Human-readable confirmation
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        fm = FileMgmt(cluster)
-        return fm.create_directory(
-            path=path, recursive=recursive, access_control=access_control,
-            overwrite=overwrite, access_point=access_point)
-    except Exception as e:
-        return {"error": str(e)}
+    fm = _get_client(FileMgmt, cluster_name)
+    return fm.create_directory(
+        path=path, recursive=recursive, access_control=access_control,
+        overwrite=overwrite, access_point=access_point)
 
 @mcp.tool()
+@_safe_tool
 def powerscale_directory_delete(
     path: str,
     recursive: bool = False,
@@ -3513,15 +3997,12 @@ def powerscale_directory_delete(
     - success: Boolean indicating if the directory was deleted
     - message: Human-readable confirmation
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        fm = FileMgmt(cluster)
-        return fm.delete_directory(
-            path=path, recursive=recursive, access_point=access_point)
-    except Exception as e:
-        return {"error": str(e)}
+    fm = _get_client(FileMgmt, cluster_name)
+    return fm.delete_directory(
+        path=path, recursive=recursive, access_point=access_point)
 
 @mcp.tool()
+@_safe_tool
 def powerscale_directory_move(
     path: str,
     destination: str,
@@ -3552,15 +4033,12 @@ def powerscale_directory_move(
     - success: Boolean indicating if the directory was moved
     - message: Human-readable confirmation
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        fm = FileMgmt(cluster)
-        return fm.move_directory(
-            path=path, destination=destination, access_point=access_point)
-    except Exception as e:
-        return {"error": str(e)}
+    fm = _get_client(FileMgmt, cluster_name)
+    return fm.move_directory(
+        path=path, destination=destination, access_point=access_point)
 
 @mcp.tool()
+@_safe_tool
 def powerscale_directory_copy(
     source: str,
     destination: str,
@@ -3599,16 +4077,13 @@ def powerscale_directory_copy(
     - errors: List of any copy errors encountered
     - message: Human-readable confirmation
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        fm = FileMgmt(cluster)
-        return fm.copy_directory(
-            source=source, destination=destination, overwrite=overwrite,
-            merge=merge, continue_on_error=continue_on_error)
-    except Exception as e:
-        return {"error": str(e)}
+    fm = _get_client(FileMgmt, cluster_name)
+    return fm.copy_directory(
+        source=source, destination=destination, overwrite=overwrite,
+        merge=merge, continue_on_error=continue_on_error)
 
 @mcp.tool()
+@_safe_tool
 def powerscale_file_read(
     path: str,
     byte_range: Optional[str] = None,
@@ -3618,10 +4093,11 @@ def powerscale_file_read(
     Read the contents of a file on the PowerScale cluster filesystem.
 
     Retrieves the full text contents of a file. This tool is designed for
-    text files. Binary files will be returned with lossy encoding. File
-    streaming is NOT supported — the entire file must fit in memory.
+    text files. Contents that are not valid UTF-8 (binary files) are
+    returned base64-encoded, with encoding set to "base64".
 
-    Contents are truncated at 1 MiB to avoid overwhelming the LLM context.
+    Contents are truncated at 1 MiB to avoid overwhelming the LLM context;
+    only the first 1 MiB of a larger file is transferred from the cluster.
     For larger files, use the byte_range parameter to read specific portions.
 
     Arguments:
@@ -3637,7 +4113,8 @@ def powerscale_file_read(
     - Show me what's in this log file
 
     Response fields:
-    - contents: The file contents as text
+    - contents: The file contents as text, or base64 for binary files
+    - encoding: "utf-8" or "base64" — how contents is encoded
     - size: Total file size in bytes
     - truncated: True if contents were truncated due to size limit
     - headers: HTTP response headers with file metadata
@@ -3648,14 +4125,11 @@ def powerscale_file_read(
     - truncated: Whether the content was truncated
     - headers: Response headers with metadata
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        fm = FileMgmt(cluster)
-        return fm.get_file_contents(path=path, byte_range=byte_range)
-    except Exception as e:
-        return {"error": str(e)}
+    fm = _get_client(FileMgmt, cluster_name)
+    return fm.get_file_contents(path=path, byte_range=byte_range)
 
 @mcp.tool()
+@_safe_tool
 def powerscale_file_attributes(path: str, cluster_name: str = None) -> Dict[str, Any]:
     """
     Get attribute information for a file on the PowerScale cluster.
@@ -3679,14 +4153,39 @@ def powerscale_file_attributes(path: str, cluster_name: str = None) -> Dict[str,
       such as Content-Length, Last-Modified, Content-Type, and
       x-isi-ifs-target-type.
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        fm = FileMgmt(cluster)
-        return fm.get_file_attributes(path=path)
-    except Exception as e:
-        return {"error": str(e)}
+    fm = _get_client(FileMgmt, cluster_name)
+    return fm.get_file_attributes(path=path)
 
 @mcp.tool()
+@_safe_tool
+def powerscale_file_attributes_get_many(paths: List[str], cluster_name: str = None) -> Dict[str, Any]:
+    """
+    Get attribute information for several files on the PowerScale cluster in one call.
+
+    The lookups run concurrently against the cluster, so checking N files
+    costs about one round trip instead of N separate tool calls.
+
+    Arguments:
+    - paths: List of file paths relative to / (e.g. ["ifs/data/a.txt",
+      "ifs/data/b.txt"]). Do NOT include a leading slash.
+
+    Use this tool when you need to:
+    - Get the sizes of several files at once
+    - Check which of a list of files exist
+    - Compare last-modified times across files
+
+    Returns:
+    - items: Object mapping each found path to its attribute headers
+      (Content-Length, Last-Modified, Content-Type, x-isi-ifs-target-type, ...)
+    - errors: List of {"id", "error"} entries for paths that could not be read
+    """
+    fm = _get_client(FileMgmt, cluster_name)
+    return _get_many(
+        lambda p: {"success": True, "attributes": fm.get_file_attributes(path=p)},
+        paths, "attributes")
+
+@mcp.tool()
+@_safe_tool
 def powerscale_file_create(
     path: str,
     contents: str = '',
@@ -3724,16 +4223,13 @@ def powerscale_file_create(
     - success: Boolean indicating if the file was created
     - message: Human-readable confirmation
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        fm = FileMgmt(cluster)
-        return fm.create_file(
-            path=path, contents=contents, access_control=access_control,
-            content_type=content_type, overwrite=overwrite)
-    except Exception as e:
-        return {"error": str(e)}
+    fm = _get_client(FileMgmt, cluster_name)
+    return fm.create_file(
+        path=path, contents=contents, access_control=access_control,
+        content_type=content_type, overwrite=overwrite)
 
 @mcp.tool()
+@_safe_tool
 def powerscale_file_delete(path: str, cluster_name: str = None) -> dict:
     """
     Delete a file from the PowerScale cluster filesystem.
@@ -3754,14 +4250,11 @@ def powerscale_file_delete(path: str, cluster_name: str = None) -> dict:
     - success: Boolean indicating if the file was deleted
     - message: Human-readable confirmation
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        fm = FileMgmt(cluster)
-        return fm.delete_file(path=path)
-    except Exception as e:
-        return {"error": str(e)}
+    fm = _get_client(FileMgmt, cluster_name)
+    return fm.delete_file(path=path)
 
 @mcp.tool()
+@_safe_tool
 def powerscale_file_move(
     path: str,
     destination: str,
@@ -3792,14 +4285,11 @@ def powerscale_file_move(
     - success: Boolean indicating if the file was moved
     - message: Human-readable confirmation
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        fm = FileMgmt(cluster)
-        return fm.move_file(path=path, destination=destination)
-    except Exception as e:
-        return {"error": str(e)}
+    fm = _get_client(FileMgmt, cluster_name)
+    return fm.move_file(path=path, destination=destination)
 
 @mcp.tool()
+@_safe_tool
 def powerscale_file_copy(
     source: str,
     destination: str,
@@ -3841,16 +4331,14 @@ def powerscale_file_copy(
     - errors: List of any copy errors encountered
     - message: Human-readable confirmation
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        fm = FileMgmt(cluster)
-        return fm.copy_file(
-            source=source, destination=destination, overwrite=overwrite,
-            clone=clone, snapshot=snapshot)
-    except Exception as e:
-        return {"error": str(e)}
+    fm = _get_client(FileMgmt, cluster_name)
+    return fm.copy_file(
+        source=source, destination=destination, overwrite=overwrite,
+        clone=clone, snapshot=snapshot)
 
 @mcp.tool()
+@_safe_tool
+@_coalesce
 def powerscale_acl_get(
     path: str,
     zone: Optional[str] = None,
@@ -3885,14 +4373,11 @@ def powerscale_acl_get(
     Returns:
     - Full ACL dict with acl entries, owner, group, mode, and authoritative
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        fm = FileMgmt(cluster)
-        return fm.get_acl(path=path, zone=zone)
-    except Exception as e:
-        return {"error": str(e)}
+    fm = _get_client(FileMgmt, cluster_name)
+    return fm.get_acl(path=path, zone=zone)
 
 @mcp.tool()
+@_safe_tool
 def powerscale_acl_set(
     path: str,
     mode: Optional[str] = None,
@@ -3940,27 +4425,22 @@ def powerscale_acl_set(
     - success: Boolean indicating if the ACL was set
     - message: Human-readable confirmation
     """
-    try:
-        acl_list = None
-        if acl:
-            acl_list = json.loads(acl)
-
-        # Auto-detect authoritative type based on what's being set.
-        # OneFS requires 'authoritative' for all ACL set operations.
-        authoritative = "mode"  # default to mode for owner/group changes
-        if acl_list is not None:
-            authoritative = "acl"
-
-        cluster = _get_cluster(cluster_name)
-        fm = FileMgmt(cluster)
-        return fm.set_acl(
-            path=path, mode=mode, owner=owner, group=group,
-            acl=acl_list, action=action, authoritative=authoritative,
-            zone=zone)
-    except Exception as e:
-        return {"error": str(e)}
+    acl_list = _json_loads(acl) if acl else None
+
+    # Auto-detect authoritative type based on what's being set.
+    # OneFS requires 'authoritative' for all ACL set operations; owner/group
+    # changes without an ACL use "mode".
+    authoritative = "acl" if acl_list is not None else "mode"
+
+    fm = _get_client(FileMgmt, cluster_name)
+    return fm.set_acl(
+        path=path, mode=mode, owner=owner, group=group,
+        acl=acl_list, action=action, authoritative=authoritative,
+        zone=zone)
 
 @mcp.tool()
+@_safe_tool
+@_coalesce
 def powerscale_metadata_get(
     path: str,
     is_directory: bool = True,
@@ -3991,14 +4471,11 @@ def powerscale_metadata_get(
     Returns:
     - attrs: List of metadata attribute dicts
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        fm = FileMgmt(cluster)
-        return fm.get_metadata(path=path, is_directory=is_directory, zone=zone)
-    except Exception as e:
-        return {"error": str(e)}
+    fm = _get_client(FileMgmt, cluster_name)
+    return fm.get_metadata(path=path, is_directory=is_directory, zone=zone)
 
 @mcp.tool()
+@_safe_tool
 def powerscale_metadata_set(
     path: str,
     attrs: str,
@@ -4035,18 +4512,16 @@ def powerscale_metadata_set(
     - success: Boolean indicating if metadata was set
     - message: Human-readable confirmation
     """
-    try:
-        attrs_list = json.loads(attrs)
+    attrs_list = _json_loads(attrs)
 
-        cluster = _get_cluster(cluster_name)
-        fm = FileMgmt(cluster)
-        return fm.set_metadata(
-            path=path, attrs=attrs_list, action=action,
-            is_directory=is_directory, zone=zone)
-    except Exception as e:
-        return {"error": str(e)}
+    fm = _get_client(FileMgmt, cluster_name)
+    return fm.set_metadata(
+        path=path, attrs=attrs_list, action=action,
+        is_directory=is_directory, zone=zone)
 
 @mcp.tool()
+@_safe_tool
+@_coalesce
 def powerscale_access_point_list(
     versions: bool = False,
     cluster_name: str = None,
@@ -4068,14 +4543,11 @@ def powerscale_access_point_list(
     Returns:
     - namespaces: List of access point objects with path and name information
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        fm = FileMgmt(cluster)
-        return fm.list_access_points(versions=versions)
-    except Exception as e:
-        return {"error": str(e)}
+    fm = _get_client(FileMgmt, cluster_name)
+    return fm.list_access_points(versions=versions)
 
 @mcp.tool()
+@_safe_tool
 def powerscale_access_point_create(
     name: str,
     path: str,
@@ -4102,14 +4574,11 @@ def powerscale_access_point_create(
     - success: Boolean indicating if the access point was created
     - message: Human-readable confirmation
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        fm = FileMgmt(cluster)
-        return fm.create_access_point(name=name, path=path)
-    except Exception as e:
-        return {"error": str(e)}
+    fm = _get_client(FileMgmt, cluster_name)
+    return fm.create_access_point(name=name, path=path)
 
 @mcp.tool()
+@_safe_tool
 def powerscale_access_point_delete(name: str, cluster_name: str = None) -> dict:
     """
     Delete a namespace access point from the PowerScale cluster.
@@ -4131,14 +4600,12 @@ def powerscale_access_point_delete(name: str, cluster_name: str = None) -> dict:
     - success: Boolean indicating if the access point was deleted
     - message: Human-readable confirmation
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        fm = FileMgmt(cluster)
-        return fm.delete_access_point(name=name)
-    except Exception as e:
-        return {"error": str(e)}
+    fm = _get_client(FileMgmt, cluster_name)
+    return fm.delete_access_point(name=name)
 
 @mcp.tool()
+@_safe_tool
+@_coalesce
 def powerscale_worm_get(path: str, cluster_name: str = None) -> Dict[str, Any]:
     """
     Get WORM (Write Once Read Many) properties for a file on the
@@ -4167,14 +4634,11 @@ def powerscale_worm_get(path: str, cluster_name: str = None) -> Dict[str, Any]:
     Returns:
     - Full WORM properties dict for the file
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        fm = FileMgmt(cluster)
-        return fm.get_worm_properties(path=path)
-    except Exception as e:
-        return {"error": str(e)}
+    fm = _get_client(FileMgmt, cluster_name)
+    return fm.get_worm_properties(path=path)
 
 @mcp.tool()
+@_safe_tool
 def powerscale_worm_set(
     path: str,
     commit_to_worm: bool = False,
@@ -4211,28 +4675,27 @@ def powerscale_worm_set(
     - success: Boolean indicating if WORM properties were set
     - message: Human-readable confirmation
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        fm = FileMgmt(cluster)
-        return fm.set_worm_properties(
-            path=path, commit_to_worm=commit_to_worm,
-            worm_retention_date=worm_retention_date)
-    except Exception as e:
-        return {"error": str(e)}
+    fm = _get_client(FileMgmt, cluster_name)
+    return fm.set_worm_properties(
+        path=path, commit_to_worm=commit_to_worm,
+        worm_retention_date=worm_retention_date)
 
 @mcp.tool()
+@_safe_tool
 def powerscale_directory_query(
     path: str,
     conditions: str,
     logic: str = 'and',
     result_attrs: Optional[str] = None,
-    limit: int = 1000,
+    limit: _PageLimit = 1000,
     resume: Optional[str] = None,
     sort: Optional[str] = None,
-    dir: Optional[str] = None,
+    dir: Optional[Literal["ASC", "DESC"]] = None,
     type: Optional[str] = None,
     hidden: bool = False,
     max_depth: Optional[int] = None,
+    fetch_all: bool = False,
+    max_items: _PageLimit = 100000,
     cluster_name: str = None,
 ) -> Dict[str, Any]:
     """
@@ -4273,6 +4736,12 @@ def powerscale_directory_query(
     - hidden: If True, include hidden files in results
     - max_depth: Maximum directory depth to search. If omitted, searches
       all depths.
+    - fetch_all: If True, follow resume tokens and return every remaining
+      match in one response (resume will be None; on a failed page, error
+      is set and resume points at it).
+    - max_items: With fetch_all, stop once this many matches have been
+      collected (default 100000) and return the resume token to continue
+      from.
 
     Use this tool to answer questions such as:
     - Find all .log files in this directory tree
@@ -4285,26 +4754,31 @@ def powerscale_directory_query(
     - resume: Pagination token for next page, or None if finished
     - has_more: True if more pages exist
     """
-    try:
-        resume = None if resume in (None, "null", "None") else resume
-
-        conditions_list = json.loads(conditions)
-        result_attrs_list = json.loads(result_attrs) if result_attrs else None
-
-        cluster = _get_cluster(cluster_name)
-        fm = FileMgmt(cluster)
-        return fm.query_directory(
-            path=path, conditions=conditions_list, logic=logic,
-            result_attrs=result_attrs_list, limit=limit, resume=resume,
-            sort=sort, dir=dir, type=type, hidden=hidden,
-            max_depth=max_depth)
-    except Exception as e:
-        return {"error": str(e)}
+    resume = _normalize_resume(resume)
+
+    conditions_list = _json_loads(conditions)
+    result_attrs_list = _json_loads(result_attrs) if result_attrs else None
+
+    fm = _get_client(FileMgmt, cluster_name)
+    fetch = functools.partial(
+        fm.query_directory, path=path, conditions=conditions_list, logic=logic,
+        result_attrs=result_attrs_list, sort=sort, dir=dir, type=type,
+        hidden=hidden, max_depth=max_depth)
+    if not fetch_all:
+        return fetch(limit=limit, resume=resume)
+
+    return _drain_pages(fetch, limit, resume, key="children", max_items=max_items)
 
 # ---------------------------------------------------------------------------
 # Utility tools
 # ---------------------------------------------------------------------------
 
+# IEC units indexed by power of 1024
+_IEC_UNITS = ("B", "KiB", "MiB", "GiB", "TiB", "PiB", "EiB")
+_IEC_MULTIPLIERS = {unit: 1 << (10 * power) for power, unit in enumerate(_IEC_UNITS)}
+_HUMAN_SIZE_RE = re.compile(r"\s*([\d.]+)\s*(B|KiB|MiB|GiB|TiB|PiB|EiB)\s*")
+
+
 @mcp.tool()
 def bytes_to_human(bytes_value: int) -> dict:
     """
@@ -4329,16 +4803,14 @@ def bytes_to_human(bytes_value: int) -> dict:
 
     Example: 84079902720 bytes -> "78.31GiB"
     """
-    units = ["B", "KiB", "MiB", "GiB", "TiB", "PiB", "EiB"]
-    value = float(bytes_value)
-
-    for unit in units:
-        if value < 1024 or unit == units[-1]:
-            return {
-                "bytes": bytes_value,
-                "human_readable": f"{value:.2f}{unit}"
-            }
-        value /= 1024
+    # Every 10 bits of magnitude is one step of 1024; negative values stay in B
+    power = 0
+    if bytes_value >= 1024:
+        power = min((int(bytes_value).bit_length() - 1) // 10, len(_IEC_UNITS) - 1)
+    return {
+        "bytes": bytes_value,
+        "human_readable": f"{bytes_value / (1 << (10 * power)):.2f}{_IEC_UNITS[power]}"
+    }
 
 @mcp.tool()
 def human_to_bytes(human_value: str) -> dict:
@@ -4367,24 +4839,14 @@ def human_to_bytes(human_value: str) -> dict:
 
     Example: "78.31GiB" -> 84079902720 bytes
     """
-    units = {
-        "B": 0,
-        "KiB": 1,
-        "MiB": 2,
-        "GiB": 3,
-        "TiB": 4,
-        "PiB": 5,
-        "EiB": 6,
-    }
-
-    match = re.fullmatch(r"\s*([\d.]+)\s*(B|KiB|MiB|GiB|TiB|PiB|EiB)\s*", human_value)
+    match = _HUMAN_SIZE_RE.fullmatch(human_value)
     if not match:
         raise ValueError(f"Invalid human-readable value: {human_value}")
 
     value = float(match.group(1))
     unit = match.group(2)
 
-    bytes_value = int(value * (1024 ** units[unit]))
+    bytes_value = int(value * _IEC_MULTIPLIERS[unit])
 
     return {
         "human_readable": human_value,
@@ -4414,7 +4876,7 @@ def powerscale_tools_list() -> List[Dict[str, Any]]:
     - mode: "read" (non-destructive) or "write" (modifies cluster state)
     - enabled: true if the tool is currently registered with the MCP server
     """
-    enabled_set = set(mcp._tool_manager._tools.keys())
+    enabled_tools = mcp._tool_manager._tools  # dict — O(1) membership, no copy
     config = _load_tools_config()
     return sorted(
         [
@@ -4422,7 +4884,7 @@ def powerscale_tools_list() -> List[Dict[str, Any]]:
                 "name": name,
                 "group": meta["tool_group"],
                 "mode": meta["tool_mode"],
-                "enabled": name in enabled_set,
+                "enabled": name in enabled_tools,
             }
             for name, meta in config.items()
         ],
@@ -4449,20 +4911,20 @@ def powerscale_tools_list_by_group() -> Dict[str, Any]:
     - total_enabled: Total number of currently enabled tools
     - total_disabled: Total number of currently disabled tools
     """
-    enabled_set = set(mcp._tool_manager._tools.keys())
+    enabled_tools = mcp._tool_manager._tools
     groups: Dict[str, List[Dict[str, Any]]] = {}
     for group_name, tool_names in TOOL_GROUPS.items():
         groups[group_name] = [
             {
                 "name": t,
                 "mode": _TOOL_TO_MODE.get(t, "read"),
-                "enabled": t in enabled_set,
+                "enabled": t in enabled_tools,
             }
             for t in tool_names
         ]
     return {
         "groups": groups,
-        "total_enabled": len(enabled_set),
+        "total_enabled": len(enabled_tools),
         "total_disabled": len(_disabled_tools),
     }
 
@@ -4487,7 +4949,7 @@ def powerscale_tools_list_by_mode() -> Dict[str, Any]:
     - read_count: Total number of read tools
     - write_count: Total number of write tools
     """
-    enabled_set = set(mcp._tool_manager._tools.keys())
+    enabled_tools = mcp._tool_manager._tools
     config = _load_tools_config()
     by_mode: Dict[str, List[Dict[str, Any]]] = {"read": [], "write": []}
     for name, meta in sorted(config.items()):
@@ -4496,7 +4958,7 @@ def powerscale_tools_list_by_mode() -> Dict[str, Any]:
             {
                 "name": name,
                 "group": meta["tool_group"],
-                "enabled": name in enabled_set,
+                "enabled": name in enabled_tools,
             }
         )
     return {
@@ -4642,8 +5104,10 @@ def powerscale_cluster_select(cluster_name: str, reload_vault: bool = False) ->
         vm = VaultManager()
         if reload_vault:
             vm.reload()
+            _invalidate_cluster_cache()
 
         if vm.select_cluster(cluster_name):
+            _invalidate_cluster_cache()
             return {
                 "success": True,
                 "selected": cluster_name,
@@ -4784,6 +5248,7 @@ def powerscale_cluster_add(
 
         vm = VaultManager()
         vm.add_cluster(name, host, port, username, password, effective_verify_ssl, ca_bundle=ca_bundle)
+        _invalidate_cluster_cache()
         response = {
             "success": True,
             "cluster": name,
@@ -4821,6 +5286,7 @@ def powerscale_cluster_remove(name: str) -> Dict[str, Any]:
                          "Use powerscale_cluster_select to switch to a different cluster first.",
             }
         removed = vm.remove_cluster(name)
+        _invalidate_cluster_cache()
         if not removed:
             available = [c["name"] for c in vm.list_clusters()]
             return {
@@ -4889,6 +5355,7 @@ def powerscale_cluster_modify(
             password=password,
             verify_ssl=verify_ssl,
         )
+        _invalidate_cluster_cache()
         if not updated:
             return {"success": False, "error": f"Cluster '{name}' not found in vault."}
         effective_name = new_name if new_name else name
@@ -4937,11 +5404,12 @@ def _apply_startup_config() -> None:
 # ---------------------------------------------------------------------------
 
 @mcp.tool()
+@_safe_tool
 def powerscale_user_get(
     user_name: Optional[str] = None,
     provider_type: Optional[str] = None,
     access_zone: Optional[str] = None,
-    limit: int = 1000,
+    limit: _PageLimit = 1000,
     resume: Optional[str] = None,
     cluster_name: str = None,
 ) -> Dict[str, Any]:
@@ -4971,29 +5439,27 @@ def powerscale_user_get(
     - member_of: Groups this user belongs to
     - sid: Windows Security Identifier
     """
-    try:
-        resume = None if resume in (None, "null", "None") else resume
-        cluster = _get_cluster(cluster_name)
-        users = Users(cluster)
-        page = users.get(
-            user_name=user_name,
-            provider_type=provider_type,
-            access_zone=access_zone,
-            limit=limit,
-            resume=resume,
-        )
-        items = page.get("items") or []
-        tok = page.get("resume")
-        return {
-            "items": items,
-            "resume": tok,
-            "has_more": bool(tok),
-        }
-    except Exception as e:
-        return {"error": str(e)}
+    resume = _normalize_resume(resume)
+    cluster = _get_cluster(cluster_name)
+    users = Users(cluster)
+    page = users.get(
+        user_name=user_name,
+        provider_type=provider_type,
+        access_zone=access_zone,
+        limit=limit,
+        resume=resume,
+    )
+    items = page.get("items") or []
+    tok = page.get("resume")
+    return {
+        "items": items,
+        "resume": tok,
+        "has_more": bool(tok),
+    }
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_user_create(
     user_name: str,
     password: str,
@@ -5040,30 +5506,28 @@ def powerscale_user_create(
     - role_state: 'present-for-user' to assign the role
     - update_password: 'on_create' (set only at creation) or 'always' (update on every run)
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        users = Users(cluster)
-        return users.add(
-            user_name=user_name,
-            password=password,
-            access_zone=access_zone,
-            provider_type=provider_type,
-            primary_group=primary_group,
-            enabled=enabled,
-            email=email,
-            full_name=full_name,
-            home_directory=home_directory,
-            shell=shell,
-            user_id=user_id,
-            role_name=role_name,
-            role_state=role_state,
-            update_password=update_password,
-        )
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    users = Users(cluster)
+    return users.add(
+        user_name=user_name,
+        password=password,
+        access_zone=access_zone,
+        provider_type=provider_type,
+        primary_group=primary_group,
+        enabled=enabled,
+        email=email,
+        full_name=full_name,
+        home_directory=home_directory,
+        shell=shell,
+        user_id=user_id,
+        role_name=role_name,
+        role_state=role_state,
+        update_password=update_password,
+    )
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_user_modify(
     user_name: str,
     access_zone: Optional[str] = None,
@@ -5107,29 +5571,27 @@ def powerscale_user_modify(
     - role_name: Role to assign or remove
     - role_state: 'present-for-user' to assign, 'absent-for-user' to remove
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        users = Users(cluster)
-        return users.modify(
-            user_name=user_name,
-            access_zone=access_zone,
-            provider_type=provider_type,
-            primary_group=primary_group,
-            enabled=enabled,
-            email=email,
-            full_name=full_name,
-            home_directory=home_directory,
-            shell=shell,
-            password=password,
-            update_password=update_password,
-            role_name=role_name,
-            role_state=role_state,
-        )
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    users = Users(cluster)
+    return users.modify(
+        user_name=user_name,
+        access_zone=access_zone,
+        provider_type=provider_type,
+        primary_group=primary_group,
+        enabled=enabled,
+        email=email,
+        full_name=full_name,
+        home_directory=home_directory,
+        shell=shell,
+        password=password,
+        update_password=update_password,
+        role_name=role_name,
+        role_state=role_state,
+    )
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_user_remove(
     user_name: str,
     access_zone: Optional[str] = None,
@@ -5153,16 +5615,13 @@ def powerscale_user_remove(
     - access_zone: Access zone the user lives in (default: System zone)
     - provider_type: Authentication provider — must be 'local' for deletion
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        users = Users(cluster)
-        return users.remove(
-            user_name=user_name,
-            access_zone=access_zone,
-            provider_type=provider_type,
-        )
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    users = Users(cluster)
+    return users.remove(
+        user_name=user_name,
+        access_zone=access_zone,
+        provider_type=provider_type,
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -5170,12 +5629,13 @@ def powerscale_user_remove(
 # ---------------------------------------------------------------------------
 
 @mcp.tool()
+@_safe_tool
 def powerscale_group_get(
     group_name: Optional[str] = None,
     group_id: Optional[int] = None,
     provider_type: Optional[str] = None,
     access_zone: Optional[str] = None,
-    limit: int = 1000,
+    limit: _PageLimit = 1000,
     resume: Optional[str] = None,
     cluster_name: str = None,
 ) -> Dict[str, Any]:
@@ -5203,30 +5663,28 @@ def powerscale_group_get(
     - provider: Authentication provider and zone (e.g. 'lsa-local-provider:System')
     - members: List of member SIDs
     """
-    try:
-        resume = None if resume in (None, "null", "None") else resume
-        cluster = _get_cluster(cluster_name)
-        grp = Group(cluster)
-        page = grp.get(
-            group_name=group_name,
-            group_id=group_id,
-            provider_type=provider_type,
-            access_zone=access_zone,
-            limit=limit,
-            resume=resume,
-        )
-        items = page.get("items") or []
-        tok = page.get("resume")
-        return {
-            "items": items,
-            "resume": tok,
-            "has_more": bool(tok),
-        }
-    except Exception as e:
-        return {"error": str(e)}
+    resume = _normalize_resume(resume)
+    cluster = _get_cluster(cluster_name)
+    grp = Group(cluster)
+    page = grp.get(
+        group_name=group_name,
+        group_id=group_id,
+        provider_type=provider_type,
+        access_zone=access_zone,
+        limit=limit,
+        resume=resume,
+    )
+    items = page.get("items") or []
+    tok = page.get("resume")
+    return {
+        "items": items,
+        "resume": tok,
+        "has_more": bool(tok),
+    }
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_group_create(
     group_name: str,
     group_id: Optional[int] = None,
@@ -5266,22 +5724,20 @@ def powerscale_group_create(
     - Create a group with an explicit GID for NFS compatibility
     - Create a group and immediately populate it with members
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        grp = Group(cluster)
-        return grp.add(
-            group_name=group_name,
-            group_id=group_id,
-            access_zone=access_zone,
-            provider_type=provider_type,
-            users=users,
-            user_state=user_state,
-        )
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    grp = Group(cluster)
+    return grp.add(
+        group_name=group_name,
+        group_id=group_id,
+        access_zone=access_zone,
+        provider_type=provider_type,
+        users=users,
+        user_state=user_state,
+    )
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_group_modify(
     group_name: Optional[str] = None,
     group_id: Optional[int] = None,
@@ -5322,22 +5778,20 @@ def powerscale_group_modify(
     - Remove one or more users from a group
     - Manage group membership by UID instead of username
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        grp = Group(cluster)
-        return grp.modify(
-            group_name=group_name,
-            group_id=group_id,
-            access_zone=access_zone,
-            provider_type=provider_type,
-            users=users,
-            user_state=user_state,
-        )
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    grp = Group(cluster)
+    return grp.modify(
+        group_name=group_name,
+        group_id=group_id,
+        access_zone=access_zone,
+        provider_type=provider_type,
+        users=users,
+        user_state=user_state,
+    )
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_group_remove(
     group_name: Optional[str] = None,
     group_id: Optional[int] = None,
@@ -5368,17 +5822,14 @@ def powerscale_group_remove(
     - Remove a group that is no longer needed
     - Clean up groups before decommissioning an access zone
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        grp = Group(cluster)
-        return grp.remove(
-            group_name=group_name,
-            group_id=group_id,
-            access_zone=access_zone,
-            provider_type=provider_type,
-        )
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    grp = Group(cluster)
+    return grp.remove(
+        group_name=group_name,
+        group_id=group_id,
+        access_zone=access_zone,
+        provider_type=provider_type,
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -5386,8 +5837,9 @@ def powerscale_group_remove(
 # ---------------------------------------------------------------------------
 
 @mcp.tool()
+@_safe_tool
 def powerscale_event_get(
-    limit: int = 100,
+    limit: _PageLimit = 100,
     resume: Optional[str] = None,
     begin: Optional[int] = None,
     end: Optional[int] = None,
@@ -5458,39 +5910,37 @@ def powerscale_event_get(
     - Find high-frequency recurring events
     - Page through a large event history
     """
-    resume = None if resume in (None, "null", "None") else resume
-    try:
-        cluster = _get_cluster(cluster_name)
-        events = Events(cluster)
-        page = events.get(
-            limit=limit,
-            resume=resume,
-            begin=begin,
-            end=end,
-            severity=severity,
-            resolved=resolved,
-            ignore=ignore,
-            sort=sort,
-            dir=dir,
-            cause=cause,
-            event_count=event_count,
-        )
-        items = page.get("items") or []
-        next_resume = page.get("resume")
-        result = {
-            "items": items,
-            "resume": next_resume,
-            "limit": limit,
-            "has_more": bool(next_resume),
-        }
-        if "error" in page:
-            result["error"] = page["error"]
-        return result
-    except Exception as e:
-        return {"error": str(e)}
+    resume = _normalize_resume(resume)
+    cluster = _get_cluster(cluster_name)
+    events = Events(cluster)
+    page = events.get(
+        limit=limit,
+        resume=resume,
+        begin=begin,
+        end=end,
+        severity=severity,
+        resolved=resolved,
+        ignore=ignore,
+        sort=sort,
+        dir=dir,
+        cause=cause,
+        event_count=event_count,
+    )
+    items = page.get("items") or []
+    next_resume = page.get("resume")
+    result = {
+        "items": items,
+        "resume": next_resume,
+        "limit": limit,
+        "has_more": bool(next_resume),
+    }
+    if "error" in page:
+        result["error"] = page["error"]
+    return result
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_event_get_by_id(event_id: str, cluster_name: str = None) -> Dict[str, Any]:
     """
     Retrieve a single event group occurrence by its ID.
@@ -5508,12 +5958,9 @@ def powerscale_event_get_by_id(event_id: str, cluster_name: str = None) -> Dict[
     - Get the complete cause description and resolution information for an alert
     - Check whether a specific event has been resolved
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        events = Events(cluster)
-        return events.get_by_id(event_id)
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    events = Events(cluster)
+    return events.get_by_id(event_id)
 
 
 # ---------------------------------------------------------------------------
@@ -5522,6 +5969,7 @@ def powerscale_event_get_by_id(event_id: str, cluster_name: str = None) -> Dict[
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_stats_cpu(cluster_name: str = None) -> Dict[str, Any]:
     """
     Return a single instantaneous cluster CPU utilization sample.
@@ -5550,15 +5998,13 @@ def powerscale_stats_cpu(cluster_name: str = None) -> Dict[str, Any]:
     - Is the cluster under CPU pressure?
     - What percentage of CPU is idle?
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        stats = Statistics(cluster)
-        return stats.get_cpu()
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    stats = Statistics(cluster)
+    return stats.get_cpu()
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_stats_network(cluster_name: str = None) -> Dict[str, Any]:
     """
     Return a single instantaneous cluster external network traffic sample.
@@ -5589,15 +6035,13 @@ def powerscale_stats_network(cluster_name: str = None) -> Dict[str, Any]:
     - What is the inbound or outbound bandwidth utilization?
     - Is there a network bottleneck?
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        stats = Statistics(cluster)
-        return stats.get_network()
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    stats = Statistics(cluster)
+    return stats.get_network()
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_stats_disk(cluster_name: str = None) -> Dict[str, Any]:
     """
     Return a single instantaneous cluster disk I/O sample.
@@ -5627,15 +6071,13 @@ def powerscale_stats_disk(cluster_name: str = None) -> Dict[str, Any]:
     - Is there a disk I/O bottleneck?
     - What is the disk read vs write rate?
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        stats = Statistics(cluster)
-        return stats.get_disk()
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    stats = Statistics(cluster)
+    return stats.get_disk()
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_stats_ifs(cluster_name: str = None) -> Dict[str, Any]:
     """
     Return a single instantaneous OneFS filesystem I/O sample.
@@ -5664,15 +6106,13 @@ def powerscale_stats_ifs(cluster_name: str = None) -> Dict[str, Any]:
     - What is the filesystem read vs write rate?
     - How much data is the filesystem serving per second?
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        stats = Statistics(cluster)
-        return stats.get_ifs()
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    stats = Statistics(cluster)
+    return stats.get_ifs()
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_stats_node(cluster_name: str = None) -> Dict[str, Any]:
     """
     Return a single instantaneous per-node performance sample.
@@ -5712,15 +6152,13 @@ def powerscale_stats_node(cluster_name: str = None) -> Dict[str, Any]:
     - Is there CPU throttling on any node?
     - Are there hot spots in the cluster?
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        stats = Statistics(cluster)
-        return stats.get_node_performance()
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    stats = Statistics(cluster)
+    return stats.get_node_performance()
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_stats_protocol(cluster_name: str = None) -> Dict[str, Any]:
     """
     Return a single instantaneous per-protocol operation rate sample.
@@ -5751,15 +6189,13 @@ def powerscale_stats_protocol(cluster_name: str = None) -> Dict[str, Any]:
     - What is the HTTP or S3 operation rate?
     - Which protocols are active on the cluster?
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        stats = Statistics(cluster)
-        return stats.get_protocol()
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    stats = Statistics(cluster)
+    return stats.get_protocol()
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_stats_clients(cluster_name: str = None) -> Dict[str, Any]:
     """
     Return a single instantaneous client connection count sample.
@@ -5797,15 +6233,13 @@ def powerscale_stats_clients(cluster_name: str = None) -> Dict[str, Any]:
     - How many clients are actively doing I/O vs just mounted?
     - What is the client load on the cluster?
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        stats = Statistics(cluster)
-        return stats.get_clients()
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    stats = Statistics(cluster)
+    return stats.get_clients()
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_stats_get(
     keys: List[str],
     show_nodes: bool = False,
@@ -5839,17 +6273,15 @@ def powerscale_stats_get(
     - Investigate a specific performance metric by key name
     - Build custom performance dashboards or reports
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        stats = Statistics(cluster)
-        return stats.get_current(keys, show_nodes=show_nodes)
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    stats = Statistics(cluster)
+    return stats.get_current(keys, show_nodes=show_nodes)
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_stats_keys(
-    limit: int = 100,
+    limit: _PageLimit = 100,
     resume: Optional[str] = None,
     queryable: bool = False,
     cluster_name: str = None,
@@ -5880,16 +6312,14 @@ def powerscale_stats_keys(
     - Is there a stat key for [specific metric]?
     - What units does [stat key] use?
     """
-    resume = None if resume in (None, "null", "None") else resume
-    try:
-        cluster = _get_cluster(cluster_name)
-        stats = Statistics(cluster)
-        return stats.get_keys(limit=limit, resume=resume, queryable=queryable)
-    except Exception as e:
-        return {"error": str(e)}
+    resume = _normalize_resume(resume)
+    cluster = _get_cluster(cluster_name)
+    stats = Statistics(cluster)
+    return stats.get_keys(limit=limit, resume=resume, queryable=queryable)
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_network_groupnets_get(cluster_name: str = None) -> Any:
     """
     List all network groupnets on the PowerScale cluster.
@@ -5912,15 +6342,13 @@ def powerscale_network_groupnets_get(cluster_name: str = None) -> Any:
     - What DNS servers and search domains are configured per groupnet
     - The top-level groupnet names needed to filter subnets and pools
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        network = Network(cluster)
-        return network.get_groupnets()
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    network = Network(cluster)
+    return network.get_groupnets()
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_network_subnets_get(
     groupnet: Optional[str] = None,
     cluster_name: str = None,
@@ -5956,15 +6384,13 @@ def powerscale_network_subnets_get(
     - SmartConnect DNS zone names and service IPs per subnet
     - VLAN configuration
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        network = Network(cluster)
-        return network.get_subnets(groupnet=groupnet)
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    network = Network(cluster)
+    return network.get_subnets(groupnet=groupnet)
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_network_pools_get(
     groupnet: Optional[str] = None,
     subnet: Optional[str] = None,
@@ -6006,15 +6432,13 @@ def powerscale_network_pools_get(
     - How SmartConnect load-balances client connections per pool
     - IP ranges served by each access zone
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        network = Network(cluster)
-        return network.get_pools(groupnet=groupnet, subnet=subnet, access_zone=access_zone)
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    network = Network(cluster)
+    return network.get_pools(groupnet=groupnet, subnet=subnet, access_zone=access_zone)
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_network_interfaces_get(
     lnn: Optional[int] = None,
     cluster_name: str = None,
@@ -6053,15 +6477,13 @@ def powerscale_network_interfaces_get(
     - Which pools own which interfaces
     - Network interface link state and speed
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        network = Network(cluster)
-        return network.get_interfaces(lnn=lnn)
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    network = Network(cluster)
+    return network.get_interfaces(lnn=lnn)
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_network_external_get(cluster_name: str = None) -> Dict[str, Any]:
     """
     Get global external network settings for the PowerScale cluster.
@@ -6089,15 +6511,13 @@ def powerscale_network_external_get(cluster_name: str = None) -> Dict[str, Any]:
     - Source-based routing configuration
     - Available TCP ports for client connections
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        network = Network(cluster)
-        return network.get_external()
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    network = Network(cluster)
+    return network.get_external()
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_network_dns_get(cluster_name: str = None) -> Dict[str, Any]:
     """
     Get DNS cache configuration and TTL settings for the PowerScale cluster.
@@ -6125,15 +6545,13 @@ def powerscale_network_dns_get(cluster_name: str = None) -> Dict[str, Any]:
     - DNS query timeout configuration
     - Cache size limits
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        network = Network(cluster)
-        return network.get_dns_cache()
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    network = Network(cluster)
+    return network.get_dns_cache()
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_zones_get(cluster_name: str = None) -> Any:
     """
     List all access zones on the PowerScale cluster.
@@ -6164,15 +6582,13 @@ def powerscale_zones_get(cluster_name: str = None) -> Any:
     Use powerscale_network_map for a comprehensive view that joins zones
     with their groupnet, subnets, pools, and SMB shares in one response.
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        network = Network(cluster)
-        return network.get_zones()
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    network = Network(cluster)
+    return network.get_zones()
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_network_map(cluster_name: str = None) -> Dict[str, Any]:
     """
     Return a comprehensive network topology map of the PowerScale cluster.
@@ -6238,12 +6654,9 @@ def powerscale_network_map(cluster_name: str = None) -> Dict[str, Any]:
     Note: If a subsection fails to retrieve, it will contain an "error" key
     rather than causing the entire map to fail.
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        network = Network(cluster)
-        return network.get_network_map()
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    network = Network(cluster)
+    return network.get_network_map()
 
 
 # ---------------------------------------------------------------------------
@@ -6251,6 +6664,7 @@ def powerscale_network_map(cluster_name: str = None) -> Dict[str, Any]:
 # ---------------------------------------------------------------------------
 
 @mcp.tool()
+@_safe_tool
 def powerscale_cluster_nodes_get(cluster_name: str = None) -> dict:
     """
     List all nodes in the PowerScale cluster with status, state, and version info.
@@ -6266,15 +6680,13 @@ def powerscale_cluster_nodes_get(cluster_name: str = None) -> dict:
     Use powerscale_cluster_node_get_by_id for full hardware, drive, sensor,
     and partition details on a specific node.
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        nodes = ClusterNodes(cluster)
-        return nodes.get()
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    nodes = ClusterNodes(cluster)
+    return nodes.get()
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_cluster_node_get_by_id(node_id: int, cluster_name: str = None) -> dict:
     """
     Get detailed information for a specific cluster node by its Logical Node Number.
@@ -6293,12 +6705,9 @@ def powerscale_cluster_node_get_by_id(node_id: int, cluster_name: str = None) ->
     - node_id: Logical Node Number (LNN) of the node (use powerscale_cluster_nodes_get
                to list nodes and find their LNNs)
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        nodes = ClusterNodes(cluster)
-        return nodes.get_by_id(node_id)
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    nodes = ClusterNodes(cluster)
+    return nodes.get_by_id(node_id)
 
 
 # ---------------------------------------------------------------------------
@@ -6306,6 +6715,7 @@ def powerscale_cluster_node_get_by_id(node_id: int, cluster_name: str = None) ->
 # ---------------------------------------------------------------------------
 
 @mcp.tool()
+@_safe_tool
 def powerscale_storagepool_nodetypes_get(cluster_name: str = None) -> dict:
     """
     List all storage pool node types configured on the cluster.
@@ -6321,15 +6731,13 @@ def powerscale_storagepool_nodetypes_get(cluster_name: str = None) -> dict:
     Node types determine which nodes can be placed in the same storage pool
     and govern the available protection policies.
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        nodetypes = StoragepoolNodetypes(cluster)
-        return nodetypes.get()
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    nodetypes = StoragepoolNodetypes(cluster)
+    return nodetypes.get()
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_storagepool_nodetype_get_by_id(nodetype_id: int, cluster_name: str = None) -> dict:
     """
     Get details for a specific storage pool node type by ID.
@@ -6338,12 +6746,9 @@ def powerscale_storagepool_nodetype_get_by_id(nodetype_id: int, cluster_name: st
     - nodetype_id: The integer node type ID (use powerscale_storagepool_nodetypes_get
                    to list node types and find their IDs)
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        nodetypes = StoragepoolNodetypes(cluster)
-        return nodetypes.get_by_id(nodetype_id)
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    nodetypes = StoragepoolNodetypes(cluster)
+    return nodetypes.get_by_id(nodetype_id)
 
 
 # ---------------------------------------------------------------------------
@@ -6351,6 +6756,7 @@ def powerscale_storagepool_nodetype_get_by_id(nodetype_id: int, cluster_name: st
 # ---------------------------------------------------------------------------
 
 @mcp.tool()
+@_safe_tool
 def powerscale_license_get(resume: Optional[str] = None, cluster_name: str = None) -> dict:
     """
     List all installed PowerScale feature licenses with their status and expiry info.
@@ -6371,16 +6777,14 @@ def powerscale_license_get(resume: Optional[str] = None, cluster_name: str = Non
     Arguments:
     - resume: Pagination token from a previous call (optional)
     """
-    resume = None if resume in (None, "null", "None") else resume
-    try:
-        cluster = _get_cluster(cluster_name)
-        lic = License(cluster)
-        return lic.get(resume=resume)
-    except Exception as e:
-        return {"error": str(e)}
+    resume = _normalize_resume(resume)
+    cluster = _get_cluster(cluster_name)
+    lic = License(cluster)
+    return lic.get(resume=resume)
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_license_get_by_name(name: str, cluster_name: str = None) -> dict:
     """
     Get license details for a specific PowerScale feature by name.
@@ -6400,12 +6804,9 @@ def powerscale_license_get_by_name(name: str, cluster_name: str = None) -> dict:
     Arguments:
     - name: The license feature name (case-sensitive)
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        lic = License(cluster)
-        return lic.get_by_name(name)
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    lic = License(cluster)
+    return lic.get_by_name(name)
 
 
 # ---------------------------------------------------------------------------
@@ -6413,6 +6814,7 @@ def powerscale_license_get_by_name(name: str, cluster_name: str = None) -> dict:
 # ---------------------------------------------------------------------------
 
 @mcp.tool()
+@_safe_tool
 def powerscale_zones_summary_get(groupnet: Optional[str] = None, cluster_name: str = None) -> dict:
     """
     Retrieve a lightweight summary of all access zones on the cluster.
@@ -6430,15 +6832,13 @@ def powerscale_zones_summary_get(groupnet: Optional[str] = None, cluster_name: s
     Arguments:
     - groupnet: Optional — filter summary to zones in this groupnet (e.g. "groupnet0")
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        zs = ZonesSummary(cluster)
-        return zs.get(groupnet=groupnet)
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    zs = ZonesSummary(cluster)
+    return zs.get(groupnet=groupnet)
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_zones_summary_zone_get(zone_id: int, cluster_name: str = None) -> dict:
     """
     Retrieve non-privileged summary information for a specific access zone by ID.
@@ -6451,12 +6851,9 @@ def powerscale_zones_summary_zone_get(zone_id: int, cluster_name: str = None) ->
     - zone_id: The integer zone ID (use powerscale_zones_summary_get to list
                zones; for full zone details with auth providers use powerscale_zones_get)
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        zs = ZonesSummary(cluster)
-        return zs.get_zone(zone_id)
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    zs = ZonesSummary(cluster)
+    return zs.get_zone(zone_id)
 
 
 # ---------------------------------------------------------------------------
@@ -6464,6 +6861,7 @@ def powerscale_zones_summary_zone_get(zone_id: int, cluster_name: str = None) ->
 # ---------------------------------------------------------------------------
 
 @mcp.tool()
+@_safe_tool
 def powerscale_hardware_fcports_get(cluster_name: str = None) -> dict:
     """
     List all Fibre Channel ports on the PowerScale cluster.
@@ -6474,15 +6872,13 @@ def powerscale_hardware_fcports_get(cluster_name: str = None) -> dict:
     Returns:
     - items: List of FC port objects
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        hw = Hardware(cluster)
-        return hw.get_fcports()
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    hw = Hardware(cluster)
+    return hw.get_fcports()
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_hardware_fcport_get(port_id: str, cluster_name: str = None) -> dict:
     """
     Get details for a specific Fibre Channel port.
@@ -6492,15 +6888,13 @@ def powerscale_hardware_fcport_get(port_id: str, cluster_name: str = None) -> di
     Arguments:
     - port_id: The FC port identifier (e.g. '1:0')
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        hw = Hardware(cluster)
-        return hw.get_fcport(port_id)
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    hw = Hardware(cluster)
+    return hw.get_fcport(port_id)
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_hardware_tapes_get(cluster_name: str = None) -> dict:
     """
     List all tape and changer devices on the PowerScale cluster.
@@ -6512,12 +6906,9 @@ def powerscale_hardware_tapes_get(cluster_name: str = None) -> dict:
     - items: List of tape/changer device objects
     - resume: Pagination token (if more results available)
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        hw = Hardware(cluster)
-        return hw.get_tapes()
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    hw = Hardware(cluster)
+    return hw.get_tapes()
 
 
 # ---------------------------------------------------------------------------
@@ -6525,6 +6916,7 @@ def powerscale_hardware_tapes_get(cluster_name: str = None) -> dict:
 # ---------------------------------------------------------------------------
 
 @mcp.tool()
+@_safe_tool
 def powerscale_job_list(cluster_name: str = None) -> dict:
     """
     List all running and paused jobs on the PowerScale cluster.
@@ -6537,15 +6929,13 @@ def powerscale_job_list(cluster_name: str = None) -> dict:
     - items: List of job objects
     - total: Total number of active jobs
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        j = Jobs(cluster)
-        return j.list_jobs()
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    j = Jobs(cluster)
+    return j.list_jobs()
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_job_get(job_id: int, cluster_name: str = None) -> dict:
     """
     Get details for a specific running or paused job.
@@ -6553,16 +6943,14 @@ def powerscale_job_get(job_id: int, cluster_name: str = None) -> dict:
     Arguments:
     - job_id: The job instance ID
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        j = Jobs(cluster)
-        return j.get_job(job_id)
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    j = Jobs(cluster)
+    return j.get_job(job_id)
 
 
 @mcp.tool()
-def powerscale_job_recent_get(limit: int = 50, cluster_name: str = None) -> dict:
+@_safe_tool
+def powerscale_job_recent_get(limit: _PageLimit = 50, cluster_name: str = None) -> dict:
     """
     List recently completed jobs on the PowerScale cluster.
 
@@ -6576,15 +6964,13 @@ def powerscale_job_recent_get(limit: int = 50, cluster_name: str = None) -> dict
     - items: List of recently completed job objects
     - total: Total count
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        j = Jobs(cluster)
-        return j.get_recent(limit=limit)
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    j = Jobs(cluster)
+    return j.get_recent(limit=limit)
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_job_summary_get(cluster_name: str = None) -> dict:
     """
     Get the Job Engine status summary.
@@ -6592,15 +6978,13 @@ def powerscale_job_summary_get(cluster_name: str = None) -> dict:
     Returns high-level engine state including whether the job engine is
     running, paused, or disabled, and aggregate counts of active jobs.
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        j = Jobs(cluster)
-        return j.get_summary()
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    j = Jobs(cluster)
+    return j.get_summary()
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_job_types_get(cluster_name: str = None) -> dict:
     """
     List all available job types on the PowerScale cluster.
@@ -6612,15 +6996,13 @@ def powerscale_job_types_get(cluster_name: str = None) -> dict:
     Returns:
     - items: List of job type objects
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        j = Jobs(cluster)
-        return j.get_types()
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    j = Jobs(cluster)
+    return j.get_types()
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_job_type_get(job_type_id: str, cluster_name: str = None) -> dict:
     """
     Get details for a specific job type.
@@ -6629,18 +7011,16 @@ def powerscale_job_type_get(job_type_id: str, cluster_name: str = None) -> dict:
     - job_type_id: The job type name (e.g. 'TreeDelete', 'SmartPools',
                    'Collect', 'MultiScan', 'ShadowStoreProtect', 'FlexProtect')
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        j = Jobs(cluster)
-        return j.get_type(job_type_id)
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    j = Jobs(cluster)
+    return j.get_type(job_type_id)
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_job_events_get(
     resume: Optional[str] = None,
-    limit: int = 100,
+    limit: _PageLimit = 100,
     job_id: Optional[int] = None,
     job_type: Optional[str] = None,
     cluster_name: str = None,
@@ -6656,19 +7036,17 @@ def powerscale_job_events_get(
     - job_id: Filter events by job instance ID
     - job_type: Filter events by job type name
     """
-    resume = None if resume in (None, "null", "None") else resume
-    try:
-        cluster = _get_cluster(cluster_name)
-        j = Jobs(cluster)
-        return j.get_events(resume=resume, limit=limit, job_id=job_id, job_type=job_type)
-    except Exception as e:
-        return {"error": str(e)}
+    resume = _normalize_resume(resume)
+    cluster = _get_cluster(cluster_name)
+    j = Jobs(cluster)
+    return j.get_events(resume=resume, limit=limit, job_id=job_id, job_type=job_type)
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_job_reports_get(
     resume: Optional[str] = None,
-    limit: int = 100,
+    limit: _PageLimit = 100,
     job_id: Optional[int] = None,
     job_type: Optional[str] = None,
     cluster_name: str = None,
@@ -6684,31 +7062,27 @@ def powerscale_job_reports_get(
     - job_id: Filter reports by job instance ID
     - job_type: Filter reports by job type name
     """
-    resume = None if resume in (None, "null", "None") else resume
-    try:
-        cluster = _get_cluster(cluster_name)
-        j = Jobs(cluster)
-        return j.get_reports(resume=resume, limit=limit, job_id=job_id, job_type=job_type)
-    except Exception as e:
-        return {"error": str(e)}
+    resume = _normalize_resume(resume)
+    cluster = _get_cluster(cluster_name)
+    j = Jobs(cluster)
+    return j.get_reports(resume=resume, limit=limit, job_id=job_id, job_type=job_type)
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_job_statistics_get(cluster_name: str = None) -> dict:
     """
     Get Job Engine statistics.
 
     Returns aggregate statistics about job execution, throughput, and resource usage.
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        j = Jobs(cluster)
-        return j.get_statistics()
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    j = Jobs(cluster)
+    return j.get_statistics()
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_job_policies_get(cluster_name: str = None) -> dict:
     """
     List all job impact policies.
@@ -6719,15 +7093,13 @@ def powerscale_job_policies_get(cluster_name: str = None) -> dict:
     Returns:
     - items: List of impact policy objects
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        j = Jobs(cluster)
-        return j.get_policies()
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    j = Jobs(cluster)
+    return j.get_policies()
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_job_policy_get(policy_id: str, cluster_name: str = None) -> dict:
     """
     Get details for a specific job impact policy.
@@ -6735,15 +7107,13 @@ def powerscale_job_policy_get(policy_id: str, cluster_name: str = None) -> dict:
     Arguments:
     - policy_id: The impact policy name (e.g. 'LOW', 'MEDIUM', 'HIGH', 'OFF_HOURS')
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        j = Jobs(cluster)
-        return j.get_policy(policy_id)
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    j = Jobs(cluster)
+    return j.get_policy(policy_id)
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_job_settings_get(cluster_name: str = None) -> dict:
     """
     Get Job Engine generic settings.
@@ -6751,12 +7121,9 @@ def powerscale_job_settings_get(cluster_name: str = None) -> dict:
     Returns engine-level configuration like default priority, scheduling parameters,
     and global enable/disable state.
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        j = Jobs(cluster)
-        return j.get_settings()
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    j = Jobs(cluster)
+    return j.get_settings()
 
 
 # ---------------------------------------------------------------------------
@@ -6764,6 +7131,7 @@ def powerscale_job_settings_get(cluster_name: str = None) -> dict:
 # ---------------------------------------------------------------------------
 
 @mcp.tool()
+@_safe_tool
 def powerscale_performance_datasets_get(cluster_name: str = None) -> dict:
     """
     List all performance datasets on the PowerScale cluster.
@@ -6774,15 +7142,13 @@ def powerscale_performance_datasets_get(cluster_name: str = None) -> dict:
     - items: List of dataset objects
     - total: Total number of datasets
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        p = Performance(cluster)
-        return p.list_datasets()
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    p = Performance(cluster)
+    return p.list_datasets()
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_performance_dataset_get(dataset_id: int, cluster_name: str = None) -> dict:
     """
     Get details for a specific performance dataset.
@@ -6790,15 +7156,13 @@ def powerscale_performance_dataset_get(dataset_id: int, cluster_name: str = None
     Arguments:
     - dataset_id: The dataset ID
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        p = Performance(cluster)
-        return p.get_dataset(dataset_id)
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    p = Performance(cluster)
+    return p.get_dataset(dataset_id)
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_performance_metrics_get(cluster_name: str = None) -> dict:
     """
     List all available performance metrics on the cluster.
@@ -6809,15 +7173,13 @@ def powerscale_performance_metrics_get(cluster_name: str = None) -> dict:
     Returns:
     - items: List of metric objects with name, description, units, and type
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        p = Performance(cluster)
-        return p.get_metrics()
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    p = Performance(cluster)
+    return p.get_metrics()
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_performance_metric_get(metric_id: str, cluster_name: str = None) -> dict:
     """
     Get details for a specific performance metric.
@@ -6825,30 +7187,26 @@ def powerscale_performance_metric_get(metric_id: str, cluster_name: str = None)
     Arguments:
     - metric_id: The metric name/ID
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        p = Performance(cluster)
-        return p.get_metric(metric_id)
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    p = Performance(cluster)
+    return p.get_metric(metric_id)
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_performance_settings_get(cluster_name: str = None) -> dict:
     """
     Get performance monitoring settings.
 
     Returns configuration for the performance monitoring subsystem.
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        p = Performance(cluster)
-        return p.get_settings()
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    p = Performance(cluster)
+    return p.get_settings()
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_performance_dataset_filters_get(dataset_id: int, cluster_name: str = None) -> dict:
     """
     List all filters for a specific performance dataset.
@@ -6858,15 +7216,13 @@ def powerscale_performance_dataset_filters_get(dataset_id: int, cluster_name: st
     Arguments:
     - dataset_id: The dataset ID
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        p = Performance(cluster)
-        return p.list_dataset_filters(dataset_id)
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    p = Performance(cluster)
+    return p.list_dataset_filters(dataset_id)
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_performance_dataset_filter_get(dataset_id: int, filter_id: int, cluster_name: str = None) -> dict:
     """
     Get a specific filter for a performance dataset.
@@ -6875,15 +7231,13 @@ def powerscale_performance_dataset_filter_get(dataset_id: int, filter_id: int, c
     - dataset_id: The dataset ID
     - filter_id: The filter ID
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        p = Performance(cluster)
-        return p.get_dataset_filter(dataset_id, filter_id)
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    p = Performance(cluster)
+    return p.get_dataset_filter(dataset_id, filter_id)
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_performance_dataset_workloads_get(dataset_id: int, cluster_name: str = None) -> dict:
     """
     List all workloads for a specific performance dataset.
@@ -6893,15 +7247,13 @@ def powerscale_performance_dataset_workloads_get(dataset_id: int, cluster_name:
     Arguments:
     - dataset_id: The dataset ID
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        p = Performance(cluster)
-        return p.list_dataset_workloads(dataset_id)
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    p = Performance(cluster)
+    return p.list_dataset_workloads(dataset_id)
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_performance_dataset_workload_get(dataset_id: int, workload_id: int, cluster_name: str = None) -> dict:
     """
     Get a specific workload for a performance dataset.
@@ -6910,12 +7262,9 @@ def powerscale_performance_dataset_workload_get(dataset_id: int, workload_id: in
     - dataset_id: The dataset ID
     - workload_id: The workload ID
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        p = Performance(cluster)
-        return p.get_dataset_workload(dataset_id, workload_id)
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    p = Performance(cluster)
+    return p.get_dataset_workload(dataset_id, workload_id)
 
 
 # ---------------------------------------------------------------------------
@@ -6923,6 +7272,7 @@ def powerscale_performance_dataset_workload_get(dataset_id: int, workload_id: in
 # ---------------------------------------------------------------------------
 
 @mcp.tool()
+@_safe_tool
 def powerscale_hardening_profiles_get(cluster_name: str = None) -> dict:
     """
     List available security hardening profiles on the PowerScale cluster.
@@ -6933,15 +7283,13 @@ def powerscale_hardening_profiles_get(cluster_name: str = None) -> dict:
     Returns:
     - items: List of hardening profile objects
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        h = Hardening(cluster)
-        return h.get_profiles()
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    h = Hardening(cluster)
+    return h.get_profiles()
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_hardening_state_get(cluster_name: str = None) -> dict:
     """
     Get the current state of the hardening service.
@@ -6949,15 +7297,13 @@ def powerscale_hardening_state_get(cluster_name: str = None) -> dict:
     Returns whether the hardening service is 'Running' or 'Available' and
     which profiles are active.
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        h = Hardening(cluster)
-        return h.get_state()
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    h = Hardening(cluster)
+    return h.get_state()
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_hardening_reports_get(cluster_name: str = None) -> dict:
     """
     List compliance reports for all hardening rules.
@@ -6968,12 +7314,9 @@ def powerscale_hardening_reports_get(cluster_name: str = None) -> dict:
     Returns:
     - items: List of hardening report objects
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        h = Hardening(cluster)
-        return h.get_reports()
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    h = Hardening(cluster)
+    return h.get_reports()
 
 
 # ---------------------------------------------------------------------------
@@ -6981,6 +7324,7 @@ def powerscale_hardening_reports_get(cluster_name: str = None) -> dict:
 # ---------------------------------------------------------------------------
 
 @mcp.tool()
+@_safe_tool
 def powerscale_supportassist_settings_get(cluster_name: str = None) -> dict:
     """
     Get SupportAssist configuration settings.
@@ -6988,15 +7332,13 @@ def powerscale_supportassist_settings_get(cluster_name: str = None) -> dict:
     Returns connection settings, proxy configuration, auto-case creation status,
     and gateway settings for Dell SupportAssist integration.
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        sa = SupportAssist(cluster)
-        return sa.get_settings()
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    sa = SupportAssist(cluster)
+    return sa.get_settings()
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_supportassist_status_get(cluster_name: str = None) -> dict:
     """
     Get SupportAssist current status.
@@ -7004,43 +7346,37 @@ def powerscale_supportassist_status_get(cluster_name: str = None) -> dict:
     Returns connectivity status, last contact time, and overall health
     of the SupportAssist service.
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        sa = SupportAssist(cluster)
-        return sa.get_status()
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    sa = SupportAssist(cluster)
+    return sa.get_status()
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_supportassist_license_get(cluster_name: str = None) -> dict:
     """
     Get SupportAssist license activation status.
 
     Returns whether SupportAssist is activated and license entitlement details.
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        sa = SupportAssist(cluster)
-        return sa.get_license()
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    sa = SupportAssist(cluster)
+    return sa.get_license()
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_supportassist_terms_get(cluster_name: str = None) -> dict:
     """
     Get SupportAssist Terms & Conditions text and acceptance status.
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        sa = SupportAssist(cluster)
-        return sa.get_terms()
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    sa = SupportAssist(cluster)
+    return sa.get_terms()
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_supportassist_tasks_get(cluster_name: str = None) -> dict:
     """
     List all SupportAssist tasks.
@@ -7051,15 +7387,13 @@ def powerscale_supportassist_tasks_get(cluster_name: str = None) -> dict:
     Returns:
     - items: List of task objects
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        sa = SupportAssist(cluster)
-        return sa.list_tasks()
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    sa = SupportAssist(cluster)
+    return sa.list_tasks()
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_supportassist_task_get(task_id: str, cluster_name: str = None) -> dict:
     """
     Get a specific SupportAssist task by ID.
@@ -7067,12 +7401,9 @@ def powerscale_supportassist_task_get(task_id: str, cluster_name: str = None) ->
     Arguments:
     - task_id: The task identifier
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        sa = SupportAssist(cluster)
-        return sa.get_task(task_id)
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    sa = SupportAssist(cluster)
+    return sa.get_task(task_id)
 
 
 # ---------------------------------------------------------------------------
@@ -7080,6 +7411,7 @@ def powerscale_supportassist_task_get(task_id: str, cluster_name: str = None) ->
 # ---------------------------------------------------------------------------
 
 @mcp.tool()
+@_safe_tool
 def powerscale_connectivity_settings_get(cluster_name: str = None) -> dict:
     """
     Get connectivity diagnostic configuration settings.
@@ -7087,58 +7419,50 @@ def powerscale_connectivity_settings_get(cluster_name: str = None) -> dict:
     Returns configuration for Dell connectivity services including proxy
     settings, gateway info, and service enablement status.
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        conn = Connectivity(cluster)
-        return conn.get_settings()
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    conn = Connectivity(cluster)
+    return conn.get_settings()
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_connectivity_status_get(cluster_name: str = None) -> dict:
     """
     Get connectivity diagnostic current status.
 
     Returns current connectivity health, last check time, and any issues.
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        conn = Connectivity(cluster)
-        return conn.get_status()
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    conn = Connectivity(cluster)
+    return conn.get_status()
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_connectivity_license_get(cluster_name: str = None) -> dict:
     """
     Get connectivity service license activation status.
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        conn = Connectivity(cluster)
-        return conn.get_license()
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    conn = Connectivity(cluster)
+    return conn.get_license()
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_connectivity_terms_get(cluster_name: str = None) -> dict:
     """
     Get telemetry notice text for Dell Technologies connectivity services.
 
     Returns the terms and acceptance status for telemetry data collection.
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        conn = Connectivity(cluster)
-        return conn.get_terms()
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    conn = Connectivity(cluster)
+    return conn.get_terms()
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_connectivity_tasks_get(cluster_name: str = None) -> dict:
     """
     List all connectivity diagnostic tasks.
@@ -7146,15 +7470,13 @@ def powerscale_connectivity_tasks_get(cluster_name: str = None) -> dict:
     Returns:
     - items: List of connectivity task objects
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        conn = Connectivity(cluster)
-        return conn.list_tasks()
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    conn = Connectivity(cluster)
+    return conn.list_tasks()
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_connectivity_task_get(task_id: str, cluster_name: str = None) -> dict:
     """
     Get a specific connectivity diagnostic task by ID.
@@ -7162,12 +7484,9 @@ def powerscale_connectivity_task_get(task_id: str, cluster_name: str = None) ->
     Arguments:
     - task_id: The task identifier
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        conn = Connectivity(cluster)
-        return conn.get_task(task_id)
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    conn = Connectivity(cluster)
+    return conn.get_task(task_id)
 
 
 # ---------------------------------------------------------------------------
@@ -7175,6 +7494,7 @@ def powerscale_connectivity_task_get(task_id: str, cluster_name: str = None) ->
 # ---------------------------------------------------------------------------
 
 @mcp.tool()
+@_safe_tool
 def powerscale_debug_stats_get(cluster_name: str = None) -> dict:
     """
     Get cumulative Platform API call statistics per resource.
@@ -7182,12 +7502,9 @@ def powerscale_debug_stats_get(cluster_name: str = None) -> dict:
     Returns call counts for each API resource endpoint, useful for
     understanding API usage patterns and diagnosing performance bottlenecks.
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        ds = DebugStats(cluster)
-        return ds.get()
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    ds = DebugStats(cluster)
+    return ds.get()
 
 
 # ---------------------------------------------------------------------------
@@ -7195,6 +7512,7 @@ def powerscale_debug_stats_get(cluster_name: str = None) -> dict:
 # ---------------------------------------------------------------------------
 
 @mcp.tool()
+@_safe_tool
 def powerscale_fsa_results_get(cluster_name: str = None) -> dict:
     """
     List all available FSA (File System Analytics) result sets.
@@ -7205,15 +7523,13 @@ def powerscale_fsa_results_get(cluster_name: str = None) -> dict:
     Returns:
     - items: List of FSA result set objects (with ID, timestamp, status, path)
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        fsa = FSA(cluster)
-        return fsa.get_results()
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    fsa = FSA(cluster)
+    return fsa.get_results()
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_fsa_result_get(result_id: int, cluster_name: str = None) -> dict:
     """
     Get details for a specific FSA result set.
@@ -7221,30 +7537,26 @@ def powerscale_fsa_result_get(result_id: int, cluster_name: str = None) -> dict:
     Arguments:
     - result_id: The FSA result set ID
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        fsa = FSA(cluster)
-        return fsa.get_result(result_id)
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    fsa = FSA(cluster)
+    return fsa.get_result(result_id)
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_fsa_index_get(cluster_name: str = None) -> dict:
     """
     Get available FSA index table names.
 
     Returns the list of index tables that can be queried for FSA data.
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        fsa = FSA(cluster)
-        return fsa.get_index()
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    fsa = FSA(cluster)
+    return fsa.get_index()
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_fsa_settings_get(scope: Optional[str] = None, cluster_name: str = None) -> dict:
     """
     Get FSA configuration settings.
@@ -7252,15 +7564,13 @@ def powerscale_fsa_settings_get(scope: Optional[str] = None, cluster_name: str =
     Arguments:
     - scope: Optional scope filter for settings
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        fsa = FSA(cluster)
-        return fsa.get_settings(scope=scope)
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    fsa = FSA(cluster)
+    return fsa.get_settings(scope=scope)
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_fsa_top_dirs_get(result_id: int, cluster_name: str = None) -> dict:
     """
     Get top directories from an FSA result set.
@@ -7271,15 +7581,13 @@ def powerscale_fsa_top_dirs_get(result_id: int, cluster_name: str = None) -> dic
     Arguments:
     - result_id: The FSA result set ID
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        fsa = FSA(cluster)
-        return fsa.get_top_dirs(result_id)
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    fsa = FSA(cluster)
+    return fsa.get_top_dirs(result_id)
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_fsa_top_dir_get(result_id: int, top_dir_id: int, cluster_name: str = None) -> dict:
     """
     Get a specific top directory entry from an FSA result set.
@@ -7288,15 +7596,13 @@ def powerscale_fsa_top_dir_get(result_id: int, top_dir_id: int, cluster_name: st
     - result_id: The FSA result set ID
     - top_dir_id: The top directory entry ID
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        fsa = FSA(cluster)
-        return fsa.get_top_dir(result_id, top_dir_id)
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    fsa = FSA(cluster)
+    return fsa.get_top_dir(result_id, top_dir_id)
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_fsa_top_files_get(result_id: int, cluster_name: str = None) -> dict:
     """
     Get top files from an FSA result set.
@@ -7307,15 +7613,13 @@ def powerscale_fsa_top_files_get(result_id: int, cluster_name: str = None) -> di
     Arguments:
     - result_id: The FSA result set ID
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        fsa = FSA(cluster)
-        return fsa.get_top_files(result_id)
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    fsa = FSA(cluster)
+    return fsa.get_top_files(result_id)
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_fsa_top_file_get(result_id: int, top_file_id: int, cluster_name: str = None) -> dict:
     """
     Get a specific top file entry from an FSA result set.
@@ -7324,15 +7628,13 @@ def powerscale_fsa_top_file_get(result_id: int, top_file_id: int, cluster_name:
     - result_id: The FSA result set ID
     - top_file_id: The top file entry ID
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        fsa = FSA(cluster)
-        return fsa.get_top_file(result_id, top_file_id)
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    fsa = FSA(cluster)
+    return fsa.get_top_file(result_id, top_file_id)
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_fsa_histogram_get(result_id: int, cluster_name: str = None) -> dict:
     """
     Get histogram of file counts for an FSA result set.
@@ -7342,15 +7644,13 @@ def powerscale_fsa_histogram_get(result_id: int, cluster_name: str = None) -> di
     Arguments:
     - result_id: The FSA result set ID
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        fsa = FSA(cluster)
-        return fsa.get_histogram(result_id)
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    fsa = FSA(cluster)
+    return fsa.get_histogram(result_id)
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_fsa_histogram_stat_get(result_id: int, stat: str, cluster_name: str = None) -> dict:
     """
     Get histogram filtered by a specific statistic.
@@ -7359,15 +7659,13 @@ def powerscale_fsa_histogram_stat_get(result_id: int, stat: str, cluster_name: s
     - result_id: The FSA result set ID
     - stat: The statistic name to filter histogram by
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        fsa = FSA(cluster)
-        return fsa.get_histogram_stat(result_id, stat)
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    fsa = FSA(cluster)
+    return fsa.get_histogram_stat(result_id, stat)
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_fsa_directories_get(result_id: int, cluster_name: str = None) -> dict:
     """
     Get directory information from an FSA result set.
@@ -7377,15 +7675,13 @@ def powerscale_fsa_directories_get(result_id: int, cluster_name: str = None) ->
     Arguments:
     - result_id: The FSA result set ID
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        fsa = FSA(cluster)
-        return fsa.get_directories(result_id)
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    fsa = FSA(cluster)
+    return fsa.get_directories(result_id)
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_fsa_directory_get(result_id: int, directory_id: int, cluster_name: str = None) -> dict:
     """
     Get specific directory information from an FSA result set.
@@ -7394,12 +7690,9 @@ def powerscale_fsa_directory_get(result_id: int, directory_id: int, cluster_name
     - result_id: The FSA result set ID
     - directory_id: The directory entry ID
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        fsa = FSA(cluster)
-        return fsa.get_directory(result_id, directory_id)
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    fsa = FSA(cluster)
+    return fsa.get_directory(result_id, directory_id)
 
 
 # ---------------------------------------------------------------------------
@@ -7407,10 +7700,11 @@ def powerscale_fsa_directory_get(result_id: int, directory_id: int, cluster_name
 # ---------------------------------------------------------------------------
 
 @mcp.tool()
+@_safe_tool
 def powerscale_synciq_report_subreports_get(
     report_id: str,
     resume: Optional[str] = None,
-    limit: int = 100,
+    limit: _PageLimit = 100,
     cluster_name: str = None,
 ) -> dict:
     """
@@ -7424,16 +7718,14 @@ def powerscale_synciq_report_subreports_get(
     - resume: Pagination token from a previous call
     - limit: Maximum number of results (default 100)
     """
-    resume = None if resume in (None, "null", "None") else resume
-    try:
-        cluster = _get_cluster(cluster_name)
-        sr = SyncReports(cluster)
-        return sr.get_subreports(report_id, resume=resume, limit=limit)
-    except Exception as e:
-        return {"error": str(e)}
+    resume = _normalize_resume(resume)
+    cluster = _get_cluster(cluster_name)
+    sr = SyncReports(cluster)
+    return sr.get_subreports(report_id, resume=resume, limit=limit)
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_synciq_report_subreport_get(report_id: str, subreport_id: str, cluster_name: str = None) -> dict:
     """
     Get a specific subreport from a SyncIQ report.
@@ -7442,12 +7734,9 @@ def powerscale_synciq_report_subreport_get(report_id: str, subreport_id: str, cl
     - report_id: The SyncIQ report ID
     - subreport_id: The subreport ID
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        sr = SyncReports(cluster)
-        return sr.get_subreport(report_id, subreport_id)
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    sr = SyncReports(cluster)
+    return sr.get_subreport(report_id, subreport_id)
 
 
 # ---------------------------------------------------------------------------
@@ -7455,10 +7744,11 @@ def powerscale_synciq_report_subreport_get(report_id: str, subreport_id: str, cl
 # ---------------------------------------------------------------------------
 
 @mcp.tool()
+@_safe_tool
 def powerscale_snapshot_changelist_entries_get(
     changelist_id: str,
     resume: Optional[str] = None,
-    limit: int = 100,
+    limit: _PageLimit = 100,
     cluster_name: str = None,
 ) -> dict:
     """
@@ -7472,16 +7762,14 @@ def powerscale_snapshot_changelist_entries_get(
     - resume: Pagination token from a previous call
     - limit: Maximum number of results (default 100)
     """
-    resume = None if resume in (None, "null", "None") else resume
-    try:
-        cluster = _get_cluster(cluster_name)
-        sc = SnapshotChangelists(cluster)
-        return sc.get_entries(changelist_id, resume=resume, limit=limit)
-    except Exception as e:
-        return {"error": str(e)}
+    resume = _normalize_resume(resume)
+    cluster = _get_cluster(cluster_name)
+    sc = SnapshotChangelists(cluster)
+    return sc.get_entries(changelist_id, resume=resume, limit=limit)
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_snapshot_changelist_entry_get(changelist_id: str, entry_id: str, cluster_name: str = None) -> dict:
     """
     Get a specific entry from a snapshot changelist.
@@ -7490,19 +7778,17 @@ def powerscale_snapshot_changelist_entry_get(changelist_id: str, entry_id: str,
     - changelist_id: The changelist identifier
     - entry_id: The entry ID within the changelist
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        sc = SnapshotChangelists(cluster)
-        return sc.get_entry(changelist_id, entry_id)
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    sc = SnapshotChangelists(cluster)
+    return sc.get_entry(changelist_id, entry_id)
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_snapshot_changelist_lins_get(
     changelist_id: str,
     resume: Optional[str] = None,
-    limit: int = 100,
+    limit: _PageLimit = 100,
     cluster_name: str = None,
 ) -> dict:
     """
@@ -7515,16 +7801,14 @@ def powerscale_snapshot_changelist_lins_get(
     - resume: Pagination token from a previous call
     - limit: Maximum number of results (default 100)
     """
-    resume = None if resume in (None, "null", "None") else resume
-    try:
-        cluster = _get_cluster(cluster_name)
-        sc = SnapshotChangelists(cluster)
-        return sc.get_lins(changelist_id, resume=resume, limit=limit)
-    except Exception as e:
-        return {"error": str(e)}
+    resume = _normalize_resume(resume)
+    cluster = _get_cluster(cluster_name)
+    sc = SnapshotChangelists(cluster)
+    return sc.get_lins(changelist_id, resume=resume, limit=limit)
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_snapshot_changelist_lin_get(changelist_id: str, lin_id: str, cluster_name: str = None) -> dict:
     """
     Get a specific LIN entry from a snapshot changelist.
@@ -7533,12 +7817,9 @@ def powerscale_snapshot_changelist_lin_get(changelist_id: str, lin_id: str, clus
     - changelist_id: The changelist identifier
     - lin_id: The LIN (Logical Inode Number)
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        sc = SnapshotChangelists(cluster)
-        return sc.get_lin(changelist_id, lin_id)
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    sc = SnapshotChangelists(cluster)
+    return sc.get_lin(changelist_id, lin_id)
 
 
 # ---------------------------------------------------------------------------
@@ -7546,6 +7827,7 @@ def powerscale_snapshot_changelist_lin_get(changelist_id: str, lin_id: str, clus
 # ---------------------------------------------------------------------------
 
 @mcp.tool()
+@_safe_tool
 def powerscale_quota_report_about_get(report_id: str, cluster_name: str = None) -> dict:
     """
     Get metadata about a specific quota report.
@@ -7555,12 +7837,9 @@ def powerscale_quota_report_about_get(report_id: str, cluster_name: str = None)
     Arguments:
     - report_id: The quota report ID
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        qr = QuotaReports(cluster)
-        return qr.get_report_about(report_id)
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    qr = QuotaReports(cluster)
+    return qr.get_report_about(report_id)
 
 
 # ---------------------------------------------------------------------------
@@ -7568,10 +7847,11 @@ def powerscale_quota_report_about_get(report_id: str, cluster_name: str = None)
 # ---------------------------------------------------------------------------
 
 @mcp.tool()
+@_safe_tool
 def powerscale_id_resolution_users_get(
     zone_id: str,
     resume: Optional[str] = None,
-    limit: int = 100,
+    limit: _PageLimit = 100,
     cluster_name: str = None,
 ) -> dict:
     """
@@ -7584,16 +7864,14 @@ def powerscale_id_resolution_users_get(
     - resume: Pagination token from a previous call
     - limit: Maximum number of results (default 100)
     """
-    resume = None if resume in (None, "null", "None") else resume
-    try:
-        cluster = _get_cluster(cluster_name)
-        idr = IdResolution(cluster)
-        return idr.get_zone_users(zone_id, resume=resume, limit=limit)
-    except Exception as e:
-        return {"error": str(e)}
+    resume = _normalize_resume(resume)
+    cluster = _get_cluster(cluster_name)
+    idr = IdResolution(cluster)
+    return idr.get_zone_users(zone_id, resume=resume, limit=limit)
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_id_resolution_user_get(zone_id: str, user_id: str, cluster_name: str = None) -> dict:
     """
     Resolve a specific UID/SID to a username within an access zone.
@@ -7602,19 +7880,17 @@ def powerscale_id_resolution_user_get(zone_id: str, user_id: str, cluster_name:
     - zone_id: The access zone name or ID
     - user_id: The user UID or SID to resolve
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        idr = IdResolution(cluster)
-        return idr.get_zone_user(zone_id, user_id)
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    idr = IdResolution(cluster)
+    return idr.get_zone_user(zone_id, user_id)
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_id_resolution_groups_get(
     zone_id: str,
     resume: Optional[str] = None,
-    limit: int = 100,
+    limit: _PageLimit = 100,
     cluster_name: str = None,
 ) -> dict:
     """
@@ -7627,16 +7903,14 @@ def powerscale_id_resolution_groups_get(
     - resume: Pagination token from a previous call
     - limit: Maximum number of results (default 100)
     """
-    resume = None if resume in (None, "null", "None") else resume
-    try:
-        cluster = _get_cluster(cluster_name)
-        idr = IdResolution(cluster)
-        return idr.get_zone_groups(zone_id, resume=resume, limit=limit)
-    except Exception as e:
-        return {"error": str(e)}
+    resume = _normalize_resume(resume)
+    cluster = _get_cluster(cluster_name)
+    idr = IdResolution(cluster)
+    return idr.get_zone_groups(zone_id, resume=resume, limit=limit)
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_id_resolution_group_get(zone_id: str, group_id: str, cluster_name: str = None) -> dict:
     """
     Resolve a specific GID/GSID to a groupname within an access zone.
@@ -7645,12 +7919,9 @@ def powerscale_id_resolution_group_get(zone_id: str, group_id: str, cluster_name
     - zone_id: The access zone name or ID
     - group_id: The group GID or GSID to resolve
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        idr = IdResolution(cluster)
-        return idr.get_zone_group(zone_id, group_id)
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    idr = IdResolution(cluster)
+    return idr.get_zone_group(zone_id, group_id)
 
 
 # ---------------------------------------------------------------------------
@@ -7658,6 +7929,7 @@ def powerscale_id_resolution_group_get(zone_id: str, group_id: str, cluster_name
 # ---------------------------------------------------------------------------
 
 @mcp.tool()
+@_safe_tool
 def powerscale_lfn_domains_get(resume: Optional[str] = None, cluster_name: str = None) -> dict:
     """
     List all Long File Name configuration domains.
@@ -7668,16 +7940,14 @@ def powerscale_lfn_domains_get(resume: Optional[str] = None, cluster_name: str =
     Arguments:
     - resume: Pagination token from a previous call
     """
-    resume = None if resume in (None, "null", "None") else resume
-    try:
-        cluster = _get_cluster(cluster_name)
-        l = LFN(cluster)
-        return l.list_domains(resume=resume)
-    except Exception as e:
-        return {"error": str(e)}
+    resume = _normalize_resume(resume)
+    cluster = _get_cluster(cluster_name)
+    l = LFN(cluster)
+    return l.list_domains(resume=resume)
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_lfn_path_get(path: str, cluster_name: str = None) -> dict:
     """
     Get Long File Name configuration for a specific path.
@@ -7685,12 +7955,9 @@ def powerscale_lfn_path_get(path: str, cluster_name: str = None) -> dict:
     Arguments:
     - path: The filesystem path to query (e.g. '/ifs/data')
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        l = LFN(cluster)
-        return l.get_path(path)
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    l = LFN(cluster)
+    return l.get_path(path)
 
 
 # ---------------------------------------------------------------------------
@@ -7698,6 +7965,7 @@ def powerscale_lfn_path_get(path: str, cluster_name: str = None) -> dict:
 # ---------------------------------------------------------------------------
 
 @mcp.tool()
+@_safe_tool
 def powerscale_metadataiq_settings_get(cluster_name: str = None) -> dict:
     """
     Get MetadataIQ configuration settings.
@@ -7705,15 +7973,13 @@ def powerscale_metadataiq_settings_get(cluster_name: str = None) -> dict:
     Returns settings for the MetadataIQ service that indexes filesystem
     metadata for analytical querying.
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        miq = MetadataIQ(cluster)
-        return miq.get_settings()
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    miq = MetadataIQ(cluster)
+    return miq.get_settings()
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_metadataiq_status_get(cluster_name: str = None) -> dict:
     """
     Get MetadataIQ current cycle status.
@@ -7721,25 +7987,20 @@ def powerscale_metadataiq_status_get(cluster_name: str = None) -> dict:
     Returns the state of the current metadata indexing cycle (running,
     idle, completing, etc.) and progress information.
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        miq = MetadataIQ(cluster)
-        return miq.get_status()
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    miq = MetadataIQ(cluster)
+    return miq.get_status()
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_metadataiq_certificate_get(cluster_name: str = None) -> dict:
     """
     Get MetadataIQ CA certificate information.
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        miq = MetadataIQ(cluster)
-        return miq.get_certificate()
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    miq = MetadataIQ(cluster)
+    return miq.get_certificate()
 
 
 # ---------------------------------------------------------------------------
@@ -7747,6 +8008,7 @@ def powerscale_metadataiq_certificate_get(cluster_name: str = None) -> dict:
 # ---------------------------------------------------------------------------
 
 @mcp.tool()
+@_safe_tool
 def powerscale_mpa_approvers_get(cluster_name: str = None) -> dict:
     """
     List all Multi-Party Authorization (MPA) approvers on the cluster.
@@ -7757,15 +8019,13 @@ def powerscale_mpa_approvers_get(cluster_name: str = None) -> dict:
     Returns:
     - items: List of approver objects
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        m = MPA(cluster)
-        return m.get_approvers()
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    m = MPA(cluster)
+    return m.get_approvers()
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_mpa_approver_get(approver_id: str, cluster_name: str = None) -> dict:
     """
     Get details for a specific MPA approver.
@@ -7773,15 +8033,13 @@ def powerscale_mpa_approver_get(approver_id: str, cluster_name: str = None) -> d
     Arguments:
     - approver_id: The approver identifier
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        m = MPA(cluster)
-        return m.get_approver(approver_id)
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    m = MPA(cluster)
+    return m.get_approver(approver_id)
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_mpa_requests_get(cluster_name: str = None) -> dict:
     """
     List all MPA (Multi-Party Authorization) requests.
@@ -7791,15 +8049,13 @@ def powerscale_mpa_requests_get(cluster_name: str = None) -> dict:
     Returns:
     - items: List of MPA request objects
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        m = MPA(cluster)
-        return m.list_requests()
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    m = MPA(cluster)
+    return m.list_requests()
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_mpa_request_get(request_id: str, cluster_name: str = None) -> dict:
     """
     Get details for a specific MPA request.
@@ -7807,15 +8063,13 @@ def powerscale_mpa_request_get(request_id: str, cluster_name: str = None) -> dic
     Arguments:
     - request_id: The MPA request identifier
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        m = MPA(cluster)
-        return m.get_request(request_id)
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    m = MPA(cluster)
+    return m.get_request(request_id)
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_mpa_settings_get(cluster_name: str = None) -> dict:
     """
     Get MPA global configuration settings.
@@ -7823,15 +8077,13 @@ def powerscale_mpa_settings_get(cluster_name: str = None) -> dict:
     Returns whether MPA is enabled, required approval count, and other
     global configuration parameters.
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        m = MPA(cluster)
-        return m.get_global_settings()
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    m = MPA(cluster)
+    return m.get_global_settings()
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_mpa_request_lifecycle_get(cluster_name: str = None) -> dict:
     """
     Get MPA request lifecycle configuration.
@@ -7839,15 +8091,13 @@ def powerscale_mpa_request_lifecycle_get(cluster_name: str = None) -> dict:
     Returns timeout values, expiration policies, and other lifecycle
     parameters for MPA authorization requests.
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        m = MPA(cluster)
-        return m.get_request_lifecycle()
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    m = MPA(cluster)
+    return m.get_request_lifecycle()
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_mpa_privilege_actions_get(cluster_name: str = None) -> dict:
     """
     Get MPA privileged action metadata.
@@ -7855,15 +8105,13 @@ def powerscale_mpa_privilege_actions_get(cluster_name: str = None) -> dict:
     Returns the list of actions that require Multi-Party Authorization
     and their associated metadata.
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        m = MPA(cluster)
-        return m.get_privilege_action_metadata()
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    m = MPA(cluster)
+    return m.get_privilege_action_metadata()
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_mpa_trust_anchors_get(cluster_name: str = None) -> dict:
     """
     List trusted root CAs for MPA.
@@ -7871,12 +8119,9 @@ def powerscale_mpa_trust_anchors_get(cluster_name: str = None) -> dict:
     Returns:
     - items: List of trust anchor (CA certificate) objects
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        m = MPA(cluster)
-        return m.list_trust_anchors()
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    m = MPA(cluster)
+    return m.list_trust_anchors()
 
 
 # ---------------------------------------------------------------------------
@@ -7884,6 +8129,7 @@ def powerscale_mpa_trust_anchors_get(cluster_name: str = None) -> dict:
 # ---------------------------------------------------------------------------
 
 @mcp.tool()
+@_safe_tool
 def powerscale_local_cluster_time_get(cluster_name: str = None) -> dict:
     """
     Get the current time on the local cluster node.
@@ -7891,15 +8137,13 @@ def powerscale_local_cluster_time_get(cluster_name: str = None) -> dict:
     Returns the node's system clock time. Useful for verifying NTP sync
     and time consistency across the cluster.
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        li = LocalInfo(cluster)
-        return li.get_cluster_time()
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    li = LocalInfo(cluster)
+    return li.get_cluster_time()
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_local_network_interfaces_get(cluster_name: str = None) -> dict:
     """
     List network interfaces on the local cluster node.
@@ -7910,30 +8154,26 @@ def powerscale_local_network_interfaces_get(cluster_name: str = None) -> dict:
     Returns:
     - items: List of network interface objects
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        li = LocalInfo(cluster)
-        return li.get_network_interfaces()
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    li = LocalInfo(cluster)
+    return li.get_network_interfaces()
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_firmware_status_get(cluster_name: str = None) -> dict:
     """
     Get firmware status for the cluster.
 
     Returns current firmware versions and upgrade status.
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        li = LocalInfo(cluster)
-        return li.get_firmware_status()
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    li = LocalInfo(cluster)
+    return li.get_firmware_status()
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_firmware_device_get(cluster_name: str = None) -> dict:
     """
     Get firmware device information for the cluster.
@@ -7943,15 +8183,13 @@ def powerscale_firmware_device_get(cluster_name: str = None) -> dict:
     Returns:
     - items: List of node firmware objects
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        li = LocalInfo(cluster)
-        return li.get_firmware_device()
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    li = LocalInfo(cluster)
+    return li.get_firmware_device()
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_node_internal_ip_get(node_lnn: int, cluster_name: str = None) -> dict:
     """
     Get the internal IP address for a specific cluster node.
@@ -7959,15 +8197,13 @@ def powerscale_node_internal_ip_get(node_lnn: int, cluster_name: str = None) ->
     Arguments:
     - node_lnn: Logical Node Number (LNN) of the node
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        li = LocalInfo(cluster)
-        return li.get_node_internal_ip(node_lnn)
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    li = LocalInfo(cluster)
+    return li.get_node_internal_ip(node_lnn)
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_os_security_get(cluster_name: str = None) -> dict:
     """
     Get per-node OS security settings status.
@@ -7975,12 +8211,9 @@ def powerscale_os_security_get(cluster_name: str = None) -> dict:
     Returns OS-level security configuration such as FIPS mode, secure boot
     status, and other security posture information.
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        li = LocalInfo(cluster)
-        return li.get_os_security()
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    li = LocalInfo(cluster)
+    return li.get_os_security()
 
 
 # ---------------------------------------------------------------------------
@@ -7988,6 +8221,7 @@ def powerscale_os_security_get(cluster_name: str = None) -> dict:
 # ---------------------------------------------------------------------------
 
 @mcp.tool()
+@_safe_tool
 def powerscale_api_session_settings_get(cluster_name: str = None) -> dict:
     """
     Get HTTP API session settings.
@@ -7995,15 +8229,13 @@ def powerscale_api_session_settings_get(cluster_name: str = None) -> dict:
     Returns session timeout, maximum sessions, and other session
     configuration parameters for the Platform API.
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        api_s = ApiSessions(cluster)
-        return api_s.get_session_settings()
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    api_s = ApiSessions(cluster)
+    return api_s.get_session_settings()
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_api_session_invalidations_get(cluster_name: str = None) -> dict:
     """
     List all Platform API session invalidations.
@@ -8011,15 +8243,13 @@ def powerscale_api_session_invalidations_get(cluster_name: str = None) -> dict:
     Returns:
     - items: List of session invalidation objects
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        api_s = ApiSessions(cluster)
-        return api_s.list_invalidations()
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    api_s = ApiSessions(cluster)
+    return api_s.list_invalidations()
 
 
 @mcp.tool()
+@_safe_tool
 def powerscale_api_session_invalidation_get(invalidation_id: str, cluster_name: str = None) -> dict:
     """
     Get a specific Platform API session invalidation.
@@ -8027,12 +8257,9 @@ def powerscale_api_session_invalidation_get(invalidation_id: str, cluster_name:
     Arguments:
     - invalidation_id: The invalidation identifier
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        api_s = ApiSessions(cluster)
-        return api_s.get_invalidation(invalidation_id)
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    api_s = ApiSessions(cluster)
+    return api_s.get_invalidation(invalidation_id)
 
 
 # ---------------------------------------------------------------------------
@@ -8040,6 +8267,7 @@ def powerscale_api_session_invalidation_get(invalidation_id: str, cluster_name:
 # ---------------------------------------------------------------------------
 
 @mcp.tool()
+@_safe_tool
 def powerscale_groupnets_summary_get(cluster_name: str = None) -> dict:
     """
     Get groupnet summary information.
@@ -8048,12 +8276,9 @@ def powerscale_groupnets_summary_get(cluster_name: str = None) -> dict:
     names, and subnet details. A lighter-weight alternative to
     powerscale_network_groupnets_get for quick topology overview.
     """
-    try:
-        cluster = _get_cluster(cluster_name)
-        gs = GroupnetsSummary(cluster)
-        return gs.get()
-    except Exception as e:
-        return {"error": str(e)}
+    cluster = _get_cluster(cluster_name)
+    gs = GroupnetsSummary(cluster)
+    return gs.get()
 
 
 _apply_startup_config()
@@ -8112,6 +8337,27 @@ async def _call_tool_with_timeout(key: str, arguments: dict, **kwargs):
 
 mcp._tool_manager.call_tool = _call_tool_with_timeout
 
+# Compile the playbook templates now rather than on each template's first use
+logger.debug("Precompiled %d playbook templates", precompile_templates())
+
+
+def _warm_cluster_connection() -> None:
+    """Build the selected cluster's handle and open its first pooled connection.
+
+    Runs once in the background at startup so the vault lookup, TLS handshake
+    and session auth are paid before the first tool call rather than during it.
+    """
+    try:
+        _get_client(DataMover, None).get_policies(limit=1)
+        logger.info("Warmed cluster connection")
+    except Exception as e:
+        logger.debug("Cluster warmup skipped: %s", e)
+
+
+if os.environ.get("POWERSCALE_MCP_WARMUP", "").lower() in ("1", "true"):
+    threading.Thread(target=_warm_cluster_connection, name="cluster-warmup",
+                     daemon=True).start()
+
 
 app = mcp.http_app()
 app.state.json_response = True
@@ -8127,7 +8373,9 @@ from starlette.routing import Route
 async def _health_handler(request):
     """Lightweight health check — confirms the server is running and tools are loaded."""
     tool_count = len(mcp._tool_manager._tools)
-    return JSONResponse({"status": "ok", "tools_loaded": tool_count})
+    return JSONResponse({"status": "ok", "tools_loaded": tool_count,
+                         "cluster_api": api_limiter_stats(),
+                         "tool_calls": tool_call_stats()})
 
 
 app.routes.insert(0, Route("/health", _health_handler, methods=["GET"]))